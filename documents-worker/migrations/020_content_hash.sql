@@ -0,0 +1,5 @@
+-- Content hash for bulk-ingestion dedup (tools/ingest.py sends it on register-external)
+ALTER TABLE documents ADD COLUMN content_sha256 TEXT;
+
+CREATE INDEX IF NOT EXISTS idx_documents_content_sha256
+  ON documents(content_sha256) WHERE content_sha256 IS NOT NULL;
@@ -0,0 +1,2 @@
+-- register-external-batch looks up already-registered r2 keys so retried batches are idempotent
+CREATE INDEX IF NOT EXISTS idx_documents_r2_key ON documents(r2_key);
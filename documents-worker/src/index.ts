@@ -48,6 +48,11 @@ const MAX_FILE_SIZE = 200 * 1024 * 1024; // 200MB per file
 const MAX_TOTAL_UPLOAD_SIZE = 500 * 1024 * 1024; // 500MB total per upload
 const MAX_FILES_PER_UPLOAD = 500;
 
+// Bulk ingestion: bump when /ingest-parse or /ingest-match would return different results for the
+// same input. The ingest CLI caches results per version and re-requests everything after a bump.
+const INGEST_PARSER_VERSION = '1';
+const INGEST_MATCHER_VERSION = '1';
+
 // Helper to ensure CORS headers
 function corsHeaders(env: Env) {
   return {
@@ -909,6 +914,18 @@ async function authenticateUser(request: Request, env: Env) {
   }
 }
 
+// All R2 object keys under a prefix (follows list() pagination)
+async function listR2Keys(env: Env, prefix: string): Promise<string[]> {
+  const keys: string[] = [];
+  let cursor: string | undefined;
+  do {
+    const listed = await env.UPLOADS_BUCKET.list({ prefix, cursor });
+    keys.push(...listed.objects.map(obj => obj.key));
+    cursor = listed.truncated ? listed.cursor : undefined;
+  } while (cursor);
+  return keys;
+}
+
 // Check if user_notes column exists and add it if not
 async function ensureUserNotesColumn(env: Env) {
   try {
@@ -955,7 +972,10 @@ async function ensureProcessingColumns(env: Env) {
     { name: 'duplicate_of_doc_id', type: 'TEXT' },
     { name: 'duplicate_status', type: 'TEXT' },
     { name: 'duplicate_match_type', type: 'TEXT' },
-    { name: 'duplicate_detected_at', type: 'TEXT' }
+    { name: 'duplicate_detected_at', type: 'TEXT' },
+    { name: 'lease_owner', type: 'TEXT' },       // Processor machine holding the claim
+    { name: 'lease_expires_at', type: 'TEXT' },  // Claim visibility timeout (renewed by heartbeat)
+    { name: 'content_sha256', type: 'TEXT' }     // Hex SHA-256 of the uploaded file (bulk ingestion dedup)
   ];
 
   for (const column of columnsToAdd) {
@@ -2605,19 +2625,43 @@ export default {
       // Ensure processing columns exist
       await ensureProcessingColumns(env);
       await ensureLinkColumns(env.WELLS_DB);
-      
+
+      // Lease-based claiming: processors that send worker_id get a visibility timeout
+      // they renew via /api/processing/lease/:id/heartbeat, and only claim what they
+      // advertise capacity for (limit). Requests without worker_id keep the old behavior.
+      const workerId = url.searchParams.get('worker_id');
+      const leaseSeconds = Math.min(Math.max(parseInt(url.searchParams.get('lease_seconds') || '300') || 300, 30), 3600);
+      const maxDocs = workerId
+        ? Math.min(Math.max(parseInt(url.searchParams.get('limit') || '1') || 1, 1), 10)
+        : 10;
+
       try {
         // Reset documents stuck in 'processing' for more than 10 minutes
         // This handles cases where the processor crashes mid-processing
+        // (leased documents are governed by their lease instead)
         await env.WELLS_DB.prepare(`
           UPDATE documents
           SET status = 'pending'
           WHERE status = 'processing'
             AND processing_attempts < 3
             AND deleted_at IS NULL
+            AND lease_expires_at IS NULL
             AND extraction_started_at < datetime('now', '-6 hours', '-10 minutes')
         `).run();
 
+        // Reclaim documents whose lease expired (processor died or lost connectivity)
+        await env.WELLS_DB.prepare(`
+          UPDATE documents
+          SET status = 'pending',
+              lease_owner = NULL,
+              lease_expires_at = NULL
+          WHERE status = 'processing'
+            AND processing_attempts < 3
+            AND deleted_at IS NULL
+            AND lease_expires_at IS NOT NULL
+            AND lease_expires_at < datetime('now', '-6 hours')
+        `).run();
+
         // Auto-promote orphaned pre-scans (user closed modal / navigated away)
         // If pending_prescan for >10 min with no prescan result, promote to pending
         await env.WELLS_DB.prepare(`
@@ -2643,6 +2687,7 @@ export default {
             WHERE (status = 'pending' OR status = 'pending_prescan')
               AND processing_attempts < 3
               AND deleted_at IS NULL
+              AND (lease_expires_at IS NULL OR lease_expires_at < datetime('now', '-6 hours'))
           )
           ORDER BY user_queue_pos,
             CASE WHEN user_id = 'system_harvester' THEN 1 ELSE 0 END,
@@ -2678,7 +2723,7 @@ export default {
           // System-triggered documents (harvester) bypass credit checks
           if (userId === 'system_harvester' || userPlan === 'system') {
             docsToProcess.push(doc);
-            if (docsToProcess.length >= 10) break;
+            if (docsToProcess.length >= maxDocs) break;
             continue;
           }
 
@@ -2705,8 +2750,8 @@ export default {
             docsNoCredits.push(doc.id as string);
           }
 
-          // Limit to 10 docs that can actually be processed
-          if (docsToProcess.length >= 10) break;
+          // Limit to the docs that can actually be processed (and the caller's capacity)
+          if (docsToProcess.length >= maxDocs) break;
         }
 
         // Mark documents without credits as 'unprocessed'
@@ -2721,36 +2766,60 @@ export default {
           console.log(`[Queue] Marked ${docsNoCredits.length} documents as 'unprocessed' (no credits)`);
         }
 
+        // Claim atomically: the status/lease guard in each UPDATE means a document picked
+        // by two concurrent queue calls is only returned to the one whose UPDATE won
+        const leaseExpiry = `CASE WHEN ?1 IS NULL THEN NULL ELSE datetime('now', '-6 hours', '+' || ?2 || ' seconds') END`;
+        const claimedIds = new Set<string>();
+
         // Mark normal docs as 'processing', prescan docs stay as 'pending_prescan'
         const normalToProcess = docsToProcess.filter(d => !d.prescan_only);
         if (normalToProcess.length > 0) {
           const docIds = normalToProcess.map(doc => doc.id);
-          const placeholders = docIds.map(() => '?').join(',');
-          await env.WELLS_DB.prepare(`
+          const placeholders = docIds.map((_, i) => `?${i + 3}`).join(',');
+          const claimed = await env.WELLS_DB.prepare(`
             UPDATE documents
             SET status = 'processing',
                 extraction_started_at = datetime('now', '-6 hours'),
-                processing_attempts = processing_attempts + 1
+                processing_attempts = processing_attempts + 1,
+                lease_owner = ?1,
+                lease_expires_at = ${leaseExpiry}
             WHERE id IN (${placeholders})
-          `).bind(...docIds).run();
+              AND status = 'pending'
+            RETURNING id
+          `).bind(workerId, leaseSeconds, ...docIds).all();
+          for (const row of claimed.results) claimedIds.add(row.id as string);
         }
 
         // Mark prescan docs - increment attempts to prevent re-fetching
         if (prescanDocs.length > 0) {
-          const prescanIds = prescanDocs.map(doc => doc.id);
-          const placeholders = prescanIds.map(() => '?').join(',');
-          await env.WELLS_DB.prepare(`
-            UPDATE documents
-            SET extraction_started_at = datetime('now', '-6 hours'),
-                processing_attempts = processing_attempts + 1
-            WHERE id IN (${placeholders})
-          `).bind(...prescanIds).run();
+          const prescanIds = docsToProcess.filter(d => d.prescan_only).map(doc => doc.id);
+          const placeholders = prescanIds.map((_, i) => `?${i + 3}`).join(',');
+          if (prescanIds.length > 0) {
+            const claimed = await env.WELLS_DB.prepare(`
+              UPDATE documents
+              SET extraction_started_at = datetime('now', '-6 hours'),
+                  processing_attempts = processing_attempts + 1,
+                  lease_owner = ?1,
+                  lease_expires_at = ${leaseExpiry}
+              WHERE id IN (${placeholders})
+                AND status = 'pending_prescan'
+                AND (lease_expires_at IS NULL OR lease_expires_at < datetime('now', '-6 hours'))
+              RETURNING id
+            `).bind(workerId, leaseSeconds, ...prescanIds).all();
+            for (const row of claimed.results) claimedIds.add(row.id as string);
+          }
+        }
+
+        const claimedDocs = docsToProcess.filter(d => claimedIds.has(d.id as string));
+        if (workerId && claimedDocs.length > 0) {
+          console.log(`[Queue] ${workerId} claimed ${claimedDocs.length}/${maxDocs} (lease ${leaseSeconds}s)`);
         }
 
         return jsonResponse({
-          documents: docsToProcess,
-          count: docsToProcess.length,
-          unprocessed_count: docsNoCredits.length
+          documents: claimedDocs,
+          count: claimedDocs.length,
+          unprocessed_count: docsNoCredits.length,
+          lease_seconds: workerId ? leaseSeconds : null
         }, 200, env);
       } catch (error) {
         console.error('Queue error:', error);
@@ -2758,6 +2827,73 @@ export default {
       }
     }
 
+    // Route: POST /api/processing/lease/:id/heartbeat - Extend a processor's claim on a document
+    if (path.match(/^\/api\/processing\/lease\/[^\/]+\/heartbeat$/) && request.method === 'POST') {
+      const apiKey = request.headers.get('X-API-Key');
+      if (!apiKey || apiKey !== env.PROCESSING_API_KEY) {
+        return errorResponse('Invalid API key', 401, env);
+      }
+
+      const docId = path.split('/')[4];
+      try {
+        const data = await request.json() as any;
+        const leaseSeconds = Math.min(Math.max(parseInt(data.lease_seconds) || 300, 30), 3600);
+        const renewed = await env.WELLS_DB.prepare(`
+          UPDATE documents
+          SET lease_expires_at = datetime('now', '-6 hours', '+' || ? || ' seconds')
+          WHERE id = ?
+            AND lease_owner = ?
+            AND status IN ('processing', 'pending_prescan')
+            AND deleted_at IS NULL
+          RETURNING lease_expires_at
+        `).bind(leaseSeconds, docId, data.worker_id || '').first() as any;
+
+        if (!renewed) {
+          // Expired and reclaimed by another processor, completed, or deleted
+          return errorResponse('Lease lost', 409, env);
+        }
+        return jsonResponse({ success: true, lease_expires_at: renewed.lease_expires_at }, 200, env);
+      } catch (error) {
+        console.error('Lease heartbeat error:', error);
+        return errorResponse('Failed to renew lease', 500, env);
+      }
+    }
+
+    // Route: POST /api/processing/lease/:id/release - Give up a claim (optionally back to the queue)
+    if (path.match(/^\/api\/processing\/lease\/[^\/]+\/release$/) && request.method === 'POST') {
+      const apiKey = request.headers.get('X-API-Key');
+      if (!apiKey || apiKey !== env.PROCESSING_API_KEY) {
+        return errorResponse('Invalid API key', 401, env);
+      }
+
+      const docId = path.split('/')[4];
+      try {
+        const data = await request.json() as any;
+        if (data.requeue) {
+          // Unfinished (e.g. processor draining for shutdown) - doesn't count as an attempt
+          await env.WELLS_DB.prepare(`
+            UPDATE documents
+            SET status = CASE WHEN status = 'processing' THEN 'pending' ELSE status END,
+                processing_attempts = MAX(processing_attempts - 1, 0),
+                lease_owner = NULL,
+                lease_expires_at = NULL
+            WHERE id = ? AND lease_owner = ?
+          `).bind(docId, data.worker_id || '').run();
+        } else {
+          await env.WELLS_DB.prepare(`
+            UPDATE documents
+            SET lease_owner = NULL,
+                lease_expires_at = NULL
+            WHERE id = ? AND lease_owner = ?
+          `).bind(docId, data.worker_id || '').run();
+        }
+        return jsonResponse({ success: true }, 200, env);
+      } catch (error) {
+        console.error('Lease release error:', error);
+        return errorResponse('Failed to release lease', 500, env);
+      }
+    }
+
     // Route: GET /api/processing/download/:id - Get signed URL for document download
     if (path.match(/^\/api\/processing\/download\/[^\/]+$/) && request.method === 'GET') {
       // Verify processing API key
@@ -4220,6 +4356,94 @@ export default {
       }
     }
 
+    // Route: POST /api/processing/checkpoint/:id/:part - Mirror one checkpoint stage or chunk
+    // (resume after restart). Parts are "stage.<name>" or "chunk.<index>", one R2 object each,
+    // so the processor uploads only what changed.
+    if (path.match(/^\/api\/processing\/checkpoint\/[^\/]+\/(stage|chunk)\.[\w\-]+$/) && request.method === 'POST') {
+      const apiKey = request.headers.get('X-API-Key');
+      if (!apiKey || apiKey !== env.PROCESSING_API_KEY) {
+        return errorResponse('Invalid API key', 401, env);
+      }
+
+      const docId = path.split('/')[4];
+      const part = path.split('/')[5];
+      try {
+        const doc = await env.WELLS_DB.prepare(
+          `SELECT r2_key FROM documents WHERE id = ?`
+        ).bind(docId).first() as any;
+        if (!doc) return errorResponse('Document not found', 404, env);
+
+        const data = await request.json();
+        await env.UPLOADS_BUCKET.put(`${doc.r2_key}.checkpoint/${part}.json`, JSON.stringify(data), {
+          httpMetadata: { contentType: 'application/json' }
+        });
+        return jsonResponse({ success: true }, 200, env);
+      } catch (error) {
+        console.error('Checkpoint upload error:', error);
+        return errorResponse('Failed to store checkpoint', 500, env);
+      }
+    }
+
+    // Route: GET /api/processing/checkpoint/:id - Get all mirrored checkpoint parts
+    // as { stages: { name: payload }, chunks: { index: documents } }
+    if (path.match(/^\/api\/processing\/checkpoint\/[^\/]+$/) && request.method === 'GET') {
+      const apiKey = request.headers.get('X-API-Key');
+      if (!apiKey || apiKey !== env.PROCESSING_API_KEY) {
+        return errorResponse('Invalid API key', 401, env);
+      }
+
+      const docId = path.split('/')[4];
+      try {
+        const doc = await env.WELLS_DB.prepare(
+          `SELECT r2_key FROM documents WHERE id = ?`
+        ).bind(docId).first() as any;
+        if (!doc) return errorResponse('Document not found', 404, env);
+
+        const prefix = `${doc.r2_key}.checkpoint/`;
+        const keys = await listR2Keys(env, prefix);
+        if (keys.length === 0) return errorResponse('No checkpoint found', 404, env);
+
+        const checkpoint: { stages: Record<string, any>; chunks: Record<string, any> } = { stages: {}, chunks: {} };
+        for (const key of keys) {
+          const obj = await env.UPLOADS_BUCKET.get(key);
+          if (!obj) continue;
+          const part = key.slice(prefix.length).replace(/\.json$/, '');
+          const [kind, name] = [part.slice(0, part.indexOf('.')), part.slice(part.indexOf('.') + 1)];
+          (kind === 'stage' ? checkpoint.stages : checkpoint.chunks)[name] = await obj.json();
+        }
+        return jsonResponse(checkpoint, 200, env);
+      } catch (error) {
+        console.error('Checkpoint get error:', error);
+        return errorResponse('Failed to get checkpoint', 500, env);
+      }
+    }
+
+    // Route: DELETE /api/processing/checkpoint/:id - Delete all mirrored checkpoint parts
+    if (path.match(/^\/api\/processing\/checkpoint\/[^\/]+$/) && request.method === 'DELETE') {
+      const apiKey = request.headers.get('X-API-Key');
+      if (!apiKey || apiKey !== env.PROCESSING_API_KEY) {
+        return errorResponse('Invalid API key', 401, env);
+      }
+
+      const docId = path.split('/')[4];
+      try {
+        const doc = await env.WELLS_DB.prepare(
+          `SELECT r2_key FROM documents WHERE id = ?`
+        ).bind(docId).first() as any;
+        if (!doc) return errorResponse('Document not found', 404, env);
+
+        const keys = await listR2Keys(env, `${doc.r2_key}.checkpoint/`);
+        for (let i = 0; i < keys.length; i += 1000) {
+          await env.UPLOADS_BUCKET.delete(keys.slice(i, i + 1000));
+        }
+        console.log(`[Checkpoint] Deleted ${keys.length} part(s) for ${docId}`);
+        return jsonResponse({ success: true }, 200, env);
+      } catch (error) {
+        console.error('Checkpoint delete error:', error);
+        return errorResponse('Failed to delete checkpoint', 500, env);
+      }
+    }
+
     // Route: POST /api/processing/split/:id - Create child documents for multi-document PDF
     if (path.match(/^\/api\/processing\/split\/[^\/]+$/) && request.method === 'POST') {
       // Verify processing API key
@@ -4594,6 +4818,48 @@ export default {
       }
     }
 
+    // Route: POST /api/processing/users/queue-status - Queue status for several users in one call
+    // Body: { user_ids: string[] } (max 100, D1 bind limit)
+    if (path === '/api/processing/users/queue-status' && request.method === 'POST') {
+      // Verify processing API key
+      const apiKey = request.headers.get('X-API-Key');
+      if (!apiKey || apiKey !== env.PROCESSING_API_KEY) {
+        return errorResponse('Invalid API key', 401, env);
+      }
+
+      try {
+        const body = await request.json() as { user_ids?: string[] };
+        const userIds = [...new Set((body.user_ids || []).filter(id => typeof id === 'string'))].slice(0, 100);
+
+        const statuses: Record<string, { queued: number; processing: number }> = {};
+        for (const userId of userIds) {
+          statuses[userId] = { queued: 0, processing: 0 };
+        }
+
+        if (userIds.length > 0) {
+          const placeholders = userIds.map(() => '?').join(',');
+          const rows = await env.WELLS_DB.prepare(`
+            SELECT user_id, status, COUNT(*) as count
+            FROM documents
+            WHERE user_id IN (${placeholders})
+              AND status IN ('pending', 'processing')
+              AND deleted_at IS NULL
+            GROUP BY user_id, status
+          `).bind(...userIds).all();
+
+          for (const row of (rows.results || []) as any[]) {
+            const key = row.status === 'pending' ? 'queued' : 'processing';
+            statuses[row.user_id][key] = row.count || 0;
+          }
+        }
+
+        return jsonResponse({ statuses }, 200, env);
+      } catch (error) {
+        console.error('Batch queue status error:', error);
+        return errorResponse('Failed to get queue status', 500, env);
+      }
+    }
+
     // Route: GET /api/processing/user/:id/queue-status - Get user's queue status
     if (path.match(/^\/api\/processing\/user\/[^\/]+\/queue-status$/) && request.method === 'GET') {
       // Verify processing API key
@@ -5141,9 +5407,11 @@ export default {
           sourceApi?: string;
           originalUrl?: string;
           metadata?: Record<string, any>;
+          contentSha256?: string;
         };
 
         const { r2Key, userId, organizationId, filename, fileSize, contentType, sourceType, sourceApi, originalUrl, metadata } = body;
+        const contentSha256 = /^[0-9a-f]{64}$/i.test(body.contentSha256 || '') ? body.contentSha256!.toLowerCase() : null;
 
         // Validate required fields
         if (!r2Key) {
@@ -5190,8 +5458,8 @@ export default {
         await env.WELLS_DB.prepare(`
           INSERT INTO documents (
             id, r2_key, filename, original_filename, user_id, organization_id,
-            file_size, status, upload_date, queued_at, user_plan, content_type, source_metadata
-          ) VALUES (?, ?, ?, ?, ?, ?, ?, 'pending', datetime('now', '-6 hours'), datetime('now', '-6 hours'), ?, ?, ?)
+            file_size, status, upload_date, queued_at, user_plan, content_type, source_metadata, content_sha256
+          ) VALUES (?, ?, ?, ?, ?, ?, ?, 'pending', datetime('now', '-6 hours'), datetime('now', '-6 hours'), ?, ?, ?, ?)
         `).bind(
           docId,
           r2Key,
@@ -5202,7 +5470,8 @@ export default {
           fileSize || r2Object.size,
           userPlan,
           contentType || 'application/pdf',
-          sourceMetadata
+          sourceMetadata,
+          contentSha256
         ).run();
 
         console.log(`[External Register] Document ${docId} registered successfully. Will be processed by queue.`);
@@ -5242,19 +5511,181 @@ export default {
       }
     }
 
+    // Route: POST /api/documents/register-external-batch - Register up to 50 documents already in R2
+    // Used by the bulk ingest CLI. Same per-document semantics as /register-external, but one plan
+    // lookup, concurrent R2 HEADs and a single D1 batch per call. Results are per item (same order as
+    // items[]); an r2Key that is already registered returns its existing document, so a retried batch
+    // never creates duplicates.
+    if (path === '/api/documents/register-external-batch' && request.method === 'POST') {
+      const apiKey = request.headers.get('X-API-Key');
+      if (!apiKey || apiKey !== env.PROCESSING_API_KEY) {
+        return errorResponse('Invalid API key', 401, env);
+      }
+
+      await ensureProcessingColumns(env);
+
+      try {
+        const body = await request.json() as {
+          userId: string;
+          organizationId?: string;
+          items: Array<{
+            r2Key: string;
+            filename: string;
+            fileSize?: number;
+            contentType?: string;
+            sourceType?: string;
+            metadata?: Record<string, any>;
+            contentSha256?: string;
+          }>;
+        };
+
+        const { userId, organizationId, items } = body;
+        if (!userId || !items?.length) {
+          return errorResponse('userId and items[] required', 400, env);
+        }
+        if (items.length > 50) {
+          return errorResponse('At most 50 items per batch', 400, env);
+        }
+
+        const results: Array<{
+          index: number;
+          success: boolean;
+          existing?: boolean;
+          document?: { id: string; r2Key: string; filename: string; size: number; status: string };
+          error?: string;
+        }> = new Array(items.length);
+
+        // Already registered (retried batch) -> report the existing document
+        const keys = items.map(item => item.r2Key).filter(Boolean);
+        const existing = new Map<string, any>();
+        if (keys.length) {
+          const rows = await env.WELLS_DB.prepare(`
+            SELECT id, r2_key, filename, file_size, status FROM documents
+            WHERE r2_key IN (${keys.map(() => '?').join(', ')}) AND user_id = ?
+          `).bind(...keys, userId).all();
+          for (const row of rows.results || []) {
+            existing.set(row.r2_key as string, row);
+          }
+        }
+
+        let userPlan = 'Free';
+        const creditBalance = await env.WELLS_DB.prepare(`
+          SELECT current_plan FROM user_credit_balance WHERE user_id = ?
+        `).bind(userId).first();
+        if (creditBalance && creditBalance.current_plan) {
+          userPlan = creditBalance.current_plan as string;
+        }
+
+        const heads = await Promise.all(items.map(item =>
+          item.r2Key && !existing.has(item.r2Key) ? env.UPLOADS_BUCKET.head(item.r2Key) : Promise.resolve(null)
+        ));
+
+        const pending: Array<{ index: number; docId: string; statements: D1PreparedStatement[] }> = [];
+        items.forEach((item, index) => {
+          if (!item.r2Key || !item.filename) {
+            results[index] = { index, success: false, error: 'r2Key and filename are required' };
+            return;
+          }
+          const row = existing.get(item.r2Key);
+          if (row) {
+            results[index] = {
+              index, success: true, existing: true,
+              document: { id: row.id, r2Key: item.r2Key, filename: row.filename, size: row.file_size, status: row.status },
+            };
+            return;
+          }
+          const r2Object = heads[index];
+          if (!r2Object) {
+            results[index] = { index, success: false, error: 'File not found in R2 storage' };
+            return;
+          }
+
+          const docId = 'doc_' + Date.now().toString(36) + Math.random().toString(36).substr(2, 5);
+          const metadata = item.metadata || {};
+          const sourceMetadata = JSON.stringify({
+            type: item.sourceType || 'external',
+            api: null,
+            url: null,
+            uploadedAt: new Date().toISOString(),
+            ...metadata
+          });
+          const contentSha256 = /^[0-9a-f]{64}$/i.test(item.contentSha256 || '') ? item.contentSha256!.toLowerCase() : null;
+          const size = item.fileSize || r2Object.size;
+
+          const statements = [env.WELLS_DB.prepare(`
+            INSERT INTO documents (
+              id, r2_key, filename, original_filename, user_id, organization_id,
+              file_size, status, upload_date, queued_at, user_plan, content_type, source_metadata, content_sha256
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, 'pending', datetime('now', '-6 hours'), datetime('now', '-6 hours'), ?, ?, ?, ?)
+          `).bind(
+            docId, item.r2Key, item.filename, item.filename, userId, organizationId || null,
+            size, userPlan, item.contentType || 'application/pdf', sourceMetadata, contentSha256
+          )];
+
+          // Pre-link to property/well (bulk ingestion)
+          if (metadata.property_id || metadata.well_id) {
+            const setClauses: string[] = [];
+            const setParams: any[] = [];
+            if (metadata.property_id) { setClauses.push('property_id = ?'); setParams.push(metadata.property_id); }
+            if (metadata.well_id) { setClauses.push('well_id = ?'); setParams.push(metadata.well_id); }
+            statements.push(env.WELLS_DB.prepare(
+              `UPDATE documents SET ${setClauses.join(', ')} WHERE id = ?`
+            ).bind(...setParams, docId));
+          }
+
+          pending.push({ index, docId, statements });
+          results[index] = {
+            index, success: true,
+            document: { id: docId, r2Key: item.r2Key, filename: item.filename, size, status: 'pending' },
+          };
+        });
+
+        if (pending.length) {
+          try {
+            await env.WELLS_DB.batch(pending.flatMap(p => p.statements));
+          } catch (batchErr) {
+            // D1 batches are atomic - retry item by item so one bad row doesn't fail the rest
+            console.error('[External Register Batch] Batch insert failed, retrying per item:', batchErr);
+            for (const p of pending) {
+              try {
+                await env.WELLS_DB.batch(p.statements);
+              } catch (itemErr) {
+                console.error(`[External Register Batch] ${items[p.index].filename} failed:`, itemErr);
+                results[p.index] = { index: p.index, success: false, error: 'Registration failed' };
+              }
+            }
+          }
+        }
+
+        const registered = results.filter(r => r.success && !r.existing).length;
+        console.log(`[External Register Batch] User ${userId}: ${registered} registered, ` +
+          `${existing.size} already registered, ${results.filter(r => !r.success).length} failed (plan: ${userPlan})`);
+
+        return jsonResponse({ success: true, results }, 200, env);
+
+      } catch (error) {
+        console.error('[External Register Batch] Error:', error);
+        return errorResponse('Batch registration failed', 500, env);
+      }
+    }
+
     // Route: POST /api/documents/ingest-dedup - Batch dedup check for bulk ingestion
-    // Returns which files already exist (by original_filename + file_size) for a user/org
+    // Returns which files already exist for a user/org: by content_sha256 when the caller sends
+    // hashes, by original_filename + file_size for files without one and for documents
+    // registered before hashes were recorded
     if (path === '/api/documents/ingest-dedup' && request.method === 'POST') {
       const apiKey = request.headers.get('X-API-Key');
       if (!apiKey || apiKey !== env.PROCESSING_API_KEY) {
         return errorResponse('Invalid API key', 401, env);
       }
 
+      await ensureProcessingColumns(env);
+
       try {
         const body = await request.json() as {
           userId: string;
           organizationId?: string;
-          files: Array<{ filename: string; fileSize: number }>;
+          files: Array<{ filename: string; fileSize: number; sha256?: string | null }>;
         };
 
         const { userId, organizationId, files } = body;
@@ -5262,33 +5693,56 @@ export default {
           return errorResponse('userId and files[] required', 400, env);
         }
 
-        const duplicates: Array<{ filename: string; fileSize: number; existingDocId: string }> = [];
+        const duplicates: Array<{
+          filename: string;
+          fileSize: number;
+          sha256?: string;
+          matchType: 'hash' | 'name_size';
+          existingDocId: string;
+        }> = [];
 
-        // Batch by 25 files per query (50 bind params + 2 owner params = 52, under D1's 100 limit)
+        // Batch by 25 files per query (up to 25 hashes + 50 name/size params + 2 owner params = 77,
+        // under D1's 100 limit)
         const BATCH = 25;
         for (let i = 0; i < files.length; i += BATCH) {
           const batch = files.slice(i, i + BATCH);
-
-          // Build (original_filename = ? AND file_size = ?) OR ... clauses
-          const clauses = batch.map(() => '(original_filename = ? AND file_size = ?)').join(' OR ');
-          const params: any[] = [];
-          for (const f of batch) {
-            params.push(f.filename, f.fileSize);
+          const hashed = batch.filter(f => f.sha256).map(f => ({ ...f, sha256: f.sha256!.toLowerCase() }));
+          const unhashed = batch.filter(f => !f.sha256);
+          const nameSize = (items: typeof batch) => items.map(() => '(original_filename = ? AND file_size = ?)').join(' OR ');
+
+          const conditions: string[] = [];
+          const params: any[] = [userId, organizationId || userId];
+          if (hashed.length) {
+            conditions.push(`content_sha256 IN (${hashed.map(() => '?').join(', ')})`);
+            params.push(...hashed.map(f => f.sha256));
+            // Same name + size only counts against documents with no recorded hash
+            conditions.push(`(content_sha256 IS NULL AND (${nameSize(hashed)}))`);
+            for (const f of hashed) {
+              params.push(f.filename, f.fileSize);
+            }
+          }
+          if (unhashed.length) {
+            conditions.push(`(${nameSize(unhashed)})`);
+            for (const f of unhashed) {
+              params.push(f.filename, f.fileSize);
+            }
           }
 
           const sql = `
-            SELECT id, original_filename, file_size FROM documents
+            SELECT id, original_filename, file_size, content_sha256 FROM documents
             WHERE (user_id = ? OR organization_id = ?)
               AND deleted_at IS NULL
-              AND (${clauses})
+              AND (${conditions.join(' OR ')})
           `;
-          params.unshift(userId, organizationId || userId);
 
+          const hashes = new Set(hashed.map(f => f.sha256));
           const results = await env.WELLS_DB.prepare(sql).bind(...params).all();
           for (const row of results.results || []) {
+            const rowHash = row.content_sha256 as string | null;
             duplicates.push({
               filename: row.original_filename as string,
               fileSize: row.file_size as number,
+              ...(rowHash && hashes.has(rowHash) ? { sha256: rowHash, matchType: 'hash' as const } : { matchType: 'name_size' as const }),
               existingDocId: row.id as string,
             });
           }
@@ -5301,6 +5755,15 @@ export default {
       }
     }
 
+    // Route: GET /api/documents/ingest-versions - Parser/matcher versions the ingest CLI keys its cache on
+    if (path === '/api/documents/ingest-versions' && request.method === 'GET') {
+      const apiKey = request.headers.get('X-API-Key');
+      if (!apiKey || apiKey !== env.PROCESSING_API_KEY) {
+        return errorResponse('Invalid API key', 401, env);
+      }
+      return jsonResponse({ parser: INGEST_PARSER_VERSION, matcher: INGEST_MATCHER_VERSION }, 200, env);
+    }
+
     // Route: POST /api/documents/ingest-match - Match TRS/API/well names to properties and wells
     // Used by bulk ingestion CLI for pre-linking documents before upload
     if (path === '/api/documents/ingest-match' && request.method === 'POST') {
@@ -5465,7 +5928,7 @@ export default {
           }
         }
 
-        return jsonResponse({ matches }, 200, env);
+        return jsonResponse({ matches, version: INGEST_MATCHER_VERSION }, 200, env);
       } catch (error) {
         console.error('[Ingest Match] Error:', error);
         return errorResponse('Matching failed', 500, env);
@@ -5641,7 +6104,7 @@ export default {
           };
         });
 
-        return jsonResponse({ parsed }, 200, env);
+        return jsonResponse({ parsed, version: INGEST_PARSER_VERSION }, 200, env);
       } catch (error) {
         console.error('[Ingest Parse] Error:', error);
         return errorResponse('Parsing failed', 500, env);
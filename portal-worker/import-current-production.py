@@ -20,152 +20,61 @@ Field Positions (0-indexed Python slices per OTC data dictionary):
 PUN Format: XXX-XXXXXX-X-XXXX (County-Lease-Sub-Merge) = 3-6-1-4 digits
 D1 year_month format: YYYYMM (no dash)
 D1 product_code format: '1', '3', '5', '6' (single digit strings)
+
+Records are read with the shared GROSS_PRODUCTION layout in otc_fixed_width.py
+and aggregated in a ProductionRollup (production_rollup.py, requires numpy).
 """
 
 import os
 import sys
 import subprocess
-from collections import defaultdict
 from datetime import datetime
+from itertools import islice
+
+from otc_fixed_width import ParseStats
+from production_rollup import ProductionRollup
 
 # Configuration
 INPUT_DIR = os.environ.get("INPUT_DIR", "/Users/jamesprice/mymineralwatch/OTC Bulk/extracted_otc/Gross-Production-Extracts")
 OUTPUT_DIR = os.environ.get("OUTPUT_DIR", "/Users/jamesprice/mymineralwatch/mineral-watch-site/portal-worker/otc-current-batches")
 BATCH_SIZE = 500
+# Worker processes for parsing (1 = parse in this process)
+PARSE_WORKERS = int(os.environ.get("PARSE_WORKERS", os.cpu_count() or 1))
 
-# Product code mapping - raw 2-char field to single digit for D1
-PRODUCT_CODE_MAP = {
-    '01': '1',   # Crude Oil
-    ' 1': '1',
-    '03': '3',   # Condensate
-    ' 3': '3',
-    '05': '5',   # Casinghead Gas
-    ' 5': '5',
-    '06': '6',   # Natural Gas
-    ' 6': '6',
-}
-
-
-def format_pun(county, lease, sub, merge):
-    """Format PUN components into standard format: XXX-XXXXXX-X-XXXX (3-6-1-4)"""
-    return f"{county}-{lease.strip().zfill(6)}-{sub}-{merge.strip().zfill(4)}"
+# Product codes as stored in D1: '1' Crude Oil, '3' Condensate, '5' Casinghead Gas, '6' Natural Gas
+PRODUCT_CODES = {'1': '1', '3': '3', '5': '5', '6': '6'}
 
 
-def parse_production_file(filepath):
+def parse_production_file(filepath, production):
     """
-    Parse 12/36 month production .dat file (fixed-width format).
+    Parse 12/36 month production .dat file (fixed-width format) into a ProductionRollup.
 
-    Returns dict: {(pun, year_month, product_code): gross_volume}
+    Groups are (pun, year_month, product_code) -> gross_volume
     where product_code is '1', '3', '5', or '6'
     """
-    production = defaultdict(float)
-
     print(f"  Parsing {os.path.basename(filepath)}...")
-    row_count = 0
-    valid_count = 0
-    skipped_short = 0
-    skipped_invalid = 0
-
-    with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
-        for line in f:
-            row_count += 1
-
-            if len(line) < 600:
-                skipped_short += 1
-                continue
-
-            try:
-                # Extract fields from fixed positions
-                month = line[275:277]
-                year = line[277:281]
-                product_code = line[283:285]
-
-                # PUN components (3-6-1-4 per OTC data dictionary)
-                pun_county = line[287:290]
-                pun_lease = line[290:296]
-                pun_sub = line[296:297]
-                pun_merge = line[297:301]
-
-                gross_vol_str = line[577:597].strip()
-
-                # Validate month/year
-                if not month.isdigit() or not year.isdigit():
-                    skipped_invalid += 1
-                    continue
-                if not (1 <= int(month) <= 12):
-                    skipped_invalid += 1
-                    continue
-                if not (2000 <= int(year) <= 2030):
-                    skipped_invalid += 1
-                    continue
-
-                # Format year_month as YYYYMM (matches D1 format, no dash)
-                year_month = f"{year}{month}"
-
-                # Validate PUN components
-                if not pun_county.isdigit() or not pun_lease.strip().isdigit():
-                    skipped_invalid += 1
-                    continue
-                if not pun_sub.isdigit() or not pun_merge.strip().isdigit():
-                    skipped_invalid += 1
-                    continue
-
-                # Format PUN (3-6-1-4)
-                pun = format_pun(pun_county, pun_lease, pun_sub, pun_merge)
-
-                # Map product code (2-char raw → single digit for D1)
-                mapped_code = PRODUCT_CODE_MAP.get(product_code)
-                if not mapped_code:
-                    stripped = product_code.strip()
-                    if stripped in ('1', '3', '5', '6'):
-                        mapped_code = stripped
-                    else:
-                        skipped_invalid += 1
-                        continue
-
-                # Parse gross volume
-                try:
-                    # Remove any + signs that appear in the data
-                    gross_vol_str = gross_vol_str.replace('+', '')
-                    gross_volume = float(gross_vol_str)
-                except ValueError:
-                    skipped_invalid += 1
-                    continue
-
-                # Aggregate by PUN + year_month + product
-                key = (pun, year_month, mapped_code)
-                production[key] += gross_volume
-                valid_count += 1
-
-            except (ValueError, IndexError) as e:
-                skipped_invalid += 1
-                continue
-
-            if row_count % 1000000 == 0:
-                print(f"    Processed {row_count:,} rows, {valid_count:,} valid...")
-
-    print(f"  Total rows: {row_count:,}")
-    print(f"  Valid records: {valid_count:,}")
-    print(f"  Skipped (short lines): {skipped_short:,}")
-    print(f"  Skipped (invalid data): {skipped_invalid:,}")
-    print(f"  Unique PUN/month/product combinations: {len(production):,}")
-
-    return production
+    stats = ParseStats()
+    if PARSE_WORKERS > 1:
+        print(f"  Using {PARSE_WORKERS} worker processes")
+    groups = production.add_file(filepath, stats, workers=PARSE_WORKERS, progress=1000000)
+
+    stats.report()
+    print(f"  Unique PUN/month/product combinations: {groups:,}")
 
 
 def generate_sql_batches(production, output_dir, source_files):
     """Generate SQL INSERT statements in batches for D1."""
     os.makedirs(output_dir, exist_ok=True)
 
-    # Convert to list and sort for consistent output
-    items = sorted(production.items())
+    # Rollup items come out sorted; strings are built one batch at a time
+    items = production.items()
     batch_num = 0
-    total_batches = (len(items) + BATCH_SIZE - 1) // BATCH_SIZE
+    total_batches = (len(production) + BATCH_SIZE - 1) // BATCH_SIZE
 
     print(f"  Generating {total_batches} SQL batch files...")
 
-    for i in range(0, len(items), BATCH_SIZE):
-        batch = items[i:i + BATCH_SIZE]
+    for _ in range(total_batches):
+        batch = list(islice(items, BATCH_SIZE))
         batch_num += 1
 
         values_list = []
@@ -274,18 +183,14 @@ def main():
     print()
 
     # Combine production from all files
-    all_production = defaultdict(float)
+    all_production = ProductionRollup(PRODUCT_CODES)
 
     for filename in dat_files:
         filepath = os.path.join(INPUT_DIR, filename)
         print(f"Processing: {filename}")
         print("-" * 50)
 
-        production = parse_production_file(filepath)
-
-        # Merge into combined dict
-        for key, value in production.items():
-            all_production[key] += value
+        parse_production_file(filepath, all_production)
 
         print()
 
@@ -306,26 +211,22 @@ def main():
     print("=" * 60)
 
     # Calculate totals by product type
-    oil_volume = sum(v for (p, m, t), v in all_production.items() if t in ('1', '3'))
-    gas_volume = sum(v for (p, m, t), v in all_production.items() if t in ('5', '6'))
+    volumes = all_production.volume_by_product()
+    oil_volume = volumes['1'] + volumes['3']
+    gas_volume = volumes['5'] + volumes['6']
 
     # Get date range
-    months = set(m for (p, m, t) in all_production.keys())
-    min_month = min(months) if months else "N/A"
-    max_month = max(months) if months else "N/A"
-
-    # Count unique PUNs
-    puns = set(p for (p, m, t) in all_production.keys())
+    min_month, max_month = all_production.period_range()
 
     print(f"Date range: {min_month} to {max_month}")
-    print(f"Unique PUNs: {len(puns):,}")
+    print(f"Unique PUNs: {all_production.pun_count():,}")
     print(f"Total Oil Volume: {oil_volume:,.0f} BBL")
     print(f"Total Gas Volume: {gas_volume:,.0f} MCF")
     print(f"Total records: {len(all_production):,}")
 
     # Check for NEWLEY PUN
-    newley_pun = "043-22659-7-00000"
-    newley_records = [(k, v) for k, v in all_production.items() if k[0] == newley_pun]
+    newley_pun = "043-226597-0-0000"
+    newley_records = all_production.items_for_pun(newley_pun)
     if newley_records:
         print(f"\nNEWLEY PUN ({newley_pun}) found: {len(newley_records)} records")
         for (pun, month, product), volume in sorted(newley_records, reverse=True)[:10]:
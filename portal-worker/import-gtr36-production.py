@@ -5,136 +5,63 @@ GTR36 Production Data Parser for PUN-level Import
 Parses exp_gph_reports_gtr36*.dat files (fixed-width format) and imports
 to otc_production table for well-level production summary.
 
-Field Positions (0-indexed):
-- Position 275-276: Reporting Month (2 chars, MM)
-- Position 277-280: Reporting Year (4 chars, YYYY)
-- Position 283-284: Product Code (2 chars: 01=Oil, 05=Gas, 03=CasingheadGas, 06=Condensate)
-- Position 287-289: PUN County (3 chars)
-- Position 290-294: PUN Lease (5 chars)
-- Position 295: PUN Sub (1 char)
-- Position 296-300: PUN Merge (5 chars)
-- Position 577-596: Gross Volume (20 chars with decimal)
-
-PUN Format: XXX-XXXXX-X-XXXXX (County-Lease-Sub-Merge)
+Field Positions (0-indexed Python slices per OTC data dictionary):
+- [275:277] Reporting Month (2 chars, MM)
+- [277:281] Reporting Year (4 chars, YYYY)
+- [283:285] Product Code (2 chars: 01=Oil, 03=Condensate, 05=CasingheadGas, 06=NaturalGas)
+- [287:290] PUN County (3 chars)
+- [290:296] PUN Lease (6 chars)
+- [296:297] PUN Sub (1 char)
+- [297:301] PUN Merge (4 chars)
+- [577:597] Gross Volume (20 chars with decimal)
+
+PUN Format: XXX-XXXXXX-X-XXXX (County-Lease-Sub-Merge) = 3-6-1-4 digits
+
+Records are read with the shared GROSS_PRODUCTION layout in otc_fixed_width.py
+and aggregated in a ProductionRollup (production_rollup.py, requires numpy).
 """
 
 import os
 import sys
 import subprocess
-from collections import defaultdict
 from datetime import datetime
+from itertools import islice
+
+from otc_fixed_width import ParseStats
+from production_rollup import ProductionRollup
 
 # Configuration
 INPUT_DIR = os.environ.get("INPUT_DIR", "/Users/jamesprice/mymineralwatch/OTC Bulk/extracted_otc/Gross-Production-Extracts")
 OUTPUT_DIR = os.environ.get("OUTPUT_DIR", "/Users/jamesprice/mymineralwatch/mineral-watch-site/portal-worker/otc-production-batches")
 BATCH_SIZE = 500
+# Worker processes for parsing (1 = parse in this process)
+PARSE_WORKERS = int(os.environ.get("PARSE_WORKERS", os.cpu_count() or 1))
 
 # Product code mapping - combine into oil/gas
-PRODUCT_OIL_CODES = {'01', '06'}  # Oil + Condensate
-PRODUCT_GAS_CODES = {'03', '05'}  # Casinghead Gas + Gas
-
-
-def format_pun(county, lease, sub, merge):
-    """Format PUN components into standard format: XXX-XXXXX-X-XXXXX"""
-    return f"{county}-{lease}-{sub}-{merge}"
+PRODUCT_TYPES = {
+    '1': 'OIL',  # Crude Oil
+    '3': 'OIL',  # Condensate
+    '5': 'GAS',  # Casinghead Gas
+    '6': 'GAS',  # Natural Gas
+}
 
 
 def parse_gtr36_file(filepath):
     """
     Parse GTR36 gross production .dat file (fixed-width format).
 
-    Returns dict: {(pun, year_month, product_type): gross_volume}
-    where product_type is 'OIL' or 'GAS'
+    Returns a ProductionRollup of (pun, year_month, product_type) -> gross_volume
+    where year_month is YYYY-MM (for otc_production) and product_type is 'OIL' or 'GAS'
     """
-    production = defaultdict(float)
+    production = ProductionRollup(PRODUCT_TYPES, "{year}-{month:02d}")
 
     print(f"  Parsing {os.path.basename(filepath)}...")
-    row_count = 0
-    valid_count = 0
-    skipped_short = 0
-    skipped_invalid = 0
-
-    with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
-        for line in f:
-            row_count += 1
-
-            if len(line) < 600:
-                skipped_short += 1
-                continue
-
-            try:
-                # Extract fields from fixed positions
-                month = line[275:277]
-                year = line[277:281]
-                product_code = line[283:285]
-
-                # PUN components
-                pun_county = line[287:290]
-                pun_lease = line[290:295]
-                pun_sub = line[295:296]
-                pun_merge = line[296:301]
-
-                gross_vol_str = line[577:597].strip()
-
-                # Validate month/year
-                if not month.isdigit() or not year.isdigit():
-                    skipped_invalid += 1
-                    continue
-                if not (1 <= int(month) <= 12):
-                    skipped_invalid += 1
-                    continue
-                if not (2000 <= int(year) <= 2030):
-                    skipped_invalid += 1
-                    continue
-
-                # Format year_month as YYYY-MM for consistency with otc_production
-                year_month = f"{year}-{month}"
-
-                # Validate PUN components
-                if not pun_county.isdigit() or not pun_lease.isdigit():
-                    skipped_invalid += 1
-                    continue
-                if not pun_sub.isdigit() or not pun_merge.isdigit():
-                    skipped_invalid += 1
-                    continue
-
-                # Format PUN
-                pun = format_pun(pun_county, pun_lease, pun_sub, pun_merge)
-
-                # Determine product type (OIL or GAS)
-                if product_code in PRODUCT_OIL_CODES:
-                    product_type = 'OIL'
-                elif product_code in PRODUCT_GAS_CODES:
-                    product_type = 'GAS'
-                else:
-                    skipped_invalid += 1
-                    continue
-
-                # Parse gross volume
-                try:
-                    # Remove any + signs that appear in the data
-                    gross_vol_str = gross_vol_str.replace('+', '')
-                    gross_volume = float(gross_vol_str)
-                except ValueError:
-                    skipped_invalid += 1
-                    continue
-
-                # Aggregate by PUN + year_month + product
-                key = (pun, year_month, product_type)
-                production[key] += gross_volume
-                valid_count += 1
-
-            except (ValueError, IndexError) as e:
-                skipped_invalid += 1
-                continue
-
-            if row_count % 1000000 == 0:
-                print(f"    Processed {row_count:,} rows, {valid_count:,} valid...")
-
-    print(f"  Total rows: {row_count:,}")
-    print(f"  Valid records: {valid_count:,}")
-    print(f"  Skipped (short lines): {skipped_short:,}")
-    print(f"  Skipped (invalid data): {skipped_invalid:,}")
+    stats = ParseStats()
+    if PARSE_WORKERS > 1:
+        print(f"  Using {PARSE_WORKERS} worker processes")
+    production.add_file(filepath, stats, workers=PARSE_WORKERS, progress=1000000)
+
+    stats.report()
     print(f"  Unique PUN/month/product combinations: {len(production):,}")
 
     return production
@@ -144,15 +71,15 @@ def generate_sql_batches(production, output_dir, source_file):
     """Generate SQL INSERT statements in batches for D1."""
     os.makedirs(output_dir, exist_ok=True)
 
-    # Convert to list and sort for consistent output
-    items = sorted(production.items())
+    # Rollup items come out sorted; strings are built one batch at a time
+    items = production.items()
     batch_num = 0
-    total_batches = (len(items) + BATCH_SIZE - 1) // BATCH_SIZE
+    total_batches = (len(production) + BATCH_SIZE - 1) // BATCH_SIZE
 
     print(f"  Generating {total_batches} SQL batch files...")
 
-    for i in range(0, len(items), BATCH_SIZE):
-        batch = items[i:i + BATCH_SIZE]
+    for _ in range(total_batches):
+        batch = list(islice(items, BATCH_SIZE))
         batch_num += 1
 
         values_list = []
@@ -290,26 +217,22 @@ def main():
     print("=" * 60)
 
     # Calculate totals by product type
-    oil_volume = sum(v for (p, m, t), v in production.items() if t == 'OIL')
-    gas_volume = sum(v for (p, m, t), v in production.items() if t == 'GAS')
+    volumes = production.volume_by_product()
+    oil_volume = volumes['OIL']
+    gas_volume = volumes['GAS']
 
     # Get date range
-    months = set(m for (p, m, t) in production.keys())
-    min_month = min(months) if months else "N/A"
-    max_month = max(months) if months else "N/A"
-
-    # Count unique PUNs
-    puns = set(p for (p, m, t) in production.keys())
+    min_month, max_month = production.period_range()
 
     print(f"Date range: {min_month} to {max_month}")
-    print(f"Unique PUNs: {len(puns):,}")
+    print(f"Unique PUNs: {production.pun_count():,}")
     print(f"Total Oil Volume: {oil_volume:,.0f} BBL")
     print(f"Total Gas Volume: {gas_volume:,.0f} MCF")
     print(f"Total records: {len(production):,}")
 
     # Check for NEWLEY PUN
-    newley_pun = "043-22659-7-00000"
-    newley_records = [(k, v) for k, v in production.items() if k[0] == newley_pun]
+    newley_pun = "043-226597-0-0000"
+    newley_records = production.items_for_pun(newley_pun)
     if newley_records:
         print(f"\nNEWLEY PUN ({newley_pun}) found: {len(newley_records)} records")
         for (pun, month, product), volume in sorted(newley_records)[:5]:
@@ -17,146 +17,56 @@ Field positions per OTC data dictionary (0-indexed Python slices):
 - [296:297] PUN Sub (1 digit)
 - [297:301] PUN Merge (4 digits)
 - [577:597] Gross Volume (20 chars decimal)
+
+Records are read with the shared GROSS_PRODUCTION layout in otc_fixed_width.py
+and aggregated in a ProductionRollup (production_rollup.py, requires numpy).
 """
 
 import os
 import sys
-from collections import defaultdict
 from datetime import datetime
+from itertools import islice
+
+from otc_fixed_width import ParseStats
+from production_rollup import ProductionRollup
 
 # Configuration
 INPUT_FILE = "/Users/jamesprice/mymineralwatch/OTC Bulk/extracted_otc/Gross-Production-Extracts/exp_gph_reports_3620260112.dat"
 OUTPUT_DIR = "/Users/jamesprice/mymineralwatch/mineral-watch-site/portal-worker/otc-missing-county-batches"
 BATCH_SIZE = 500
+# Worker processes for parsing (1 = parse in this process)
+PARSE_WORKERS = int(os.environ.get("PARSE_WORKERS", os.cpu_count() or 1))
+
+# Product codes as stored in D1: '1' Crude Oil, '3' Condensate, '5' Casinghead Gas, '6' Natural Gas
+PRODUCT_CODES = {'1': '1', '3': '3', '5': '5', '6': '6'}
 
 # Counties missing 2023+ data
 MISSING_COUNTIES = {'001', '003', '005', '007', '009', '011', '013', '015', '021', '115'}
 
-# Product code mapping (raw 2-char → single digit for D1)
-PRODUCT_CODE_MAP = {
-    '01': '1',   # Crude Oil
-    ' 1': '1',
-    '1 ': '1',
-    '03': '3',   # Condensate
-    ' 3': '3',
-    '3 ': '3',
-    '05': '5',   # Casinghead Gas
-    ' 5': '5',
-    '5 ': '5',
-    '06': '6',   # Natural Gas
-    ' 6': '6',
-    '6 ': '6',
-}
-
 
 def parse_production_file(filepath):
     """
     Parse 36-month production file, filtering to only missing counties.
-    Returns dict: {(pun, year_month, product_code): gross_volume}
+    Returns a ProductionRollup of (pun, year_month, product_code) -> gross_volume
     """
-    production = defaultdict(float)
+    production = ProductionRollup(PRODUCT_CODES)
 
     print(f"Parsing {os.path.basename(filepath)}...")
     print(f"Filtering to counties: {sorted(MISSING_COUNTIES)}")
-    row_count = 0
-    valid_count = 0
-    county_counts = defaultdict(int)
-    skipped_short = 0
-    skipped_county = 0
-    skipped_invalid = 0
-
-    with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
-        for line in f:
-            row_count += 1
-
-            if len(line) < 600:
-                skipped_short += 1
-                continue
-
-            try:
-                # PUN county first — skip early if not in our set
-                pun_county = line[287:290]
-                if pun_county not in MISSING_COUNTIES:
-                    skipped_county += 1
-                    continue
-
-                # Extract remaining fields
-                month = line[275:277]
-                year = line[277:281]
-                product_code_raw = line[283:285]
-
-                pun_lease = line[290:296]
-                pun_sub = line[296:297]
-                pun_merge = line[297:301]
-
-                gross_vol_str = line[577:597].strip()
-
-                # Validate month/year
-                if not month.isdigit() or not year.isdigit():
-                    skipped_invalid += 1
-                    continue
-                month_int = int(month)
-                year_int = int(year)
-                if not (1 <= month_int <= 12) or not (2000 <= year_int <= 2030):
-                    skipped_invalid += 1
-                    continue
-
-                # Format year_month as YYYYMM (matches D1 format)
-                year_month = f"{year}{month}"
-
-                # Validate PUN components
-                if not pun_county.isdigit() or not pun_lease.strip().isdigit():
-                    skipped_invalid += 1
-                    continue
-                if not pun_sub.isdigit() or not pun_merge.strip().isdigit():
-                    skipped_invalid += 1
-                    continue
-
-                # Zero-pad lease and merge
-                pun_lease = pun_lease.strip().zfill(6)
-                pun_merge = pun_merge.strip().zfill(4)
-
-                # Format PUN: XXX-XXXXXX-X-XXXX
-                pun = f"{pun_county}-{pun_lease}-{pun_sub}-{pun_merge}"
-
-                # Map product code
-                product_code = PRODUCT_CODE_MAP.get(product_code_raw)
-                if not product_code:
-                    # Try stripping
-                    stripped = product_code_raw.strip()
-                    if stripped in ('1', '3', '5', '6'):
-                        product_code = stripped
-                    else:
-                        skipped_invalid += 1
-                        continue
-
-                # Parse gross volume
-                gross_vol_str = gross_vol_str.replace('+', '')
-                try:
-                    gross_volume = float(gross_vol_str)
-                except ValueError:
-                    skipped_invalid += 1
-                    continue
-
-                # Aggregate
-                key = (pun, year_month, product_code)
-                production[key] += gross_volume
-                valid_count += 1
-                county_counts[pun_county] += 1
-
-            except (ValueError, IndexError):
-                skipped_invalid += 1
-                continue
-
-            if row_count % 1000000 == 0:
-                print(f"  Processed {row_count:,} rows, {valid_count:,} valid for missing counties...")
+    stats = ParseStats()
+    # PUN county first — other counties are skipped before any field is converted
+    where = {"pun_county": [c.encode() for c in MISSING_COUNTIES]}
+    if PARSE_WORKERS > 1:
+        print(f"Using {PARSE_WORKERS} worker processes")
+    production.add_file(filepath, stats, workers=PARSE_WORKERS, where=where, progress=1000000)
+    county_counts = production.records_by_county()
 
     print(f"\nParsing complete:")
-    print(f"  Total rows scanned: {row_count:,}")
-    print(f"  Valid records (missing counties): {valid_count:,}")
-    print(f"  Skipped (other counties): {skipped_county:,}")
-    print(f"  Skipped (short lines): {skipped_short:,}")
-    print(f"  Skipped (invalid data): {skipped_invalid:,}")
+    print(f"  Total rows scanned: {stats.rows:,}")
+    print(f"  Valid records (missing counties): {stats.valid:,}")
+    print(f"  Skipped (other counties): {stats.filtered:,}")
+    print(f"  Skipped (short lines): {stats.short:,}")
+    print(f"  Skipped (invalid data): {stats.invalid:,}")
     print(f"  Unique PUN/month/product combos: {len(production):,}")
     print(f"\n  Records by county:")
     for county in sorted(county_counts.keys()):
@@ -169,14 +79,15 @@ def generate_sql_batches(production, output_dir):
     """Generate SQL INSERT OR REPLACE batch files."""
     os.makedirs(output_dir, exist_ok=True)
 
-    items = sorted(production.items())
+    # Rollup items come out sorted; strings are built one batch at a time
+    items = production.items()
     batch_num = 0
-    total_batches = (len(items) + BATCH_SIZE - 1) // BATCH_SIZE
+    total_batches = (len(production) + BATCH_SIZE - 1) // BATCH_SIZE
 
     print(f"\nGenerating {total_batches} SQL batch files in {output_dir}...")
 
-    for i in range(0, len(items), BATCH_SIZE):
-        batch = items[i:i + BATCH_SIZE]
+    for _ in range(total_batches):
+        batch = list(islice(items, BATCH_SIZE))
         batch_num += 1
 
         values_list = []
@@ -227,13 +138,12 @@ def main():
         return 1
 
     # Stats
-    months = set(m for (p, m, t) in production.keys())
-    puns = set(p for (p, m, t) in production.keys())
-    counties = set(p.split('-')[0] for p in puns)
+    min_month, max_month = production.period_range()
+    counties = production.records_by_county().keys()
 
     print(f"\nData summary:")
-    print(f"  Date range: {min(months)} to {max(months)}")
-    print(f"  Unique PUNs: {len(puns):,}")
+    print(f"  Date range: {min_month} to {max_month}")
+    print(f"  Unique PUNs: {production.pun_count():,}")
     print(f"  Counties: {sorted(counties)}")
     print(f"  Total records: {len(production):,}")
 
@@ -14,6 +14,8 @@ Field positions (from Layout_for_Outside_Entities.xlsx):
   64-68  code (5 chars)
   69-92  exemption_percentage (24 chars, decimal)
 
+Records are read with the shared EXEMPTION layout in otc_fixed_width.py.
+
 Usage:
     python3 import-otc-exempt.py [input_file]
 """
@@ -21,6 +23,8 @@ Usage:
 import os
 import sys
 
+from otc_fixed_width import EXEMPTION, ParseStats
+
 
 INPUT_FILE = "/Users/jamesprice/mymineralwatch/OTC Bulk/files (4)/exp_gpexempt20260112.dat"
 OUTPUT_DIR = "/Users/jamesprice/mymineralwatch/mineral-watch-site/portal-worker/otc-exempt-batches"
@@ -52,32 +56,20 @@ def main():
 
     records = []
 
-    with open(input_file, 'r', encoding='utf-8', errors='replace') as f:
-        for line in f:
-            if len(line.rstrip()) < 69:
-                continue
-
-            pun = f"{line[0:3]}-{line[3:9]}-{line[9:10]}-{line[10:14]}"
-            exempt_type = line[14:64].strip()
-            code = line[64:69].strip()
-            pct_raw = line[69:93].strip() if len(line) > 69 else ''
-
-            try:
-                pct = float(pct_raw) if pct_raw else None
-            except ValueError:
-                pct = None
-
-            if exempt_type == 'None' or not exempt_type:
-                continue
+    stats = ParseStats()
+    for pun, exempt_type, code, pct in EXEMPTION.records(input_file, stats):
+        if exempt_type == 'None' or not exempt_type:
+            continue
 
-            records.append({
-                'pun': pun,
-                'base_pun': pun[:10],
-                'exemption_type': exempt_type,
-                'code': code or None,
-                'exemption_percentage': pct,
-            })
+        records.append({
+            'pun': pun,
+            'base_pun': pun[:10],
+            'exemption_type': exempt_type,
+            'code': code or None,
+            'exemption_percentage': pct,
+        })
 
+    stats.report()
     print(f"Total records: {len(records):,}")
 
     BATCH_SIZE = 500
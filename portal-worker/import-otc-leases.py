@@ -29,47 +29,15 @@ Field positions in exp_gplease (447 chars/line, from Layout_for_Outside_Entities
   122-131 well_classification (10 chars): 107=Oil, 108=Gas, 109=Injection, 110=Vertical/Simple
   132-191 well_name (60 chars)
   192-446 formation_names (255 chars): mostly empty, well-name overflow
+
+Records are read with the shared LEASE layout in otc_fixed_width.py; lines
+without a numeric PUN or a section in 1-36 are counted as invalid and skipped.
 """
 
 import sys
 import os
 
-
-def parse_pun(pun_raw):
-    """Convert '00300046400000' to '003-000464-0-0000' format.
-
-    OTC PUN format: 3 (county) + 6 (lease) + 1 (sub) + 4 (merge) = 14 digits
-    """
-    if len(pun_raw) < 14:
-        return pun_raw
-    county = pun_raw[0:3]      # positions 0-2 (3 chars)
-    lease = pun_raw[3:9]       # positions 3-8 (6 chars)
-    sub = pun_raw[9:10]        # position 9 (1 char)
-    merge = pun_raw[10:14]     # positions 10-13 (4 chars)
-    return f"{county}-{lease}-{sub}-{merge}"
-
-
-def parse_legal(quarter160, section_raw, township_raw, range_raw):
-    """Parse legal components from individual fields (per data dictionary)."""
-    quarter = quarter160.strip()
-    section_str = section_raw.strip()
-    township = township_raw.strip()
-    range_val = range_raw.strip()
-
-    # Validate section
-    try:
-        section = int(section_str)
-        if section < 1 or section > 36:
-            return None
-    except ValueError:
-        return None
-
-    return {
-        'quarter': quarter,
-        'section': section,
-        'township': township,
-        'range': range_val
-    }
+from otc_fixed_width import LEASE, ParseStats
 
 
 def escape_sql(s):
@@ -97,62 +65,40 @@ def main():
     records = []
     formation_counts = {}
 
-    with open(lease_file, 'r', encoding='utf-8', errors='replace') as f:
-        line_num = 0
-        for line in f:
-            line_num += 1
-
-            if len(line) < 132:
-                continue
-
-            # Parse fields from fixed-width format (per data dictionary)
-            county = line[0:50].strip()
-            pun_raw = line[50:64].strip()
-            legal_desc_type = line[64:104].strip()   # Legal/Bottom/Surface + sub-quarter
-            quarter160 = line[110:112]                # Quarter at 160-acre level
-            section_raw = line[112:114]               # Section (2 chars)
-            township_raw = line[114:117]              # Township (3 chars)
-            range_raw = line[117:122]                 # Range (5 chars, was reading only 3)
-            well_classification = line[122:132].strip() if len(line) > 132 else ''
-            lease_name = line[132:192].strip() if len(line) > 132 else ''
-
-            # Track formation values
-            formation_counts[legal_desc_type] = formation_counts.get(legal_desc_type, 0) + 1
-
-            # Parse legal description
-            parsed = parse_legal(quarter160, section_raw, township_raw, range_raw)
-            if not parsed:
-                continue
-
-            # Format PUN (3-6-1-4 dashed format)
-            pun = parse_pun(pun_raw)
-            base_pun = pun[:10] if len(pun) >= 10 else pun
-
-            # Create unique key
-            key = f"{pun}_{parsed['section']}_{parsed['township']}_{parsed['range']}_{parsed['quarter']}"
-            if key in seen:
-                continue
-            seen.add(key)
-
-            # Normalize well_classification to short code
-            wc_short = well_classification.lstrip('0') or '0' if well_classification else None
-
-            records.append({
-                'pun': pun,
-                'base_pun': base_pun,
-                'county': county,
-                'quarter': parsed['quarter'],
-                'section': parsed['section'],
-                'township': parsed['township'],
-                'range': parsed['range'],
-                'lease_name': lease_name,
-                'formation': legal_desc_type if legal_desc_type else None,
-                'well_classification': wc_short,
-            })
-
-            if line_num % 50000 == 0:
-                print(f"  Processed {line_num:,} lines...")
-
+    stats = ParseStats()
+    fields = ("county", "pun", "legal_description_type", "quarter160", "section", "township", "range",
+              "well_classification", "well_name")
+
+    for (county, pun, legal_desc_type, quarter, section, township, range_val,
+         well_classification, lease_name) in LEASE.records(lease_file, stats, fields, progress=50000):
+        # Track formation values
+        formation_counts[legal_desc_type] = formation_counts.get(legal_desc_type, 0) + 1
+
+        base_pun = pun[:10]
+
+        # Create unique key
+        key = f"{pun}_{section}_{township}_{range_val}_{quarter}"
+        if key in seen:
+            continue
+        seen.add(key)
+
+        # Normalize well_classification to short code
+        wc_short = well_classification.lstrip('0') or '0' if well_classification else None
+
+        records.append({
+            'pun': pun,
+            'base_pun': base_pun,
+            'county': county,
+            'quarter': quarter,
+            'section': section,
+            'township': township,
+            'range': range_val,
+            'lease_name': lease_name,
+            'formation': legal_desc_type if legal_desc_type else None,
+            'well_classification': wc_short,
+        })
+
+    stats.report()
     print(f"\nTotal unique records: {len(records):,}")
     print(f"\nLegal description type distribution:")
     for form, count in sorted(formation_counts.items(), key=lambda x: -x[1])[:15]:
@@ -11,6 +11,8 @@ Field positions in exp_gpoper:
   14-20  Operator/company number (7 chars)
   21+    Company name (remaining chars)
 
+Records are read with the shared OPERATOR layout in otc_fixed_width.py.
+
 Usage:
     python3 import-otc-operators.py [input_file]
 """
@@ -18,18 +20,13 @@ Usage:
 import os
 import sys
 
+from otc_fixed_width import OPERATOR, ParseStats
+
 
 INPUT_FILE = "/Users/jamesprice/mymineralwatch/OTC Bulk/files (4)/exp_gpoper20260112.dat"
 OUTPUT_DIR = "/Users/jamesprice/mymineralwatch/mineral-watch-site/portal-worker/otc-operator-batches"
 
 
-def format_pun_with_dashes(raw_pun):
-    """Format raw PUN (14 chars) to dashed format: XXX-XXXXXX-X-XXXX (3-6-1-4)"""
-    if len(raw_pun) < 14:
-        raw_pun = raw_pun.ljust(14, '0')
-    return f"{raw_pun[0:3]}-{raw_pun[3:9]}-{raw_pun[9:10]}-{raw_pun[10:14]}"
-
-
 def escape_sql(s):
     """Escape single quotes for SQL"""
     if s is None:
@@ -42,24 +39,17 @@ def parse_operator_file(input_file):
     pun_to_operator = {}
     companies = {}  # operator_number -> company_name
 
-    with open(input_file, 'r', encoding='utf-8', errors='replace') as f:
-        for line in f:
-            if len(line) < 21:
-                continue
-
-            raw_pun = line[0:14].strip()
-            operator_number = line[14:21].strip()
-            company_name = line[21:].strip().rstrip('\r\n')
+    stats = ParseStats()
+    for pun, operator_number, company_name in OPERATOR.records(input_file, stats):
+        # Remove leading zeros from operator number for consistency
+        op_num = operator_number.lstrip('0') or '0'
+        pun_to_operator[pun] = op_num
 
-            if raw_pun and operator_number:
-                formatted_pun = format_pun_with_dashes(raw_pun)
-                # Remove leading zeros from operator number for consistency
-                op_num = operator_number.lstrip('0') or '0'
-                pun_to_operator[formatted_pun] = op_num
+        # Track company names (keep the most recent)
+        if company_name:
+            companies[op_num] = company_name
 
-                # Track company names (keep the most recent)
-                if op_num and company_name:
-                    companies[op_num] = company_name
+    stats.report()
 
     return pun_to_operator, companies
 
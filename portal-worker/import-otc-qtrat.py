@@ -17,6 +17,8 @@ Field positions (from Layout_for_Outside_Entities.xlsx):
   145-155 period_end_date (11 chars, YYYY-MM-DD or 9999-12-31 for active)
   156-165 rate (10 chars, decimal 0000000.00)
 
+Records are read with the shared QUALIFYING_TAX_RATE layout in otc_fixed_width.py.
+
 Usage:
     python3 import-otc-qtrat.py [input_file]
 """
@@ -24,16 +26,13 @@ Usage:
 import os
 import sys
 
+from otc_fixed_width import QUALIFYING_TAX_RATE, ParseStats
+
 
 INPUT_FILE = "/Users/jamesprice/mymineralwatch/OTC Bulk/files (4)/exp_gpqtrat20260112.dat"
 OUTPUT_DIR = "/Users/jamesprice/mymineralwatch/mineral-watch-site/portal-worker/otc-qtrat-batches"
 
 
-def format_pun(county, lease, sub, merge):
-    """Format PUN components to dashed format: XXX-XXXXXX-X-XXXX (3-6-1-4)"""
-    return f"{county}-{lease}-{sub}-{merge}"
-
-
 def escape_sql(s):
     """Escape single quotes for SQL"""
     if s is None:
@@ -65,57 +64,33 @@ def main():
             os.remove(os.path.join(OUTPUT_DIR, f))
 
     records = []
-    skipped = 0
     active_count = 0
     earliest_starts = {}  # pun -> earliest period_start_date
 
-    with open(input_file, 'r', encoding='utf-8', errors='replace') as f:
-        for line_num, line in enumerate(f, 1):
-            if len(line.rstrip()) < 156:
-                skipped += 1
-                continue
-
-            county = line[0:3]
-            lease = line[3:9]
-            sub = line[9:10]
-            merge = line[10:14]
-            lease_name = line[14:74].strip()
-            well_name = line[74:134].strip()
-            period_start = line[134:145].strip()
-            period_end = line[145:156].strip()
-            rate_raw = line[156:166].strip() if len(line) > 156 else ''
-
-            pun = format_pun(county, lease, sub, merge)
-
-            # Parse rate
-            try:
-                rate = float(rate_raw) if rate_raw else None
-            except ValueError:
-                rate = None
-
-            is_active = period_end == '9999-12-31'
-            if is_active:
-                active_count += 1
-
-            # Track earliest start per PUN
-            if pun not in earliest_starts or (period_start and period_start < earliest_starts[pun]):
-                earliest_starts[pun] = period_start
-
-            records.append({
-                'pun': pun,
-                'base_pun': pun[:10] if len(pun) >= 10 else pun,
-                'lease_name': lease_name if lease_name and lease_name != '[No Name]' else None,
-                'well_name': well_name if well_name and well_name != '[No Name]' and well_name != 'UNKNOWN SOURCE' else None,
-                'period_start_date': period_start or None,
-                'period_end_date': period_end if period_end != '9999-12-31' else None,
-                'is_active': 1 if is_active else 0,
-                'tax_rate': rate,
-            })
-
-            if line_num % 100000 == 0:
-                print(f"  Processed {line_num:,} lines...")
-
-    print(f"\nTotal records: {len(records):,} (skipped {skipped})")
+    stats = ParseStats()
+    for pun, lease_name, well_name, period_start, period_end, rate in QUALIFYING_TAX_RATE.records(
+            input_file, stats, progress=100000):
+        is_active = period_end == '9999-12-31'
+        if is_active:
+            active_count += 1
+
+        # Track earliest start per PUN
+        if pun not in earliest_starts or (period_start and period_start < earliest_starts[pun]):
+            earliest_starts[pun] = period_start
+
+        records.append({
+            'pun': pun,
+            'base_pun': pun[:10],
+            'lease_name': lease_name if lease_name and lease_name != '[No Name]' else None,
+            'well_name': well_name if well_name and well_name != '[No Name]' and well_name != 'UNKNOWN SOURCE' else None,
+            'period_start_date': period_start or None,
+            'period_end_date': period_end if period_end != '9999-12-31' else None,
+            'is_active': 1 if is_active else 0,
+            'tax_rate': rate,
+        })
+
+    stats.report()
+    print(f"\nTotal records: {len(records):,}")
     print(f"Active PUN periods (end=9999-12-31): {active_count:,}")
     print(f"Unique PUNs: {len(earliest_starts):,}")
 
@@ -0,0 +1,548 @@
+#!/usr/bin/env python3
+"""
+Shared reader for the OTC fixed-width bulk extracts.
+
+Each OTC file is described once by a Layout: its fields as 0-indexed
+[start:end) byte ranges plus how to convert and validate them. The importers
+(import-current-production.py, import-gtr36-production.py, import-otc-*.py, ...)
+ask a layout for just the fields they need:
+
+    stats = ParseStats()
+    for month, year, pun in GROSS_PRODUCTION.records(path, stats, fields=("month", "year", "pun")):
+        ...
+    stats.report()
+
+Files are memory-mapped and read as bytes. Only the requested fields are
+sliced out of each record, and only text fields are decoded, so a line is never
+decoded or copied as a whole. Each field selection is compiled into one
+slicing expression, and PUN, code and int conversions are memoized per layout
+(a PUN repeats on every month/product row of the production files).
+
+map_shards() spreads a multi-GB file over worker processes: the file is split
+into line-aligned byte ranges (shard_ranges), each shard is parsed and
+pre-aggregated in a worker, and the partial results are merged as shards
+finish. Layout.sum_by() aggregates a numeric field by key fields this way;
+production_rollup.ProductionRollup builds its compact rollup on it too.
+
+A record is counted as:
+  short    - shorter than the layout's min_length (by default the end of its
+             last required field)
+  filtered - rejected by a `where` filter (compared on raw bytes, before conversion)
+  invalid  - a required field is blank, not parseable, or outside its bounds/choices
+  valid    - yielded to the caller
+with per-field invalid counts in ParseStats.invalid_fields.
+
+PUNs are always formatted XXX-XXXXXX-X-XXXX (county 3, lease 6, sub 1,
+merge 4), the split given in the OTC data dictionary; see format_pun().
+
+Layouts are from Layout_for_Outside_Entities.xlsx and the OTC data dictionary.
+"""
+
+import mmap
+import os
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# Target shard size for Layout.sum_by(): bounds each worker's partial aggregate
+SHARD_BYTES = 256 * 1024 * 1024
+# Pages already read are dropped from the mapping every this many bytes, so a
+# multi-GB file does not stay resident in the process (it stays in page cache)
+RELEASE_BYTES = 64 * 1024 * 1024
+# Entries kept per memoized field (~185k distinct PUNs statewide)
+MEMO_MAX = 500_000
+
+LAYOUTS = {}  # name -> Layout, so worker processes can look a layout up by name
+
+
+def _pun_parts(raw, blank_zero=False):
+    """
+    (county, lease, sub, merge) of a raw 14-character PUN, zero-filled.
+
+    With blank_zero, a blank lease, sub or merge reads as zeros (the old
+    operator importer padded a stripped PUN with ljust(14, '0')); otherwise a
+    blank part is invalid. ValueError if the county is not three digits or any
+    other part is not numeric.
+    """
+    if isinstance(raw, bytes):
+        raw = raw.decode('ascii', 'replace')
+    county = raw[0:3]
+    lease = raw[3:9].strip()
+    sub = raw[9:10]
+    merge = raw[10:14].strip()
+    if blank_zero:
+        lease, sub, merge = lease or '0', sub.strip() or '0', merge or '0'
+    if not (county.isdigit() and len(county) == 3 and lease.isdigit() and sub.isdigit() and merge.isdigit()):
+        raise ValueError(f"Invalid PUN: {raw!r}")
+    return county, lease.zfill(6), sub, merge.zfill(4)
+
+
+def format_pun(raw, blank_zero=False):
+    """
+    Format a raw 14-character PUN as XXX-XXXXXX-X-XXXX.
+
+    '04322659700000' -> '043-226597-0-0000'. Blank-padded lease and merge
+    numbers are zero-filled, as are blank parts with blank_zero. Accepts
+    bytes or str; raises ValueError if the county, lease, sub or merge is not
+    numeric.
+    """
+    return '-'.join(_pun_parts(raw, blank_zero))
+
+
+def pun_key(raw, blank_zero=False):
+    """
+    A raw PUN packed into one integer: its 14 digits read as a number.
+
+    '04322659700000' -> 4322659700000. Integer order is PUN order, and
+    key // 10**11 is the county number. Validated like format_pun().
+    """
+    return int(''.join(_pun_parts(raw, blank_zero)))
+
+
+def format_pun_key(key):
+    """Inverse of pun_key(): 4322659700000 -> '043-226597-0-0000'."""
+    digits = f"{key:014d}"
+    return f"{digits[0:3]}-{digits[3:9]}-{digits[9:10]}-{digits[10:14]}"
+
+
+class Field:
+    """
+    One fixed-width field.
+
+    kind:
+      raw      bytes exactly as sliced (no strip, no decode)
+      text     stripped str (UTF-8, undecodable bytes replaced)
+      int      int; `bounds=(lo, hi)` is inclusive
+      decimal  float; '+' signs in the data are ignored
+      code     numeric code without leading zeros/blanks ('01', ' 1' -> '1');
+               `choices` limits the accepted codes
+      pun      formatted PUN (see format_pun); `blank_zero=True` reads blank
+               lease/sub/merge parts as zeros instead of rejecting them
+      pun_key  PUN packed into an int (see pun_key); takes `blank_zero` too
+
+    A blank or unparseable optional field is None ('' for text); a blank or
+    unparseable required field makes the record invalid.
+    """
+
+    KINDS = ('raw', 'text', 'int', 'decimal', 'code', 'pun', 'pun_key')
+
+    def __init__(self, name, start, end, kind='text', required=True, bounds=None, choices=None,
+                 blank_zero=False):
+        if kind not in self.KINDS:
+            raise ValueError(f"Unknown field kind {kind!r} for {name}")
+        self.name = name
+        self.start = start
+        self.end = end  # None = to end of line
+        self.kind = kind
+        self.required = required
+        self.bounds = bounds
+        self.choices = frozenset(choices) if choices is not None else None
+        self.blank_zero = blank_zero
+
+    def __repr__(self):
+        return f"Field({self.name!r}, {self.start}, {self.end}, {self.kind!r})"
+
+    def converter(self):
+        """Function raw bytes -> value; raises ValueError for an invalid required value."""
+        kind, required = self.kind, self.required
+
+        if kind == 'raw':
+            return lambda raw: raw
+
+        if kind == 'text':
+            def convert(raw):
+                value = raw.strip()
+                if not value and required:
+                    raise ValueError(self.name)
+                return value.decode('utf-8', 'replace')
+            return convert
+
+        lo, hi = self.bounds or (None, None)
+        choices = self.choices
+        blank_zero = self.blank_zero
+
+        def parse(raw):
+            if kind == 'pun':
+                return format_pun(raw, blank_zero)
+            if kind == 'pun_key':
+                return pun_key(raw, blank_zero)
+            if kind == 'decimal':
+                return float(raw.replace(b'+', b''))
+            if kind == 'int':
+                value = int(raw)
+                if (lo is not None and value < lo) or (hi is not None and value > hi):
+                    raise ValueError(self.name)
+                return value
+            # code
+            value = raw.strip().lstrip(b'0') or (b'0' if raw.strip() else b'')
+            if not value.isdigit():
+                raise ValueError(self.name)
+            value = value.decode('ascii')
+            if choices is not None and value not in choices:
+                raise ValueError(self.name)
+            return value
+
+        def convert(raw):
+            try:
+                return parse(raw)
+            except ValueError:
+                if required:
+                    raise
+                return None
+        return convert
+
+    @property
+    def memoized(self):
+        """int/code/PUN fields take few distinct values; convert each raw value once."""
+        return self.kind in ('int', 'code', 'pun', 'pun_key')
+
+
+class _Memo(dict):
+    """
+    raw bytes -> converted value, computed on first sight (invalid values are
+    not stored). Starts over after MEMO_MAX entries so a high-cardinality
+    field cannot grow it without bound.
+    """
+
+    def __init__(self, convert):
+        super().__init__()
+        self.convert = convert
+
+    def __missing__(self, raw):
+        if len(self) >= MEMO_MAX:
+            self.clear()
+        value = self[raw] = self.convert(raw)
+        return value
+
+
+class ParseStats:
+    """Record counters for one or more records() passes."""
+
+    def __init__(self):
+        self.rows = 0
+        self.valid = 0
+        self.short = 0
+        self.filtered = 0
+        self.invalid = 0
+        self.invalid_fields = Counter()
+
+    def merge(self, other):
+        """Add another pass's counts (e.g. one shard's) to these."""
+        self.rows += other.rows
+        self.valid += other.valid
+        self.short += other.short
+        self.filtered += other.filtered
+        self.invalid += other.invalid
+        self.invalid_fields.update(other.invalid_fields)
+
+    def report(self, indent="  "):
+        print(f"{indent}Total rows: {self.rows:,}")
+        print(f"{indent}Valid records: {self.valid:,}")
+        if self.filtered:
+            print(f"{indent}Skipped (filtered): {self.filtered:,}")
+        print(f"{indent}Skipped (short lines): {self.short:,}")
+        print(f"{indent}Skipped (invalid data): {self.invalid:,}")
+        for name, count in self.invalid_fields.most_common():
+            print(f"{indent}  invalid {name}: {count:,}")
+
+
+class Layout:
+    """Declarative spec of one OTC fixed-width file."""
+
+    def __init__(self, name, fields, min_length=None):
+        self.name = name
+        self.fields = {f.name: f for f in fields}
+        if min_length is None:
+            # A record must reach the end of its last required, bounded field
+            min_length = max((f.end for f in fields if f.required and f.end is not None), default=0)
+        self.min_length = min_length
+        self._converters = {}
+        LAYOUTS[name] = self
+
+    def _converter(self, name):
+        convert = self._converters.get(name)
+        if convert is None:
+            field = self.fields[name]
+            convert = field.converter()
+            if field.memoized:
+                convert = _Memo(convert).__getitem__
+            self._converters[name] = convert
+        return convert
+
+    def _compile(self, names, where):
+        """
+        Build (parse, keep) functions for one field selection.
+
+        parse(line) slices and converts every requested field in one tuple
+        expression, with memoized and plain float/decode conversions inlined;
+        it raises ValueError if any field is invalid (or is a decimal carrying a
+        '+', which the per-field converters handle). keep(line) applies the
+        `where` filters to raw slices. Generated so the per-record work is a
+        single expression instead of a Python loop over fields.
+        """
+        namespace = {}
+        exprs = []
+        for i, name in enumerate(names):
+            field = self.fields[name]
+            raw = f"line[{field.start}:{'' if field.end is None else field.end}]"
+            convert = self._converter(name)
+            if field.memoized:
+                namespace[f"m{i}"] = convert.__self__
+                exprs.append(f"m{i}[{raw}]")
+            elif field.kind == 'raw':
+                exprs.append(raw)
+            elif field.kind == 'decimal' and field.required:
+                exprs.append(f"float({raw})")
+            elif field.kind == 'text' and not field.required:
+                exprs.append(f"{raw}.strip().decode('utf-8', 'replace')")
+            else:
+                namespace[f"c{i}"] = convert
+                exprs.append(f"c{i}({raw})")
+        parse = eval(f"lambda line: ({', '.join(exprs)},)", namespace)
+
+        keep = None
+        if where:
+            tests = []
+            for i, (name, allowed) in enumerate(where.items()):
+                field = self.fields[name]
+                namespace[f"w{i}"] = frozenset(allowed)
+                tests.append(f"line[{field.start}:{'' if field.end is None else field.end}] in w{i}")
+            keep = eval(f"lambda line: {' and '.join(tests)}", namespace)
+        return parse, keep
+
+    def _convert_fields(self, line, names):
+        """Per-field conversion of a record parse() rejected; raises ValueError(field name)."""
+        values = []
+        for name in names:
+            field = self.fields[name]
+            try:
+                values.append(self._converter(name)(line[field.start:field.end]))
+            except ValueError:
+                raise ValueError(name)
+        return tuple(values)
+
+    def records(self, path, stats=None, fields=None, where=None, progress=None, start=0, stop=None):
+        """
+        Yield one tuple of converted values per valid record.
+
+        Args:
+            path: File to read
+            stats: ParseStats to add this pass's counts to
+            fields: Field names to convert and yield, in order (default: all)
+            where: {field name: allowed raw byte values} checked before conversion
+            progress: Print a progress line every this many rows
+            start, stop: Byte range to read; start must be a line start (see
+                shard_ranges). Lines starting before stop are read in full.
+        """
+        names = tuple(fields or self.fields)
+        parse, keep = self._compile(names, where)
+        min_length = self.min_length
+        stats = stats if stats is not None else ParseStats()
+
+        size = os.path.getsize(path)
+        stop = size if stop is None else min(stop, size)
+        if start >= stop:
+            return
+        rows = valid = short = filtered = invalid = 0
+        pos = start
+        try:
+            with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                release = hasattr(mmap, 'MADV_DONTNEED')
+                if hasattr(mm, 'madvise'):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                released = start - start % mmap.PAGESIZE
+                mm.seek(start)
+                for line in iter(mm.readline, b''):
+                    if pos >= stop:
+                        break
+                    pos += len(line)
+                    if release and pos - released >= RELEASE_BYTES:
+                        upto = pos - pos % mmap.PAGESIZE
+                        mm.madvise(mmap.MADV_DONTNEED, released, upto - released)
+                        released = upto
+                    rows += 1
+                    if progress and rows % progress == 0:
+                        print(f"    Processed {rows:,} rows, {valid:,} valid...")
+                    line = line.rstrip(b'\r\n')
+                    if len(line) < min_length:
+                        short += 1
+                        continue
+                    if keep is not None and not keep(line):
+                        filtered += 1
+                        continue
+                    try:
+                        values = parse(line)
+                    except ValueError:
+                        try:
+                            values = self._convert_fields(line, names)
+                        except ValueError as e:
+                            stats.invalid_fields[e.args[0]] += 1
+                            invalid += 1
+                            continue
+                    valid += 1
+                    yield values
+        finally:
+            stats.rows += rows
+            stats.valid += valid
+            stats.short += short
+            stats.filtered += filtered
+            stats.invalid += invalid
+
+    def sum_by(self, path, keys, value, stats=None, where=None, workers=1, counts=False,
+               shard_bytes=SHARD_BYTES, progress=None):
+        """
+        Sum one numeric field grouped by other fields: {key tuple: total}.
+
+        With workers > 1 the file is cut into line-aligned shards of about
+        shard_bytes (at least one per worker); each shard is parsed and
+        pre-aggregated in a worker process and the partial sums are merged
+        here as shards finish. A worker only ever holds one shard's groups.
+
+        Args:
+            path: File to read
+            keys: Field names making up the group key, in order
+            value: Name of the field to sum
+            stats: ParseStats to add the counts of every shard to
+            where: As for records()
+            workers: Worker processes; 1 parses in this process
+            counts: Also return {key tuple: valid records}
+            shard_bytes: Target shard size
+            progress: Rows between progress lines (single process only)
+
+        Returns:
+            totals, or (totals, counts) when counts=True
+        """
+        keys = tuple(keys)
+        totals, record_counts = map_shards(path, _sum_shard, (self.name, keys, value, where, counts),
+                                           _merge_sums, stats, workers, shard_bytes, progress)
+        totals = dict(totals)
+        return (totals, dict(record_counts)) if counts else totals
+
+
+def _sum_shard(path, start, stop, layout_name, keys, value, where, counts, progress=None):
+    """Aggregate one byte range (runs in a worker process for Layout.sum_by)."""
+    stats = ParseStats()
+    totals = defaultdict(float)
+    record_counts = Counter()
+    n = len(keys)
+    for values in LAYOUTS[layout_name].records(path, stats, keys + (value,), where, progress, start, stop):
+        key = values[:n]
+        totals[key] += values[n]
+        if counts:
+            record_counts[key] += 1
+    return (totals, record_counts), stats
+
+
+def _merge_sums(base, part):
+    totals, record_counts = base
+    for key, total in part[0].items():
+        totals[key] += total
+    record_counts.update(part[1])
+    return base
+
+
+def map_shards(path, parse_shard, args, merge, stats=None, workers=1, shard_bytes=SHARD_BYTES, progress=None):
+    """
+    Parse a file in line-aligned shards across worker processes and fold the results.
+
+    The file is cut into shards of about shard_bytes (at least one per
+    worker). parse_shard(path, start, stop, *args) runs in a worker for each
+    shard and returns (result, ParseStats); it must be a module-level function
+    so it can be pickled. Results are folded with merge(result, part) in this
+    process as shards finish. With workers <= 1 (or a one-shard file) the whole
+    file is parsed here, with progress lines every `progress` rows.
+
+    Returns:
+        The merged result
+    """
+    stats = stats if stats is not None else ParseStats()
+    shards = shard_ranges(path, max(workers, -(-os.path.getsize(path) // shard_bytes))) if workers > 1 else []
+    if len(shards) <= 1:
+        result, shard_stats = parse_shard(path, 0, None, *args, progress=progress)
+        stats.merge(shard_stats)
+        return result
+
+    result = None
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(parse_shard, path, start, stop, *args) for start, stop in shards]
+        for done, future in enumerate(as_completed(futures), 1):
+            part, shard_stats = future.result()
+            result = part if result is None else merge(result, part)
+            stats.merge(shard_stats)
+            print(f"    Shard {done}/{len(shards)} done: {stats.rows:,} rows, {stats.valid:,} valid...")
+    return result
+
+
+def shard_ranges(path, shards):
+    """Split a file into about `shards` (start, stop) byte ranges that begin at line starts."""
+    size = os.path.getsize(path)
+    if size == 0:
+        return []
+    bounds = [0]
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        for i in range(1, shards):
+            target = max(size * i // shards, bounds[-1])
+            newline = mm.find(b'\n', max(target - 1, 0))
+            if newline == -1:
+                break
+            if newline + 1 > bounds[-1]:
+                bounds.append(newline + 1)
+    bounds.append(size)
+    return [(a, b) for a, b in zip(bounds, bounds[1:]) if a < b]
+
+
+# exp_gph_reports_12*.dat, exp_gph_reports_36*.dat, exp_gph_reports_gtr36*.dat
+GROSS_PRODUCTION = Layout('exp_gph_reports', [
+    Field('month', 275, 277, 'int', bounds=(1, 12)),
+    Field('year', 277, 281, 'int', bounds=(2000, 2030)),
+    # 01=Oil, 03=Condensate, 05=Casinghead Gas, 06=Natural Gas
+    Field('product_code', 283, 285, 'code', choices=('1', '3', '5', '6')),
+    Field('pun_county', 287, 290, 'raw'),
+    Field('pun', 287, 301, 'pun'),
+    Field('pun_key', 287, 301, 'pun_key'),
+    Field('gross_volume', 577, 597, 'decimal'),
+], min_length=599)  # lines under 600 characters with the newline were always skipped
+
+# exp_gplease*.dat (447 chars/line)
+LEASE = Layout('exp_gplease', [
+    Field('county', 0, 50, required=False),
+    Field('pun', 50, 64, 'pun'),
+    # "Legal", "Bottom", "Surface" + sub-quarter
+    Field('legal_description_type', 64, 104, required=False),
+    Field('quarter2p5', 104, 106, required=False),
+    Field('quarter10', 106, 108, required=False),
+    Field('quarter40', 108, 110, required=False),
+    Field('quarter160', 110, 112, required=False),
+    Field('section', 112, 114, 'int', bounds=(1, 36)),
+    Field('township', 114, 117, required=False),
+    Field('range', 117, 122, required=False),
+    # 107=Oil, 108=Gas, 109=Injection, 110=Vertical/Simple
+    Field('well_classification', 122, 132, required=False),
+    Field('well_name', 132, 192, required=False),
+    Field('formation_names', 192, 447, required=False),
+])
+
+# exp_gpqtrat*.dat
+QUALIFYING_TAX_RATE = Layout('exp_gpqtrat', [
+    Field('pun', 0, 14, 'pun'),
+    Field('lease_name', 14, 74, required=False),
+    Field('well_name', 74, 134, required=False),
+    Field('period_start_date', 134, 145, required=False),  # YYYY-MM-DD
+    Field('period_end_date', 145, 156, required=False),    # 9999-12-31 while active
+    Field('rate', 156, 166, 'decimal', required=False),
+], min_length=156)
+
+# exp_gpexempt*.dat
+EXEMPTION = Layout('exp_gpexempt', [
+    Field('pun', 0, 14, 'pun'),
+    Field('exemption_type', 14, 64, required=False),
+    Field('code', 64, 69, required=False),
+    Field('exemption_percentage', 69, 93, 'decimal', required=False),
+], min_length=69)
+
+# exp_gpoper*.dat
+OPERATOR = Layout('exp_gpoper', [
+    # Operator rows with a blank lease or merge number are kept as zero-filled PUNs
+    Field('pun', 0, 14, 'pun', blank_zero=True),
+    Field('operator_number', 14, 21),
+    Field('company_name', 21, None, required=False),
+])
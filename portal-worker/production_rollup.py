@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Compact PUN/month/product rollup of the OTC gross production extracts.
+
+Aggregating with defaultdict(float) keyed by (pun, year_month, product)
+string tuples costs a few hundred bytes of Python objects per group, and
+the 7.7M groups of the gtr36 archive needed an 8 GB machine. Here each group
+is one int64 key:
+
+    key = (pun_key * PERIODS + period) * len(products) + product
+
+where pun_key is the PUN's 14 digits as an integer (otc_fixed_width.pun_key),
+period counts months from January FIRST_YEAR and product indexes the sorted
+output labels. Key order is (PUN, month, product) order, the order the SQL
+batches are written in. Volumes and record counts live in NumPy arrays next
+to the sorted keys (20 bytes per group: int64 key, float64 volume, int32
+count; ~155 MB for gtr36); rows are
+accumulated in compact arrays, reduced by sort + np.add.reduceat in chunks
+of CHUNK_ROWS, merged into the running totals by binary search, and only
+expanded to strings block by block when emitted.
+
+Shards are parsed in worker processes by otc_fixed_width.map_shards(), each
+returning its reduced arrays, which are merged as shards finish.
+
+    rollup = ProductionRollup({'1': 'OIL', '3': 'OIL', '5': 'GAS', '6': 'GAS'}, "{year}-{month:02d}")
+    rollup.add_file(path, stats, workers=8)
+    for (pun, year_month, product), volume in rollup.items():
+        ...
+
+Requires numpy (pip install numpy).
+"""
+
+from array import array
+
+import numpy as np
+
+from otc_fixed_width import GROSS_PRODUCTION, SHARD_BYTES, ParseStats, format_pun_key, map_shards
+
+FIRST_YEAR = 2000  # GROSS_PRODUCTION accepts report years 2000-2030
+PERIODS = 31 * 12
+CHUNK_ROWS = 1_000_000  # rows buffered before a sort/reduce
+EMIT_BLOCK = 100_000  # keys decoded to strings at a time by items()
+
+
+def _reduce(keys, volumes, counts):
+    """Sort by key and sum volumes/counts of equal keys."""
+    if len(keys) == 0:
+        return keys, volumes, counts
+    order = np.argsort(keys)
+    keys, volumes, counts = keys[order], volumes[order], counts[order]
+    starts = np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1])))
+    return keys[starts], np.add.reduceat(volumes, starts), np.add.reduceat(counts, starts)
+
+
+def _merge(base, part):
+    """
+    Merge reduced `part` into reduced `base` (both sorted by unique key).
+
+    Keys already in base are summed in place; only new keys are inserted, so
+    the peak is one extra copy of base rather than a re-sort of both.
+    """
+    keys, volumes, counts = base
+    part_keys, part_volumes, part_counts = part
+    if len(keys) == 0:
+        return part
+    if len(part_keys) == 0:
+        return base
+    at = np.searchsorted(keys, part_keys)
+    found = at < len(keys)
+    found[found] = keys[at[found]] == part_keys[found]
+    volumes[at[found]] += part_volumes[found]
+    counts[at[found]] += part_counts[found]
+    new = ~found
+    if not new.any():
+        return base
+    at = at[new]
+    return (np.insert(keys, at, part_keys[new]), np.insert(volumes, at, part_volumes[new]),
+            np.insert(counts, at, part_counts[new]))
+
+
+def _empty():
+    return np.empty(0, np.int64), np.empty(0, np.float64), np.empty(0, np.int32)
+
+
+def _rollup_shard(path, start, stop, where, product_index, progress=None):
+    """Parse one byte range into reduced (keys, volumes, counts) (runs in a worker process)."""
+    stats = ParseStats()
+    n_products = len(set(product_index.values()))
+    fields = ("pun_key", "year", "month", "product_code", "gross_volume")
+    base = FIRST_YEAR * 12 + 1
+    reduced = _empty()
+    keys, volumes = array('q'), array('d')
+
+    def flush():
+        nonlocal reduced, keys, volumes
+        # _reduce() gathers into new arrays, so the buffers can be viewed rather than copied
+        chunk = _reduce(np.frombuffer(keys, np.int64), np.frombuffer(volumes, np.float64),
+                        np.ones(len(keys), np.int32))
+        keys, volumes = array('q'), array('d')
+        reduced = _merge(reduced, chunk)
+
+    for pun, year, month, product_code, volume in GROSS_PRODUCTION.records(
+            path, stats, fields, where, progress, start, stop):
+        keys.append((pun * PERIODS + year * 12 + month - base) * n_products + product_index[product_code])
+        volumes.append(volume)
+        if len(keys) >= CHUNK_ROWS:
+            flush()
+    flush()
+    return reduced, stats
+
+
+class ProductionRollup:
+    """Gross volume and record count per (PUN, month, product), in sorted NumPy arrays."""
+
+    def __init__(self, products, period_format="{year}{month:02d}"):
+        """
+        Args:
+            products: Product code ('1', '3', '5', '6') -> output label
+            period_format: Output year_month format, with {year} and {month}
+        """
+        self.labels = sorted(set(products.values()))
+        self.product_index = {code: self.labels.index(label) for code, label in products.items()}
+        self.period_labels = [period_format.format(year=FIRST_YEAR + p // 12, month=p % 12 + 1)
+                              for p in range(PERIODS)]
+        self.keys, self.volumes, self.counts = _empty()
+
+    def __len__(self):
+        return len(self.keys)
+
+    def add_file(self, path, stats=None, workers=1, where=None, shard_bytes=SHARD_BYTES, progress=None):
+        """
+        Parse one production extract into the rollup.
+
+        With workers > 1 the file is split into line-aligned shards parsed in
+        worker processes (see otc_fixed_width.map_shards). Returns the number
+        of groups in this file alone.
+        """
+        part = map_shards(path, _rollup_shard, (where, self.product_index), _merge,
+                          stats, workers, shard_bytes, progress)
+        self.keys, self.volumes, self.counts = _merge((self.keys, self.volumes, self.counts), part)
+        return len(part[0])
+
+    def _split(self, keys):
+        """Packed keys -> (pun_key, period, product) arrays."""
+        rest, product = np.divmod(keys, len(self.labels))
+        pun, period = np.divmod(rest, PERIODS)
+        return pun, period, product
+
+    def items(self, start=0, stop=None):
+        """Yield ((pun, year_month, product), gross_volume) in key order, formatting strings per block."""
+        stop = len(self.keys) if stop is None else stop
+        period_labels, labels = self.period_labels, self.labels
+        last_key = last_pun = None
+        for block in range(start, stop, EMIT_BLOCK):
+            keys = self.keys[block:min(block + EMIT_BLOCK, stop)]
+            puns, periods, products = (column.tolist() for column in self._split(keys))
+            volumes = self.volumes[block:block + len(keys)].tolist()
+            for pun, period, product, volume in zip(puns, periods, products, volumes):
+                if pun != last_key:
+                    last_key, last_pun = pun, format_pun_key(pun)
+                yield (last_pun, period_labels[period], labels[product]), volume
+
+    def volume_by_product(self):
+        """{product label: total gross volume}"""
+        totals = np.bincount(self.keys % len(self.labels), weights=self.volumes, minlength=len(self.labels))
+        return dict(zip(self.labels, totals.tolist()))
+
+    def period_range(self):
+        """(first, last) year_month present, or (None, None) when empty."""
+        if not len(self.keys):
+            return None, None
+        periods = self._split(self.keys)[1]
+        return self.period_labels[periods.min()], self.period_labels[periods.max()]
+
+    def pun_count(self):
+        """Number of distinct PUNs."""
+        if not len(self.keys):
+            return 0
+        puns = self.keys // (PERIODS * len(self.labels))
+        return int(np.count_nonzero(puns[1:] != puns[:-1])) + 1
+
+    def records_by_county(self):
+        """{county number ('001'): valid records}"""
+        counties = self.keys // (PERIODS * len(self.labels) * 10 ** 11)
+        found, index = np.unique(counties, return_inverse=True)
+        totals = np.bincount(index, weights=self.counts, minlength=len(found))
+        return {f"{county:03d}": int(total) for county, total in zip(found.tolist(), totals.tolist())}
+
+    def items_for_pun(self, pun):
+        """((pun, year_month, product), gross_volume) for one dashed PUN."""
+        span = PERIODS * len(self.labels)
+        first = int(pun.replace('-', '')) * span
+        start, stop = np.searchsorted(self.keys, [first, first + span])
+        return list(self.items(int(start), int(stop)))
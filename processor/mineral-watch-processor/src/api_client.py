@@ -1,5 +1,6 @@
 """API client for communicating with the documents-worker."""
 
+import asyncio
 import httpx
 import logging
 import tempfile
@@ -10,6 +11,9 @@ from .config import CONFIG
 
 logger = logging.getLogger(__name__)
 
+# Users per POST /api/processing/users/queue-status request (the worker's D1 bind limit)
+QUEUE_STATUS_BATCH_SIZE = 100
+
 
 class APIClient:
     """Client for the documents-worker processing API."""
@@ -18,6 +22,7 @@ class APIClient:
         self.base_url = CONFIG.DOCUMENTS_API_URL.rstrip("/")
         self.headers = {
             "X-API-Key": CONFIG.PROCESSING_API_KEY,
+            "X-Worker-Id": CONFIG.WORKER_ID,
             "Content-Type": "application/json"
         }
     
@@ -38,10 +43,74 @@ class APIClient:
             data = response.json()
             return data.get("documents", [])
     
-    async def download_document(self, doc_id: str, content_type: str = None) -> tuple[str, str]:
+    async def claim_documents(self, capacity: int) -> list[dict]:
+        """
+        Claim up to `capacity` documents under a lease held by this worker.
+
+        Claimed documents must be kept alive with renew_lease() and given back with
+        release_lease(); if this worker dies the lease expires and the queue hands
+        them to another machine.
+        """
+        async with httpx.AsyncClient(timeout=30) as client:
+            response = await client.get(
+                f"{self.base_url}/api/processing/queue",
+                params={
+                    "limit": capacity,
+                    "worker_id": CONFIG.WORKER_ID,
+                    "lease_seconds": CONFIG.LEASE_SECONDS,
+                },
+                headers=self.headers
+            )
+
+            if response.status_code == 404:
+                logger.warning("Processing queue endpoint not found - may need to be implemented")
+                return []
+
+            response.raise_for_status()
+            data = response.json()
+            return data.get("documents", [])
+
+    async def renew_lease(self, doc_id: str) -> Optional[bool]:
+        """
+        Extend this worker's lease on a document.
+
+        Returns:
+            True if renewed, False if the lease was lost (expired and reclaimed,
+            or the document is gone), None if the server has no lease support
+        """
+        async with httpx.AsyncClient(timeout=15) as client:
+            response = await client.post(
+                f"{self.base_url}/api/processing/lease/{doc_id}/heartbeat",
+                headers=self.headers,
+                json={"worker_id": CONFIG.WORKER_ID, "lease_seconds": CONFIG.LEASE_SECONDS}
+            )
+            if response.status_code == 404:
+                return None
+            if response.status_code == 409:
+                return False
+            response.raise_for_status()
+            return True
+
+    async def release_lease(self, doc_id: str, requeue: bool = False) -> None:
+        """Release this worker's lease. requeue=True puts an unfinished document back in the queue."""
+        async with httpx.AsyncClient(timeout=15) as client:
+            response = await client.post(
+                f"{self.base_url}/api/processing/lease/{doc_id}/release",
+                headers=self.headers,
+                json={"worker_id": CONFIG.WORKER_ID, "requeue": requeue}
+            )
+            if response.status_code != 404:
+                response.raise_for_status()
+
+    async def download_document(self, doc_id: str, content_type: str = None, output_dir: str = None) -> tuple[str, str]:
         """
         Download a document from R2 and return local file path and detected content type.
 
+        Args:
+            doc_id: Document ID
+            content_type: Fallback content type when the response doesn't say
+            output_dir: Directory to save into (default: a new temp dir)
+
         Returns:
             tuple: (file_path, content_type)
         """
@@ -88,7 +157,7 @@ class APIClient:
             extension = type_to_ext.get(detected_type, ".pdf")
 
             # Save to temp file with correct extension
-            temp_dir = tempfile.mkdtemp()
+            temp_dir = output_dir or tempfile.mkdtemp()
             file_path = Path(temp_dir) / f"{doc_id}{extension}"
             file_path.write_bytes(file_response.content)
 
@@ -193,6 +262,44 @@ class APIClient:
             except httpx.HTTPStatusError as e:
                 logger.warning(f"Failed to delete OCR cache for {doc_id}: {e}")
 
+    async def save_checkpoint(self, doc_id: str, part: str, payload) -> None:
+        """Mirror one checkpoint stage or chunk ("stage.split", "chunk.3") to R2."""
+        async with httpx.AsyncClient(timeout=30) as client:
+            response = await client.post(
+                f"{self.base_url}/api/processing/checkpoint/{doc_id}/{part}",
+                headers=self.headers,
+                json=payload
+            )
+            response.raise_for_status()
+
+    async def get_checkpoint(self, doc_id: str) -> Optional[dict]:
+        """Get all mirrored checkpoint parts from R2 as {"stages": {...}, "chunks": {...}}. None if none saved."""
+        async with httpx.AsyncClient(timeout=30) as client:
+            try:
+                response = await client.get(
+                    f"{self.base_url}/api/processing/checkpoint/{doc_id}",
+                    headers=self.headers
+                )
+                if response.status_code == 404:
+                    return None
+                response.raise_for_status()
+                return response.json()
+            except httpx.HTTPStatusError:
+                return None
+
+    async def delete_checkpoint(self, doc_id: str) -> None:
+        """Delete every mirrored checkpoint part from R2."""
+        async with httpx.AsyncClient(timeout=30) as client:
+            try:
+                response = await client.delete(
+                    f"{self.base_url}/api/processing/checkpoint/{doc_id}",
+                    headers=self.headers
+                )
+                if response.status_code != 404:
+                    response.raise_for_status()
+            except httpx.HTTPStatusError as e:
+                logger.warning(f"Failed to delete checkpoint for {doc_id}: {e}")
+
     async def get_user_info(self, user_id: str) -> Optional[dict]:
         """Get user info for notifications."""
         async with httpx.AsyncClient(timeout=30) as client:
@@ -219,3 +326,31 @@ class APIClient:
                 return response.json()
             except httpx.HTTPStatusError:
                 return {"queued": 0, "processing": 0}
+
+    async def get_users_queue_status(self, user_ids: list[str]) -> dict[str, dict]:
+        """
+        Queue status for several users in one request.
+
+        Returns:
+            {user_id: {"queued": n, "processing": n}}. Users are sent
+            QUEUE_STATUS_BATCH_SIZE per request. Falls back to one
+            get_user_queue_status() call per user on workers without the batch route.
+        """
+        user_ids = list(user_ids)
+        statuses = {}
+        async with httpx.AsyncClient(timeout=30) as client:
+            for start in range(0, len(user_ids), QUEUE_STATUS_BATCH_SIZE):
+                batch = user_ids[start:start + QUEUE_STATUS_BATCH_SIZE]
+                response = await client.post(
+                    f"{self.base_url}/api/processing/users/queue-status",
+                    headers=self.headers,
+                    json={"user_ids": batch}
+                )
+                if response.status_code == 404:
+                    break
+                response.raise_for_status()
+                statuses.update(response.json().get("statuses", {}))
+            else:
+                return statuses
+        fallback = await asyncio.gather(*(self.get_user_queue_status(u) for u in user_ids))
+        return dict(zip(user_ids, fallback))
@@ -0,0 +1,396 @@
+"""
+Offline replay benchmark for the extraction pipeline.
+
+Runs process_document() (or extract_document_data() alone) over a corpus of
+PDFs/images against a local fake Anthropic API (src.fake_anthropic) and a local
+fake documents-worker (src.mock_worker), both started in-process. Nothing
+touches the live API or R2, so runs are repeatable and comparable across commits.
+
+Usage:
+    # one-off: synthetic corpus (multi-doc bundle, scan, phone photo, 1002A form)
+    python -m src.benchmark --generate-corpus bench/corpus
+
+    python -m src.benchmark --corpus bench/corpus --recordings bench/recordings.jsonl \\
+        --latency-ms 800 --latency-per-image-ms 40 --rate-429 0.05 --output bench/results.json
+
+Corpus categories come from corpus.json ({"documents": [{"file": ..., "category": ...}]})
+if present, otherwise from the filename prefix before the first "-" (e.g. "scan-deed.pdf").
+
+Reported: pages/sec, docs/min, p50/p95 document latency, CPU seconds per page
+(including pdftoppm/tesseract child processes), peak RSS, and API tokens per
+document — overall and per category — as JSON.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import resource
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+SUPPORTED_SUFFIXES = (".pdf", ".jpg", ".jpeg", ".png", ".tif", ".tiff")
+RSS_SAMPLE_SECONDS = 0.2
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile (0 for an empty list)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, int(round(pct / 100 * len(ordered) + 0.5)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def load_corpus(corpus_dir: Path) -> list[dict]:
+    """List corpus files with their category."""
+    manifest = corpus_dir / "corpus.json"
+    if manifest.exists():
+        entries = json.loads(manifest.read_text())["documents"]
+        return [{"path": corpus_dir / e["file"], "category": e.get("category", "other")} for e in entries]
+    return [
+        {"path": p, "category": p.stem.split("-")[0] if "-" in p.stem else "other"}
+        for p in sorted(corpus_dir.iterdir()) if p.suffix.lower() in SUPPORTED_SUFFIXES
+    ]
+
+
+def _child_cpu_seconds() -> float:
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
+
+
+def _peak_rss_bytes() -> int:
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return maxrss if platform.system() == "Darwin" else maxrss * 1024  # KB on Linux
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except Exception:
+        return "unknown"
+
+
+# =============================================================================
+# SYNTHETIC CORPUS
+# =============================================================================
+
+DEED_TEXT = """MINERAL DEED
+
+KNOW ALL MEN BY THESE PRESENTS: That {grantor}, Grantor, for and in consideration
+of Ten Dollars and other valuable consideration, does hereby grant, bargain, sell and
+convey unto {grantee}, Grantee, an undivided {fraction} interest in and to all of the
+oil, gas and other minerals in and under the following described land in
+{county} County, Oklahoma:
+
+    The {quarter} of Section {section}, Township {township}, Range {range}
+
+Page {page} of {pages}
+"""
+
+DIVISION_ORDER_TEXT = """DIVISION ORDER
+
+Operator: BENCHMARK OPERATING LLC          Property No. {section}-{township}
+Well: SMITH {section}-{range}H            County: {county}
+
+The undersigned certifies the ownership of their decimal interest in production
+from the property described above.
+
+Owner: {grantee}    Interest Type: RI    Decimal Interest: 0.00390625
+
+Page {page} of {pages}
+"""
+
+COMPLETION_TEXT = """OKLAHOMA CORPORATION COMMISSION        FORM 1002A
+COMPLETION REPORT                      Rev. 2021
+
+API NO. 35-051-2{section}44          OTC PROD. UNIT NO. 051-2{section}44-0-0000
+Well Name: SMITH {section}-{range}H    Operator: BENCHMARK OPERATING LLC
+Location: Section {section} Township {township} Range {range}   County: {county}
+Spud Date: 01/05/2024   Drilling Finished: 02/11/2024   First Production: 04/02/2024
+Formation: WOODFORD   Perforated Interval: 12,450 - 21,980
+Initial Test: Oil 412 BBL/D  Gas 2,850 MCF/D  Water 1,100 BBL/D
+
+Page {page} of {pages}
+"""
+
+
+def _fields(i: int, page: int, pages: int) -> dict:
+    return {
+        "grantor": f"JOHN Q. OWNER {i}", "grantee": f"MINERAL BUYER {i} LLC", "fraction": "1/8",
+        "county": ["Grady", "Canadian", "Kingfisher"][i % 3], "quarter": "NE/4",
+        "section": str(3 + i), "township": f"{10 + i}N", "range": f"{5 + i}W",
+        "page": page, "pages": pages,
+    }
+
+
+def _render_text_page(text: str, width: int = 1275, height: int = 1650, noise: bool = False):
+    """Letter page at 150 DPI with the text drawn on it (a 'scan' has no text layer)."""
+    from PIL import Image, ImageDraw, ImageFilter
+    import random
+
+    page = Image.new("L", (width, height), 255)
+    draw = ImageDraw.Draw(page)
+    y = 120
+    for line in text.splitlines():
+        draw.text((110, y), line, fill=0)
+        y += 28
+    if noise:
+        rng = random.Random(len(text))
+        for _ in range(4000):
+            page.putpixel((rng.randrange(width), rng.randrange(height)), rng.randrange(120, 255))
+        page = page.rotate(0.7, fillcolor=255).filter(ImageFilter.GaussianBlur(0.6))
+    return page
+
+
+def generate_corpus(corpus_dir: Path) -> None:
+    """Write a small representative corpus (needs PyMuPDF and Pillow)."""
+    import io
+    import fitz  # PyMuPDF
+
+    corpus_dir.mkdir(parents=True, exist_ok=True)
+
+    def text_pdf(pages: list[str], path: Path) -> None:
+        pdf = fitz.open()
+        for text in pages:
+            page = pdf.new_page(width=612, height=792)
+            page.insert_text((54, 72), text, fontsize=10)
+        pdf.save(str(path))
+        pdf.close()
+
+    def image_pdf(images, path: Path) -> None:
+        pdf = fitz.open()
+        for image in images:
+            buffer = io.BytesIO()
+            image.save(buffer, format="JPEG", quality=80)
+            page = pdf.new_page(width=612, height=792)
+            page.insert_image(page.rect, stream=buffer.getvalue())
+        pdf.save(str(path))
+        pdf.close()
+
+    # Multi-document bundle: three deeds and a division order, with text layer
+    bundle = []
+    for i in range(3):
+        bundle += [DEED_TEXT.format(**_fields(i, p, 2)) for p in (1, 2)]
+    bundle += [DIVISION_ORDER_TEXT.format(**_fields(3, 1, 1))]
+    text_pdf(bundle, corpus_dir / "multi_doc-bundle.pdf")
+
+    # Scanned deed: image-only pages with noise and skew (forces OCR)
+    image_pdf([_render_text_page(DEED_TEXT.format(**_fields(4, p, 3)), noise=True) for p in (1, 2, 3)],
+              corpus_dir / "scan-deed.pdf")
+
+    # Phone photo: one page, off-white background, rotated, as a JPEG upload
+    from PIL import Image
+    photo = _render_text_page(DEED_TEXT.format(**_fields(5, 1, 1)), noise=True).convert("RGB")
+    background = Image.new("RGB", (1500, 2000), (92, 84, 70))
+    background.paste(photo.rotate(-4, expand=True, fillcolor=(92, 84, 70)), (80, 120))
+    background.save(corpus_dir / "phone-photo.jpg", quality=82)
+
+    # OCC 1002A completion report
+    text_pdf([COMPLETION_TEXT.format(**_fields(6, p, 2)) for p in (1, 2)], corpus_dir / "1002a-completion.pdf")
+
+    (corpus_dir / "corpus.json").write_text(json.dumps({"documents": [
+        {"file": "multi_doc-bundle.pdf", "category": "multi_doc"},
+        {"file": "scan-deed.pdf", "category": "scan"},
+        {"file": "phone-photo.jpg", "category": "phone_photo"},
+        {"file": "1002a-completion.pdf", "category": "1002a"},
+    ]}, indent=2))
+    logger.info(f"Wrote synthetic corpus to {corpus_dir}")
+
+
+# =============================================================================
+# RUNNER
+# =============================================================================
+
+async def _start_site(app, port: int):
+    from aiohttp import web
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", port).start()
+    return runner
+
+
+async def run_benchmark(args) -> dict:
+    """Run the corpus through the pipeline against local fakes and collect metrics."""
+    corpus = load_corpus(Path(args.corpus))
+    if not corpus:
+        raise SystemExit(f"No documents found in {args.corpus}")
+
+    # Point the pipeline at the fakes before anything reads CONFIG or builds the API client
+    os.environ["ANTHROPIC_BASE_URL"] = f"http://127.0.0.1:{args.anthropic_port}"
+    os.environ.setdefault("ANTHROPIC_API_KEY", "benchmark")
+    os.environ["DOCUMENTS_API_URL"] = f"http://127.0.0.1:{args.worker_port}"
+    os.environ["PROCESSING_API_KEY"] = "benchmark"
+    os.environ["CHECKPOINT_DIR"] = tempfile.mkdtemp(prefix="mw-bench-")
+    os.environ["CHECKPOINT_MIRROR"] = "0"
+
+    from .fake_anthropic import FakeAnthropic
+    from .mock_worker import MockQueue, create_app
+
+    fake = FakeAnthropic(args.recordings, args.latency_ms, args.latency_per_image_ms,
+                         args.rate_429, seed=args.seed)
+    queue = MockQueue([entry["path"] for entry in corpus])
+    runners = [await _start_site(fake.create_app(), args.anthropic_port),
+               await _start_site(create_app(queue, "benchmark"), args.worker_port)]
+
+    from . import extractor
+    from .api_client import APIClient
+    from .main import process_document
+    from .memory_governor import current_rss_bytes
+    from .pdf_converter import convert_pdf_to_images, get_pdf_page_count
+
+    if args.no_batch_delay:
+        extractor.BATCH_DELAY_SECONDS = 0
+
+    client = APIClient()
+    doc_ids = {entry["path"]: doc_id for doc_id, doc in queue.docs.items() for entry in corpus
+               if doc["path"] == entry["path"]}
+
+    peak_rss = current_rss_bytes()
+    sampling = True
+
+    async def sample_rss():
+        nonlocal peak_rss
+        while sampling:
+            peak_rss = max(peak_rss, current_rss_bytes())
+            await asyncio.sleep(RSS_SAMPLE_SECONDS)
+
+    async def run_one(entry: dict) -> dict:
+        path = entry["path"]
+        pages = (await get_pdf_page_count(str(path)) or 1) if path.suffix.lower() == ".pdf" else 1
+        start = time.perf_counter()
+        if args.mode == "extract":
+            if path.suffix.lower() == ".pdf":
+                image_paths = await convert_pdf_to_images(str(path))
+                result = await extractor.extract_document_data(image_paths, pdf_path=str(path))
+            else:
+                result = await extractor.extract_document_data([str(path)], flexible_pipeline=True)
+            status = "failed" if result.get("error") else "complete"
+        else:
+            doc = {k: v for k, v in queue.docs[doc_ids[path]].items() if k not in ("path", "lease_expires_at")}
+            result = await process_document(client, doc)
+            status = result.get("status")
+        return {"file": path.name, "category": entry["category"], "pages": pages,
+                "latency_s": round(time.perf_counter() - start, 3), "status": status}
+
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def bounded(entry):
+        async with semaphore:
+            return await run_one(entry)
+
+    sampler = asyncio.create_task(sample_rss())
+    cpu_start, children_start = time.process_time(), _child_cpu_seconds()
+    wall_start = time.perf_counter()
+    try:
+        documents = []
+        for _ in range(args.iterations):
+            documents += await asyncio.gather(*(bounded(entry) for entry in corpus))
+    finally:
+        wall = time.perf_counter() - wall_start
+        cpu = (time.process_time() - cpu_start) + (_child_cpu_seconds() - children_start)
+        sampling = False
+        await sampler
+        for runner in runners:
+            await runner.cleanup()
+
+    def summarize(docs: list[dict], cpu_share: float, wall_s: float) -> dict:
+        pages = sum(d["pages"] for d in docs)
+        latencies = [d["latency_s"] for d in docs]
+        return {
+            "documents": len(docs),
+            "pages": pages,
+            "failed": sum(1 for d in docs if d["status"] == "failed"),
+            "pages_per_sec": round(pages / wall_s, 3) if wall_s else None,
+            "docs_per_min": round(len(docs) / wall_s * 60, 3) if wall_s else None,
+            "latency_p50_s": percentile(latencies, 50),
+            "latency_p95_s": percentile(latencies, 95),
+            "cpu_s_per_page": round(cpu_share / pages, 4) if pages else None,
+        }
+
+    total_latency = sum(d["latency_s"] for d in documents) or 1.0
+    by_category = {}
+    for category in sorted({d["category"] for d in documents}):
+        docs = [d for d in documents if d["category"] == category]
+        share = sum(d["latency_s"] for d in docs) / total_latency
+        # Per-category CPU/throughput are attributed by share of document latency
+        by_category[category] = summarize(docs, cpu * share, wall * share)
+
+    totals = summarize(documents, cpu, wall)
+    totals.update({
+        "wall_s": round(wall, 3),
+        "cpu_s": round(cpu, 3),
+        "peak_rss_mb": round(max(peak_rss, _peak_rss_bytes()) / (1024 * 1024), 1),
+        "api_calls": fake.stats["calls"],
+        "input_tokens_per_doc": round(fake.stats["input_tokens"] / len(documents), 1),
+        "output_tokens_per_doc": round(fake.stats["output_tokens"] / len(documents), 1),
+        "injected_429": fake.stats["injected_429"],
+        "unrecorded_calls": fake.stats["unrecorded"],
+    })
+
+    return {
+        "commit": _git_commit(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "python": platform.python_version(),
+        "settings": {
+            "mode": args.mode, "corpus": str(args.corpus), "iterations": args.iterations,
+            "concurrency": args.concurrency, "latency_ms": args.latency_ms,
+            "latency_per_image_ms": args.latency_per_image_ms, "rate_429": args.rate_429,
+            "no_batch_delay": args.no_batch_delay, "recordings": args.recordings,
+        },
+        "totals": totals,
+        "by_category": by_category,
+        "documents": documents,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline extraction pipeline benchmark")
+    parser.add_argument("--corpus", help="Directory of PDFs/images (see module docstring)")
+    parser.add_argument("--generate-corpus", metavar="DIR", help="Write the synthetic corpus to DIR and exit")
+    parser.add_argument("--mode", choices=("process", "extract"), default="process",
+                        help="process_document() end to end, or extract_document_data() only")
+    parser.add_argument("--recordings", help="Recorded API responses (JSONL from src.fake_anthropic --record)")
+    parser.add_argument("--latency-ms", type=float, default=500)
+    parser.add_argument("--latency-per-image-ms", type=float, default=30)
+    parser.add_argument("--rate-429", type=float, default=0.0)
+    parser.add_argument("--iterations", type=int, default=1)
+    parser.add_argument("--concurrency", type=int, default=1, help="Documents in flight at once")
+    parser.add_argument("--no-batch-delay", action="store_true", help="Skip the fixed delay between chunks")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for 429 injection")
+    parser.add_argument("--anthropic-port", type=int, default=8788)
+    parser.add_argument("--worker-port", type=int, default=8787)
+    parser.add_argument("--output", help="Write JSON results here (default: stdout)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    logger.setLevel(logging.INFO)
+
+    if args.generate_corpus:
+        generate_corpus(Path(args.generate_corpus))
+        return
+    if not args.corpus:
+        parser.error("--corpus is required")
+
+    results = asyncio.run(run_benchmark(args))
+    output = json.dumps(results, indent=2)
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.output).write_text(output)
+        t = results["totals"]
+        print(f"{t['documents']} docs / {t['pages']} pages: {t['pages_per_sec']} pages/s, "
+              f"{t['docs_per_min']} docs/min, p50 {t['latency_p50_s']}s, p95 {t['latency_p95_s']}s, "
+              f"peak RSS {t['peak_rss_mb']} MB -> {args.output}")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
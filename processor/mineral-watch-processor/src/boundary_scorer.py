@@ -0,0 +1,281 @@
+"""
+Local adjacent-page boundary scorer.
+
+CPU-only model that compares each pair of adjacent pages and estimates the
+probability that the second page starts a new document. Features:
+- TF-IDF cosine and word-shingle Jaccard similarity of the page text
+- Header/footer fingerprint changes (first/last lines with digits masked)
+- "Page X of Y" continuity
+- Recording-stamp continuity (instrument/document/order numbers, book/page)
+- Image layout hash distance (difference hash of a tiny grayscale render)
+
+Text similarity alone is ambiguous (a bundle of deeds on the same printed form
+looks alike across boundaries), so a pair is only *decided* when at least one
+structural signal (page numbering or a recording stamp) backs the score.
+Everything else is reported as "uncertain" and left to visual detection.
+
+Identifiers and book/page stamps are only read from the page margins (the first
+ID_HEADER_LINES and last ID_FOOTER_LINES lines), where stamps and running
+headers are printed. Body text routinely cites other orders and instruments
+("as amended by Order No. ...", "recorded in Book 512, Page 33") and must not
+decide a boundary.
+"""
+
+import logging
+import math
+import re
+from collections import Counter
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Decision thresholds on the boundary probability
+START_THRESHOLD = 0.9
+CONTINUATION_THRESHOLD = 0.1
+
+# Hand-tuned logistic weights (positive = evidence for a new document)
+WEIGHTS = {
+    "bias": -1.0,
+    "text_cosine": -2.0,
+    "shingle_jaccard": -1.5,
+    "header_changed": 1.2,
+    "footer_changed": 0.6,
+    "layout_distance": 2.5,
+    "page_numbering_continues": -6.0,
+    "page_numbering_restarts": 5.0,
+    "same_instrument": -4.0,
+    "different_instrument": 4.0,
+    "stamp_non_sequential": 2.5,
+}
+
+MIN_TEXT_CHARS = 20  # Pages below this have no usable text features
+SHINGLE_SIZE = 3
+HEADER_FOOTER_LINES = 2
+ID_HEADER_LINES = 6  # Margin lines searched for instrument identifiers and book/page stamps
+ID_FOOTER_LINES = 3
+
+PAGE_X_OF_Y_PATTERN = re.compile(r"\bPage\s+(\d{1,3})\s+of\s+(\d{1,3})\b", re.IGNORECASE)
+BOOK_PAGE_PATTERN = re.compile(r"\bBOOK\s*[:#]?\s*(\d{1,6})\s*,?\s*PAGE\s*[:#]?\s*(\d{1,6})", re.IGNORECASE)
+
+# Identifiers printed in the margins of every page of one instrument. Compared kind-for-kind.
+INSTRUMENT_ID_PATTERNS = [
+    ("instrument", re.compile(r"\b(?:DOCUMENT|INSTRUMENT|RECEPTION|DOC)\s*(?:NO\.?|NUMBER|#)\s*[:\-]?\s*(\d[\d\-]{3,})", re.IGNORECASE)),
+    ("order", re.compile(r"\bORDER\s+NO\.?\s*[:\-]?\s*(\d{4,})", re.IGNORECASE)),
+    ("cause", re.compile(r"\bCAUSE\s+(?:CD\s+)?NO\.?\s*[:\-]?\s*((?:CD\s*)?\d[\d\-]{5,})", re.IGNORECASE)),
+    ("property", re.compile(r"\bProperty\s*#\s*[:\s]*(\d{5,7})", re.IGNORECASE)),
+]
+
+_TOKEN_PATTERN = re.compile(r"[a-z]{3,}")
+_DIGITS_PATTERN = re.compile(r"\d+")
+
+
+# ----------------------------------------------------------------------------
+# Per-page features
+# ----------------------------------------------------------------------------
+
+def _tokens(text: str) -> list[str]:
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+def _shingles(tokens: list[str]) -> set:
+    if len(tokens) < SHINGLE_SIZE:
+        return set(tokens)
+    return {hash(tuple(tokens[i:i + SHINGLE_SIZE])) for i in range(len(tokens) - SHINGLE_SIZE + 1)}
+
+
+def _fingerprint(lines: list[str]) -> str:
+    """Header/footer fingerprint: lines uppercased with digits masked (page numbers vary)."""
+    return "|".join(_DIGITS_PATTERN.sub("#", line.upper()) for line in lines)
+
+
+def _margin_text(lines: list[str]) -> str:
+    """The header/footer margin lines, where recording stamps are printed."""
+    if len(lines) > ID_HEADER_LINES + ID_FOOTER_LINES:
+        lines = lines[:ID_HEADER_LINES] + lines[-ID_FOOTER_LINES:]
+    return "\n".join(lines)
+
+
+def _instrument_ids(margin: str) -> dict:
+    """Identifiers found in the margin text only (not body citations)."""
+    ids = {}
+    for kind, pattern in INSTRUMENT_ID_PATTERNS:
+        match = pattern.search(margin)
+        if match:
+            ids[kind] = re.sub(r"[\s\-]", "", match.group(1))
+    return ids
+
+
+def layout_hash(image_path: str) -> Optional[int]:
+    """64-bit difference hash of a page image (9x8 grayscale). None if unreadable."""
+    try:
+        from PIL import Image
+        with Image.open(image_path) as img:
+            img.draft("L", (img.width // 8, img.height // 8))  # JPEG fast-path decode
+            small = img.convert("L").resize((9, 8), Image.Resampling.BILINEAR)
+            pixels = list(small.getdata())
+    except Exception as e:
+        logger.debug(f"layout_hash failed for {image_path}: {e}")
+        return None
+
+    bits = 0
+    for row in range(8):
+        for col in range(8):
+            bits = (bits << 1) | (pixels[row * 9 + col] > pixels[row * 9 + col + 1])
+    return bits
+
+
+def _page_features(text: str) -> dict:
+    text = text or ""
+    lines = [line.strip() for line in text.splitlines() if line.strip()]
+    tokens = _tokens(text)
+    page_x_of_y = PAGE_X_OF_Y_PATTERN.search(text)
+    margin = _margin_text(lines)
+    book_page = BOOK_PAGE_PATTERN.search(margin)
+    return {
+        "has_text": len(text.strip()) >= MIN_TEXT_CHARS,
+        "tokens": tokens,
+        "shingles": _shingles(tokens),
+        "header": _fingerprint(lines[:HEADER_FOOTER_LINES]),
+        "footer": _fingerprint(lines[-HEADER_FOOTER_LINES:]),
+        "page_x_of_y": (int(page_x_of_y.group(1)), int(page_x_of_y.group(2))) if page_x_of_y else None,
+        "book_page": (int(book_page.group(1)), int(book_page.group(2))) if book_page else None,
+        "instrument_ids": _instrument_ids(margin),
+    }
+
+
+def _tfidf_vectors(token_lists: list[list[str]]) -> list[dict]:
+    """L2-normalized TF-IDF vectors, IDF computed over the pages of this PDF."""
+    doc_freq = Counter()
+    for tokens in token_lists:
+        doc_freq.update(set(tokens))
+    n = len(token_lists)
+    idf = {term: math.log((n + 1) / (df + 1)) + 1.0 for term, df in doc_freq.items()}
+
+    vectors = []
+    for tokens in token_lists:
+        tf = Counter(tokens)
+        vec = {term: count * idf[term] for term, count in tf.items()}
+        norm = math.sqrt(sum(v * v for v in vec.values())) or 1.0
+        vectors.append({term: v / norm for term, v in vec.items()})
+    return vectors
+
+
+def _cosine(a: dict, b: dict) -> float:
+    if len(a) > len(b):
+        a, b = b, a
+    return sum(v * b.get(term, 0.0) for term, v in a.items())
+
+
+# ----------------------------------------------------------------------------
+# Pair scoring
+# ----------------------------------------------------------------------------
+
+def _pair_features(prev: dict, cur: dict, prev_vec: dict, cur_vec: dict,
+                   prev_hash: Optional[int], cur_hash: Optional[int]) -> tuple[dict, list[str]]:
+    features = {}
+    structural = []
+
+    if prev["has_text"] and cur["has_text"]:
+        features["text_cosine"] = round(_cosine(prev_vec, cur_vec), 3)
+        union = prev["shingles"] | cur["shingles"]
+        features["shingle_jaccard"] = round(len(prev["shingles"] & cur["shingles"]) / len(union), 3) if union else 0.0
+        features["header_changed"] = float(prev["header"] != cur["header"])
+        features["footer_changed"] = float(prev["footer"] != cur["footer"])
+
+    if prev_hash is not None and cur_hash is not None:
+        features["layout_distance"] = round(bin(prev_hash ^ cur_hash).count("1") / 64, 3)
+
+    # "Page X of Y" continuity
+    cur_xy = cur["page_x_of_y"]
+    prev_xy = prev["page_x_of_y"]
+    if cur_xy:
+        if cur_xy[0] == 1 and cur_xy[1] > 1:
+            features["page_numbering_restarts"] = 1.0
+            structural.append("page_1_of_n")
+        elif prev_xy and cur_xy[0] == prev_xy[0] + 1 and cur_xy[1] == prev_xy[1]:
+            features["page_numbering_continues"] = 1.0
+            structural.append("page_x_of_y_continues")
+
+    # Recording-stamp continuity — compare identifiers of the same kind
+    shared_kinds = set(prev["instrument_ids"]) & set(cur["instrument_ids"])
+    if shared_kinds:
+        if any(prev["instrument_ids"][k] != cur["instrument_ids"][k] for k in shared_kinds):
+            features["different_instrument"] = 1.0
+            structural.append("different_instrument")
+        else:
+            features["same_instrument"] = 1.0
+            structural.append("same_instrument")
+
+    if prev["book_page"] and cur["book_page"]:
+        prev_book, prev_page = prev["book_page"]
+        cur_book, cur_page = cur["book_page"]
+        # Sequential stamps (same book, next page) occur both inside one instrument and
+        # across consecutively recorded instruments, so only a break is informative.
+        if cur_book != prev_book or cur_page not in (prev_page, prev_page + 1):
+            features["stamp_non_sequential"] = 1.0
+            structural.append("stamp_non_sequential")
+
+    return features, structural
+
+
+def _probability(features: dict) -> float:
+    z = WEIGHTS["bias"] + sum(WEIGHTS[name] * value for name, value in features.items())
+    return 1.0 / (1.0 + math.exp(-z))
+
+
+def score_page_boundaries(page_texts: list[str], image_paths: list[str] = None) -> dict:
+    """
+    Score every adjacent page pair for a document boundary.
+
+    Args:
+        page_texts: Text per page (PyMuPDF and/or Tesseract OCR)
+        image_paths: Optional page images for layout hashing (same order)
+
+    Returns:
+        dict with:
+        - pairs: one entry per page index 1..N-1 with probability, decision
+          ("start" | "continuation" | "uncertain"), structural signals and features
+        - all_confident: True when every pair was decided
+        - decided / uncertain: counts
+    """
+    total_pages = len(page_texts or [])
+    if total_pages < 2:
+        return {"pairs": [], "all_confident": total_pages == 1, "decided": 0, "uncertain": 0}
+
+    pages = [_page_features(text) for text in page_texts]
+    vectors = _tfidf_vectors([p["tokens"] for p in pages])
+    hashes = [None] * total_pages
+    if image_paths and len(image_paths) == total_pages:
+        hashes = [layout_hash(path) for path in image_paths]
+
+    pairs = []
+    for idx in range(1, total_pages):
+        features, structural = _pair_features(
+            pages[idx - 1], pages[idx], vectors[idx - 1], vectors[idx], hashes[idx - 1], hashes[idx])
+        probability = _probability(features)
+
+        decision = "uncertain"
+        if structural:
+            if probability >= START_THRESHOLD:
+                decision = "start"
+            elif probability <= CONTINUATION_THRESHOLD:
+                decision = "continuation"
+
+        pairs.append({
+            "page_index": idx,
+            "probability": round(probability, 3),
+            "decision": decision,
+            "structural": structural,
+            "features": features,
+        })
+
+    uncertain = sum(1 for p in pairs if p["decision"] == "uncertain")
+    starts = [p["page_index"] for p in pairs if p["decision"] == "start"]
+    logger.info(f"Local boundary scorer: {len(pairs) - uncertain}/{len(pairs)} boundaries decided, "
+                f"starts at pages {starts}, {uncertain} uncertain")
+    return {
+        "pairs": pairs,
+        "all_confident": uncertain == 0,
+        "decided": len(pairs) - uncertain,
+        "uncertain": uncertain,
+    }
@@ -0,0 +1,236 @@
+"""
+Crash-safe extraction checkpoints.
+
+A multi-document PDF can take many minutes and dozens of API calls. Each stage
+(download, render, split) and each extracted chunk is journaled as it completes,
+so a worker that is restarted or redeployed mid-document resumes where it
+stopped instead of paying for the whole document again.
+
+The journal is a local SQLite file under CONFIG.CHECKPOINT_DIR, next to a per-
+document work directory holding the downloaded file and page images. With
+CONFIG.CHECKPOINT_MIRROR each JSON stage and chunk is also copied to the
+documents-worker (R2) as it is written - one object per part, so a chunk costs
+one small upload - and another machine can pick the split and finished chunks
+back up. On Fly.io CHECKPOINT_DIR sits on a volume (see fly.toml) so the local
+journal survives deploys and restarts of the same machine.
+
+Graceful drain: on SIGTERM main.py calls request_drain(). The main loop stops
+claiming work and extract_document_data raises DrainRequested between chunks,
+leaving the journal in place for the next run.
+"""
+
+import json
+import logging
+import shutil
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from .config import CONFIG
+
+logger = logging.getLogger(__name__)
+
+# Checkpoints older than this are abandoned work (doc deleted, failed elsewhere)
+CHECKPOINT_MAX_AGE_SECONDS = 3 * 24 * 3600
+
+_drain_event = threading.Event()
+
+
+class DrainRequested(Exception):
+    """Raised between chunks when the worker is shutting down; progress is checkpointed."""
+
+
+def request_drain() -> None:
+    """Ask the worker to stop claiming new work and wind down in-flight documents."""
+    if not _drain_event.is_set():
+        logger.warning("Drain requested - finishing in-flight work, no new documents will be claimed")
+    _drain_event.set()
+
+
+def is_draining() -> bool:
+    return _drain_event.is_set()
+
+
+class CheckpointJournal:
+    """SQLite journal of completed stages and chunks, keyed by document ID."""
+
+    def __init__(self, root: str = None):
+        self.root = Path(root or CONFIG.CHECKPOINT_DIR)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.root / "journal.sqlite3"), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS stages (
+                doc_id TEXT NOT NULL,
+                stage TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (doc_id, stage)
+            );
+            CREATE TABLE IF NOT EXISTS chunks (
+                doc_id TEXT NOT NULL,
+                chunk_index INTEGER NOT NULL,
+                result TEXT NOT NULL,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (doc_id, chunk_index)
+            );
+        """)
+        self._conn.commit()
+
+    def work_dir(self, doc_id: str) -> Path:
+        """Per-document directory for the download and page images (survives restarts)."""
+        path = self.root / "work" / doc_id
+        path.mkdir(parents=True, exist_ok=True)
+        return path
+
+    def load(self, doc_id: str) -> dict:
+        """
+        Load everything journaled for a document.
+
+        Returns:
+            {"stages": {stage: payload}, "chunks": {chunk_index: [documents]}}
+        """
+        with self._lock:
+            stages = self._conn.execute(
+                "SELECT stage, payload FROM stages WHERE doc_id = ?", (doc_id,)).fetchall()
+            chunks = self._conn.execute(
+                "SELECT chunk_index, result FROM chunks WHERE doc_id = ?", (doc_id,)).fetchall()
+        return {
+            "stages": {stage: json.loads(payload) for stage, payload in stages},
+            "chunks": {index: json.loads(result) for index, result in chunks},
+        }
+
+    def put_stage(self, doc_id: str, stage: str, payload: dict) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO stages (doc_id, stage, payload, updated_at) VALUES (?, ?, ?, ?)",
+                (doc_id, stage, json.dumps(payload, default=str), time.time()))
+            self._conn.commit()
+
+    def put_chunk(self, doc_id: str, chunk_index: int, documents: list) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO chunks (doc_id, chunk_index, result, updated_at) VALUES (?, ?, ?, ?)",
+                (doc_id, chunk_index, json.dumps(documents, default=str), time.time()))
+            self._conn.commit()
+
+    def clear(self, doc_id: str) -> None:
+        """Drop a document's journal entries and work directory."""
+        with self._lock:
+            self._conn.execute("DELETE FROM stages WHERE doc_id = ?", (doc_id,))
+            self._conn.execute("DELETE FROM chunks WHERE doc_id = ?", (doc_id,))
+            self._conn.commit()
+        shutil.rmtree(self.root / "work" / doc_id, ignore_errors=True)
+
+    def prune(self, max_age_seconds: int = CHECKPOINT_MAX_AGE_SECONDS) -> int:
+        """Clear documents whose newest checkpoint is older than max_age_seconds. Returns count."""
+        cutoff = time.time() - max_age_seconds
+        with self._lock:
+            rows = self._conn.execute("""
+                SELECT doc_id FROM (
+                    SELECT doc_id, updated_at FROM stages UNION ALL SELECT doc_id, updated_at FROM chunks
+                ) GROUP BY doc_id HAVING MAX(updated_at) < ?
+            """, (cutoff,)).fetchall()
+        for (doc_id,) in rows:
+            self.clear(doc_id)
+        return len(rows)
+
+
+_journal: Optional[CheckpointJournal] = None
+
+
+def get_journal() -> CheckpointJournal:
+    """Process-wide journal, opened on first use."""
+    global _journal
+    if _journal is None:
+        _journal = CheckpointJournal()
+        pruned = _journal.prune()
+        if pruned:
+            logger.info(f"Pruned {pruned} stale checkpoint(s)")
+    return _journal
+
+
+class DocumentCheckpoint:
+    """
+    Checkpoint handle for one document, passed down through the pipeline.
+
+    Reads come from an in-memory copy of the journal; writes go to SQLite first
+    and are then mirrored to the documents-worker when CONFIG.CHECKPOINT_MIRROR is on.
+    """
+
+    def __init__(self, journal: CheckpointJournal, doc_id: str, client=None, state: dict = None):
+        self.journal = journal
+        self.doc_id = doc_id
+        self.client = client
+        self.state = state or {"stages": {}, "chunks": {}}
+
+    @classmethod
+    async def open(cls, doc_id: str, client=None) -> "DocumentCheckpoint":
+        """Load the local journal, falling back to the remote mirror when it is empty."""
+        journal = get_journal()
+        state = journal.load(doc_id)
+        if not state["stages"] and CONFIG.CHECKPOINT_MIRROR and client is not None:
+            try:
+                remote = await client.get_checkpoint(doc_id)
+            except Exception as e:
+                logger.warning(f"Could not fetch remote checkpoint for {doc_id}: {e}")
+                remote = None
+            if remote:
+                # JSON object keys are strings; chunk indexes are ints locally
+                state = {
+                    "stages": remote.get("stages", {}),
+                    "chunks": {int(k): v for k, v in remote.get("chunks", {}).items()},
+                }
+                for stage, payload in state["stages"].items():
+                    journal.put_stage(doc_id, stage, payload)
+                for index, documents in state["chunks"].items():
+                    journal.put_chunk(doc_id, index, documents)
+                logger.info(f"Restored checkpoint for {doc_id} from remote mirror")
+        if state["stages"] or state["chunks"]:
+            logger.info(f"RESUME {doc_id}: stages={sorted(state['stages'])}, "
+                        f"chunks done={sorted(state['chunks'])}")
+        return cls(journal, doc_id, client, state)
+
+    def get_stage(self, stage: str) -> Optional[dict]:
+        return self.state["stages"].get(stage)
+
+    def get_chunk(self, chunk_index: int) -> Optional[list]:
+        return self.state["chunks"].get(chunk_index)
+
+    @property
+    def work_dir(self) -> Path:
+        return self.journal.work_dir(self.doc_id)
+
+    async def put_stage(self, stage: str, payload: dict) -> None:
+        self.journal.put_stage(self.doc_id, stage, payload)
+        self.state["stages"][stage] = payload
+        await self._mirror(f"stage.{stage}", payload)
+
+    async def put_chunk(self, chunk_index: int, documents: list) -> None:
+        self.journal.put_chunk(self.doc_id, chunk_index, documents)
+        self.state["chunks"][chunk_index] = documents
+        await self._mirror(f"chunk.{chunk_index}", documents)
+
+    async def discard(self) -> None:
+        """Forget this document's checkpoints (after completion or a permanent failure)."""
+        self.journal.clear(self.doc_id)
+        self.state = {"stages": {}, "chunks": {}}
+        if CONFIG.CHECKPOINT_MIRROR and self.client is not None:
+            try:
+                await self.client.delete_checkpoint(self.doc_id)
+            except Exception as e:
+                logger.warning(f"Could not delete remote checkpoint for {self.doc_id}: {e}")
+
+    async def _mirror(self, part: str, payload) -> None:
+        """Upload only the stage or chunk that changed ("stage.split", "chunk.3")."""
+        if not CONFIG.CHECKPOINT_MIRROR or self.client is None:
+            return
+        try:
+            await self.client.save_checkpoint(self.doc_id, part, json.loads(json.dumps(payload, default=str)))
+        except Exception as e:
+            # Local journal is authoritative; the mirror is best-effort
+            logger.warning(f"Could not mirror checkpoint for {self.doc_id}: {e}")
@@ -1,6 +1,7 @@
 """Configuration from environment variables."""
 
 import os
+import socket
 
 
 class Config:
@@ -11,21 +12,98 @@ class Config:
     PROCESSING_API_KEY: str = os.environ.get("PROCESSING_API_KEY", "")
     ANTHROPIC_API_KEY: str = os.environ.get("ANTHROPIC_API_KEY", "")
     POSTMARK_API_KEY: str = os.environ.get("POSTMARK_API_KEY", "")
+    POSTMARK_API_URL: str = os.environ.get("POSTMARK_API_URL", "https://api.postmarkapp.com").rstrip("/")
     
     # Processing settings
     POLL_INTERVAL_SECONDS: int = int(os.environ.get("POLL_INTERVAL_SECONDS", "30"))
     BATCH_SIZE: int = int(os.environ.get("BATCH_SIZE", "5"))
     MAX_RETRIES: int = int(os.environ.get("MAX_RETRIES", "3"))
+
+    # Lease-based queue claiming (multiple processor machines): each machine claims at
+    # most WORKER_CAPACITY documents, holds them for LEASE_SECONDS and renews every
+    # LEASE_RENEW_SECONDS while processing. Expired leases are reclaimed by the queue.
+    QUEUE_LEASES_ENABLED: bool = os.environ.get("QUEUE_LEASES_ENABLED", "1") == "1"
+    WORKER_ID: str = os.environ.get("WORKER_ID") or os.environ.get("FLY_MACHINE_ID") or socket.gethostname()
+    WORKER_CAPACITY: int = int(os.environ.get("WORKER_CAPACITY", "1"))
+    LEASE_SECONDS: int = int(os.environ.get("LEASE_SECONDS", "300"))
+    LEASE_RENEW_SECONDS: int = int(os.environ.get("LEASE_RENEW_SECONDS", "60"))
     
     # Claude model
     CLAUDE_MODEL: str = os.environ.get("CLAUDE_MODEL", "claude-sonnet-4-6")
     CLAUDE_ENHANCED_MODEL: str = os.environ.get("CLAUDE_ENHANCED_MODEL", "claude-opus-4-6")
+    CLAUDE_FAST_MODEL: str = os.environ.get("CLAUDE_FAST_MODEL", "claude-haiku-4-5")
+
+    # Cost-tiered routing: classification and these simple, well-structured types go to
+    # CLAUDE_FAST_MODEL, escalating to CLAUDE_MODEL when review flags / confidence are poor
+    MODEL_ROUTING_ENABLED: bool = os.environ.get("MODEL_ROUTING_ENABLED", "1") == "1"
+    FAST_MODEL_DOC_TYPES: str = os.environ.get(
+        "FAST_MODEL_DOC_TYPES", "check_stub,check,completion_report,drilling_permit,well_transfer")
     
     # Image conversion
     IMAGE_DPI: int = int(os.environ.get("IMAGE_DPI", "150"))
-    
+
+    # Boundary detection for large PDFs: "sampled" (full-res page sample) or
+    # "contact_sheet" (every page as a labeled thumbnail, full-res only where ambiguous)
+    DETECTION_MODE: str = os.environ.get("DETECTION_MODE", "sampled")
+    CONTACT_SHEET_GRID: int = int(os.environ.get("CONTACT_SHEET_GRID", "3"))
+    CONTACT_SHEET_TILE_WIDTH: int = int(os.environ.get("CONTACT_SHEET_TILE_WIDTH", "400"))
+    CONTACT_SHEET_MAX_REFINE_PAGES: int = int(os.environ.get("CONTACT_SHEET_MAX_REFINE_PAGES", "20"))
+
+    # Local adjacent-page boundary scorer: when every boundary is decided locally
+    # (backed by page numbering / recording stamps), skip the visual detection call
+    LOCAL_BOUNDARY_SKIP_VISION: bool = os.environ.get("LOCAL_BOUNDARY_SKIP_VISION", "1") == "1"
+
+    # Windowed (map-reduce) extraction for long single instruments: chunks of the
+    # WINDOWED_EXTRACTION_DOC_TYPES over either threshold are extracted in page
+    # windows concurrently, then merged. Other types (orders, permits, 1002A) are
+    # only windowed when one request would exceed the API limits.
+    WINDOWED_EXTRACTION_DOC_TYPES: frozenset = frozenset(
+        t.strip() for t in os.environ.get(
+            "WINDOWED_EXTRACTION_DOC_TYPES",
+            "title_opinion,joa,joint_operating_agreement,affidavit_of_heirship,trust_funding,limited_partnership"
+        ).split(",") if t.strip())
+    WINDOWED_EXTRACTION_MAX_PAGES: int = int(os.environ.get("WINDOWED_EXTRACTION_MAX_PAGES", "15"))
+    WINDOWED_EXTRACTION_MAX_IMAGE_TOKENS: int = int(os.environ.get("WINDOWED_EXTRACTION_MAX_IMAGE_TOKENS", "40000"))
+    WINDOWED_EXTRACTION_WINDOW_PAGES: int = int(os.environ.get("WINDOWED_EXTRACTION_WINDOW_PAGES", "8"))
+    WINDOWED_EXTRACTION_CONCURRENCY: int = int(os.environ.get("WINDOWED_EXTRACTION_CONCURRENCY", "3"))
+    WINDOWED_EXTRACTION_RECONCILE: bool = os.environ.get("WINDOWED_EXTRACTION_RECONCILE", "1") == "1"
+
+    # Pre-flight request sizing: a request predicted to exceed either limit is sent as a
+    # smaller representation or in more calls (see request_budget.py). The API's own
+    # limits are 200k context tokens and 32 MB per request.
+    REQUEST_MAX_INPUT_TOKENS: int = int(os.environ.get("REQUEST_MAX_INPUT_TOKENS", "150000"))
+    REQUEST_MAX_PAYLOAD_MB: int = int(os.environ.get("REQUEST_MAX_PAYLOAD_MB", "28"))
+
+    # Memory governor: documents are admitted only while their estimated footprint
+    # fits in MEMORY_BUDGET_MB (leave headroom below the VM size); above
+    # MEMORY_SPILL_FRACTION of the budget, page payloads are spilled to disk
+    MEMORY_BUDGET_MB: int = int(os.environ.get("MEMORY_BUDGET_MB", "1600"))
+    MEMORY_SPILL_FRACTION: float = float(os.environ.get("MEMORY_SPILL_FRACTION", "0.8"))
+
+    # Crash-safe checkpointing: download, render, split and per-chunk extraction results
+    # are journaled locally (SQLite) so a restarted worker resumes where it stopped.
+    # CHECKPOINT_DIR must be on persistent storage to survive a restart (fly.toml
+    # mounts a volume at /data); CHECKPOINT_MIRROR also copies each stage/chunk to
+    # the documents-worker (R2) for resuming on a different or rebuilt machine.
+    CHECKPOINT_ENABLED: bool = os.environ.get("CHECKPOINT_ENABLED", "1") == "1"
+    CHECKPOINT_DIR: str = os.environ.get("CHECKPOINT_DIR", "/tmp/mw-checkpoints")
+    CHECKPOINT_MIRROR: bool = os.environ.get("CHECKPOINT_MIRROR", "1") == "1"
+
+    # Diagnostic artifacts (page texts, heuristic traces, raw model responses) are written
+    # per document to DIAGNOSTICS_DIR only for these final statuses or a sampled fraction
+    DIAGNOSTICS_DIR: str = os.environ.get("DIAGNOSTICS_DIR", "/tmp/mw-diagnostics")
+    DIAGNOSTICS_SAMPLE_RATE: float = float(os.environ.get("DIAGNOSTICS_SAMPLE_RATE", "0"))
+    DIAGNOSTICS_ON_STATUS: frozenset = frozenset(
+        s.strip() for s in os.environ.get("DIAGNOSTICS_ON_STATUS", "failed,manual_review").split(",") if s.strip())
+    DIAGNOSTICS_MAX_FILES: int = int(os.environ.get("DIAGNOSTICS_MAX_FILES", "200"))
+
     # Email settings
     FROM_EMAIL: str = os.environ.get("FROM_EMAIL", "notifications@mymineralwatch.com")
+
+    # Notifications are batched: emails queued within NOTIFY_FLUSH_SECONDS go out in one
+    # Postmark batch request; user info (email/name) is cached for USER_INFO_TTL_SECONDS
+    NOTIFY_FLUSH_SECONDS: float = float(os.environ.get("NOTIFY_FLUSH_SECONDS", "5"))
+    USER_INFO_TTL_SECONDS: int = int(os.environ.get("USER_INFO_TTL_SECONDS", "3600"))
     
     def validate(self) -> list[str]:
         """Validate required configuration. Returns list of missing items."""
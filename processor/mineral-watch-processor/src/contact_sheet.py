@@ -0,0 +1,101 @@
+"""Contact-sheet rendering for low-cost document boundary detection.
+
+Tiles low-resolution page thumbnails into labeled grids so every page of a
+large bundle can be shown to the model in a handful of images.
+"""
+
+import logging
+import tempfile
+from pathlib import Path
+
+from PIL import Image, ImageDraw, ImageFont
+
+logger = logging.getLogger(__name__)
+
+# Letter-size pages are 8.5 x 11 — tiles keep that aspect so thumbnails fill the cell
+PAGE_ASPECT = 11 / 8.5
+LABEL_HEIGHT = 36  # px banner above each thumbnail carrying the page number
+TILE_PADDING = 6
+
+
+def _load_label_font(size: int):
+    """Load a font for page labels. Pillow < 10.1 has no sized default font."""
+    try:
+        return ImageFont.load_default(size=size)
+    except TypeError:
+        return ImageFont.load_default()
+
+
+def build_contact_sheets(
+    image_paths: list[str],
+    cols: int = 3,
+    rows: int = 3,
+    tile_width: int = 400,
+    output_dir: str = None,
+) -> list[dict]:
+    """
+    Tile page images into labeled contact sheets.
+
+    Args:
+        image_paths: Page images in document order
+        cols: Thumbnails per row
+        rows: Rows per sheet
+        tile_width: Width of each thumbnail cell in pixels
+        output_dir: Where to write sheets (default: new temp dir)
+
+    Returns:
+        List of dicts: {path, pages} where pages are the 1-based page
+        numbers shown on that sheet, in reading order.
+    """
+    if not image_paths:
+        return []
+
+    if output_dir is None:
+        output_dir = tempfile.mkdtemp(prefix="contact-")
+
+    tile_height = int(tile_width * PAGE_ASPECT)
+    cell_w = tile_width + TILE_PADDING * 2
+    cell_h = tile_height + LABEL_HEIGHT + TILE_PADDING * 2
+    per_sheet = cols * rows
+    font = _load_label_font(LABEL_HEIGHT - 8)
+
+    sheets = []
+    for sheet_idx, first in enumerate(range(0, len(image_paths), per_sheet)):
+        batch = image_paths[first:first + per_sheet]
+        used_rows = (len(batch) + cols - 1) // cols
+        sheet = Image.new("RGB", (cell_w * cols, cell_h * used_rows), "white")
+        draw = ImageDraw.Draw(sheet)
+        pages = []
+
+        for slot, path in enumerate(batch):
+            page_num = first + slot + 1
+            x0 = (slot % cols) * cell_w
+            y0 = (slot // cols) * cell_h
+
+            # Label banner — dark background so the number survives JPEG compression
+            draw.rectangle([x0, y0, x0 + cell_w - 1, y0 + LABEL_HEIGHT], fill="black")
+            draw.text((x0 + TILE_PADDING, y0 + 4), f"PAGE {page_num}", fill="white", font=font)
+
+            try:
+                with Image.open(path) as img:
+                    thumb = img.convert("RGB")
+                    thumb.thumbnail((tile_width, tile_height), Image.Resampling.LANCZOS)
+                    paste_x = x0 + TILE_PADDING + (tile_width - thumb.width) // 2
+                    paste_y = y0 + LABEL_HEIGHT + TILE_PADDING + (tile_height - thumb.height) // 2
+                    sheet.paste(thumb, (paste_x, paste_y))
+            except Exception as e:
+                logger.warning(f"Contact sheet: failed to render page {page_num} ({path}): {e}")
+                draw.text((x0 + TILE_PADDING, y0 + LABEL_HEIGHT + TILE_PADDING),
+                          "(unreadable)", fill="red", font=font)
+
+            # Cell border makes page edges unambiguous between neighbouring thumbnails
+            draw.rectangle([x0, y0, x0 + cell_w - 1, y0 + cell_h - 1], outline="gray", width=2)
+            pages.append(page_num)
+
+        sheet_path = str(Path(output_dir) / f"sheet-{sheet_idx + 1:03d}.jpg")
+        sheet.save(sheet_path, "JPEG", quality=80, optimize=True)
+        sheets.append({"path": sheet_path, "pages": pages})
+
+    logger.info(f"Built {len(sheets)} contact sheet(s) for {len(image_paths)} pages "
+                f"({cols}x{rows} grid, {tile_width}px tiles)")
+    return sheets
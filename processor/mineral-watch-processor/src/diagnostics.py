@@ -0,0 +1,187 @@
+"""
+Per-document diagnostic artifacts.
+
+Page texts, heuristic traces and raw model responses used to go to the log at
+INFO level for every document (megabytes per 200-page PDF). They are now
+collected in memory by a DiagnosticRecorder bound to the document's task and
+written as one gzip-compressed JSON artifact only when it is worth keeping:
+
+- the document failed or ended in a status listed in DIAGNOSTICS_ON_STATUS
+  (default failed, manual_review), or
+- it was sampled (DIAGNOSTICS_SAMPLE_RATE, default off).
+
+Artifacts go to DIAGNOSTICS_DIR as <doc_id>-<utc timestamp>.json.gz; only the
+newest DIAGNOSTICS_MAX_FILES are kept. Read one with:
+    python -m src.diagnostics /tmp/mw-diagnostics/<file>.json.gz [--section pages]
+
+Code deep in the pipeline records through the module functions (record,
+record_pages, record_heuristic, record_response), which do nothing when no
+recorder is active, so callers need no extra parameters.
+"""
+
+import argparse
+import contextvars
+import gzip
+import json
+import logging
+import random
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+from .config import CONFIG
+
+logger = logging.getLogger(__name__)
+
+_current: contextvars.ContextVar[Optional["DiagnosticRecorder"]] = contextvars.ContextVar(
+    "diagnostic_recorder", default=None)
+
+
+class DiagnosticRecorder:
+    """Collects one document's diagnostics; writes them only on finish() when warranted."""
+
+    def __init__(self, doc_id: str, metadata: dict = None, sampled: bool = False):
+        self.doc_id = doc_id
+        self.sampled = sampled
+        self.started = time.time()
+        self.metadata = metadata or {}
+        self.page_texts: Optional[list[str]] = None
+        self.heuristics: list[dict] = []
+        self.responses: list[dict] = []
+        self.events: list[dict] = []
+        self._token: Optional[contextvars.Token] = None
+
+    @classmethod
+    def start(cls, doc_id: str, metadata: dict = None) -> "DiagnosticRecorder":
+        """Create a recorder and make it current for this task (and tasks/threads it spawns)."""
+        recorder = cls(doc_id, metadata, sampled=random.random() < CONFIG.DIAGNOSTICS_SAMPLE_RATE)
+        recorder._token = _current.set(recorder)
+        return recorder
+
+    def should_write(self, status: Optional[str]) -> bool:
+        return self.sampled or (status or "failed") in CONFIG.DIAGNOSTICS_ON_STATUS
+
+    def finish(self, status: Optional[str], error: str = None) -> Optional[Path]:
+        """
+        Detach the recorder and write the artifact if the outcome calls for one.
+
+        Args:
+            status: Final document status ("complete", "manual_review", "failed", ...)
+            error: Error message for failed documents
+
+        Returns:
+            Path of the written artifact, or None
+        """
+        if self._token is not None:
+            _current.reset(self._token)
+            self._token = None
+        if not self.should_write(status):
+            return None
+        try:
+            path = self._write(status, error)
+        except Exception as e:
+            logger.warning(f"Could not write diagnostics for {self.doc_id}: {e}")
+            return None
+        logger.info(f"Diagnostics for {self.doc_id} ({status}{', sampled' if self.sampled else ''}) "
+                    f"written to {path}")
+        return path
+
+    def _write(self, status: Optional[str], error: Optional[str]) -> Path:
+        out_dir = Path(CONFIG.DIAGNOSTICS_DIR)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        path = out_dir / f"{self.doc_id}-{stamp}.json.gz"
+        artifact = {
+            "doc_id": self.doc_id,
+            "status": status,
+            "error": error,
+            "sampled": self.sampled,
+            "duration_seconds": round(time.time() - self.started, 2),
+            "metadata": self.metadata,
+            "pages": self.page_texts,
+            "heuristics": self.heuristics,
+            "responses": self.responses,
+            "events": self.events,
+        }
+        with gzip.open(path, "wt", encoding="utf-8", compresslevel=6) as f:
+            json.dump(artifact, f, default=str)
+        _prune(out_dir, CONFIG.DIAGNOSTICS_MAX_FILES)
+        return path
+
+
+def _prune(out_dir: Path, keep: int) -> None:
+    artifacts = sorted(out_dir.glob("*.json.gz"), key=lambda p: p.stat().st_mtime, reverse=True)
+    for old in artifacts[keep:]:
+        old.unlink(missing_ok=True)
+
+
+def current() -> Optional[DiagnosticRecorder]:
+    return _current.get()
+
+
+def record(kind: str, data) -> None:
+    """Attach an arbitrary event (split result, final payload, ...) to the current document."""
+    recorder = _current.get()
+    if recorder is not None:
+        recorder.events.append({"kind": kind, "at": round(time.time() - recorder.started, 3), "data": data})
+
+
+def record_pages(page_texts: list[str]) -> None:
+    recorder = _current.get()
+    if recorder is not None:
+        recorder.page_texts = page_texts
+
+
+def record_heuristic(page_index: int, result: dict, trace: list[str]) -> None:
+    recorder = _current.get()
+    if recorder is not None:
+        recorder.heuristics.append({"page_index": page_index, "result": dict(result), "trace": trace})
+
+
+def record_response(call: str, model: str, response) -> None:
+    """Raw text and usage of a model response."""
+    recorder = _current.get()
+    if recorder is None:
+        return
+    try:
+        text = "".join(getattr(block, "text", "") for block in response.content)
+    except Exception:
+        text = repr(response)
+    usage = getattr(response, "usage", None)
+    recorder.responses.append({
+        "call": call,
+        "model": model,
+        "at": round(time.time() - recorder.started, 3),
+        "stop_reason": getattr(response, "stop_reason", None),
+        "input_tokens": getattr(usage, "input_tokens", None),
+        "output_tokens": getattr(usage, "output_tokens", None),
+        "text": text,
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Print a diagnostic artifact")
+    parser.add_argument("path", help="<doc_id>-<timestamp>.json.gz")
+    parser.add_argument("--section", choices=("pages", "heuristics", "responses", "events", "metadata"),
+                        help="Print only this section")
+    args = parser.parse_args()
+
+    with gzip.open(args.path, "rt", encoding="utf-8") as f:
+        artifact = json.load(f)
+    if args.section == "pages":
+        for i, text in enumerate(artifact.get("pages") or []):
+            print(f"===== Page {i} ({len(text)} chars) =====")
+            print(text)
+        return
+    if args.section:
+        print(json.dumps(artifact.get(args.section), indent=2))
+        return
+    summary = {k: v for k, v in artifact.items() if k not in ("pages", "heuristics", "responses", "events")}
+    summary.update(pages=len(artifact.get("pages") or []), heuristics=len(artifact["heuristics"]),
+                   responses=len(artifact["responses"]), events=[e["kind"] for e in artifact["events"]])
+    print(json.dumps(summary, indent=2))
+
+
+if __name__ == "__main__":
+    main()
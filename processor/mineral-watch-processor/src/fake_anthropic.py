@@ -0,0 +1,221 @@
+"""
+Local fake of the Anthropic Messages API for offline benchmarks.
+
+Replays recorded responses keyed by a fingerprint of the request (model, text
+blocks and a hash of every image/PDF payload), with configurable latency and
+429 injection. Requests without a recording get a small canned response for
+their call type (classification, boundary detection, extraction) so the
+pipeline still runs end to end; they are counted as "unrecorded".
+
+Recording: with --record, requests are forwarded to the real API (using
+ANTHROPIC_API_KEY) and the responses appended to the recordings file.
+
+The extractor picks the fake up through ANTHROPIC_BASE_URL:
+    python -m src.fake_anthropic --recordings bench/recordings.jsonl --port 8788
+    ANTHROPIC_BASE_URL=http://localhost:8788 python -m src.main
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import random
+import threading
+import uuid
+from pathlib import Path
+from typing import Optional
+
+import httpx
+from aiohttp import web
+
+logger = logging.getLogger(__name__)
+
+UPSTREAM_URL = "https://api.anthropic.com"
+
+# Rough token accounting for unrecorded responses (~4 chars/token, ~1600 tokens per page image)
+CHARS_PER_TOKEN = 4
+TOKENS_PER_IMAGE = 1600
+
+CANNED_EXTRACTION = {
+    "doc_type": "mineral_deed",
+    "document_confidence": "medium",
+    "grantors": [{"name": "BENCHMARK GRANTOR"}],
+    "grantees": [{"name": "BENCHMARK GRANTEE"}],
+    "legal_description": {"section": "1", "township": "1N", "range": "1W", "county": "Grady"},
+    "field_scores": {"doc_type": 0.9, "grantors": 0.8, "grantees": 0.8, "legal_description": 0.8},
+    "key_takeaway": "Canned benchmark response.",
+    "ai_observations": "Canned benchmark response.",
+}
+
+
+def request_fingerprint(body: dict) -> str:
+    """Stable key for a Messages request: text verbatim, binary payloads by hash."""
+    def normalize(block):
+        if isinstance(block, dict):
+            source = block.get("source")
+            if isinstance(source, dict) and "data" in source:
+                digest = hashlib.sha256(source["data"].encode()).hexdigest()
+                return {**block, "source": {**source, "data": digest}}
+            return {k: normalize(v) for k, v in block.items()}
+        if isinstance(block, list):
+            return [normalize(b) for b in block]
+        return block
+
+    key = {
+        "model": body.get("model"),
+        "system": body.get("system"),
+        "messages": normalize(body.get("messages", [])),
+    }
+    return hashlib.sha256(json.dumps(key, sort_keys=True).encode()).hexdigest()
+
+
+def _content_blocks(body: dict) -> list[dict]:
+    blocks = []
+    for message in body.get("messages", []):
+        content = message.get("content")
+        if isinstance(content, str):
+            blocks.append({"type": "text", "text": content})
+        elif isinstance(content, list):
+            blocks.extend(b for b in content if isinstance(b, dict))
+    return blocks
+
+
+def canned_text(body: dict) -> str:
+    """Plausible response text for an unrecorded call, chosen by call type."""
+    blocks = _content_blocks(body)
+    text = "\n".join(b.get("text", "") for b in blocks if b.get("type") == "text")
+    images = sum(1 for b in blocks if b.get("type") in ("image", "document"))
+
+    if body.get("max_tokens", 0) <= 64:
+        return "mineral_deed"  # sonnet_classify_chunk: bare type string
+    if "rotation_needed" in text:
+        return json.dumps({"doc_type": "mineral_deed", "confidence": "high", "rotation_needed": 0,
+                           "is_multi_document": False, "reasoning": "Canned benchmark response."})
+    if "document_count" in text and "start_page" in text:
+        return json.dumps({"is_multi_document": False, "document_count": 1,
+                           "documents": [{"type": "mineral_deed", "start_page": 1,
+                                          "end_page": max(images, 1), "confidence": 0.9}]})
+    return json.dumps(CANNED_EXTRACTION)
+
+
+class FakeAnthropic:
+    """Recorded-response Messages API with latency and rate-limit injection."""
+
+    def __init__(self, recordings_path: Optional[str] = None, latency_ms: float = 0,
+                 latency_per_image_ms: float = 0, rate_429: float = 0.0,
+                 record: bool = False, seed: int = 0):
+        self.recordings_path = Path(recordings_path) if recordings_path else None
+        self.latency_ms = latency_ms
+        self.latency_per_image_ms = latency_per_image_ms
+        self.rate_429 = rate_429
+        self.record = record
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.recordings: dict[str, dict] = {}
+        self.stats = {"calls": 0, "replayed": 0, "unrecorded": 0, "recorded": 0,
+                      "injected_429": 0, "input_tokens": 0, "output_tokens": 0}
+        if self.recordings_path and self.recordings_path.exists():
+            with open(self.recordings_path) as f:
+                for line in f:
+                    if line.strip():
+                        entry = json.loads(line)
+                        self.recordings[entry["key"]] = entry["response"]
+            logger.info(f"Loaded {len(self.recordings)} recorded responses")
+
+    def _synthesize(self, body: dict) -> dict:
+        blocks = _content_blocks(body)
+        text = canned_text(body)
+        prompt_chars = sum(len(b.get("text", "")) for b in blocks)
+        images = sum(1 for b in blocks if b.get("type") in ("image", "document"))
+        return {
+            "id": f"msg_fake_{uuid.uuid4().hex[:16]}",
+            "type": "message",
+            "role": "assistant",
+            "model": body.get("model"),
+            "content": [{"type": "text", "text": text}],
+            "stop_reason": "end_turn",
+            "stop_sequence": None,
+            "usage": {"input_tokens": prompt_chars // CHARS_PER_TOKEN + images * TOKENS_PER_IMAGE,
+                      "output_tokens": max(1, len(text) // CHARS_PER_TOKEN)},
+        }
+
+    async def _forward(self, body: dict) -> dict:
+        async with httpx.AsyncClient(timeout=600) as upstream:
+            response = await upstream.post(
+                f"{UPSTREAM_URL}/v1/messages",
+                headers={"x-api-key": os.environ["ANTHROPIC_API_KEY"],
+                         "anthropic-version": "2023-06-01", "content-type": "application/json"},
+                json=body)
+            response.raise_for_status()
+            return response.json()
+
+    def _save(self, key: str, response: dict) -> None:
+        with self._lock:
+            self.recordings[key] = response
+            self.stats["recorded"] += 1
+            if self.recordings_path:
+                self.recordings_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.recordings_path, "a") as f:
+                    f.write(json.dumps({"key": key, "response": response}) + "\n")
+
+    async def messages(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        self.stats["calls"] += 1
+
+        if self.rate_429 and self._random.random() < self.rate_429:
+            self.stats["injected_429"] += 1
+            return web.json_response(
+                {"type": "error", "error": {"type": "rate_limit_error", "message": "Injected rate limit"}},
+                status=429, headers={"retry-after": "1"})
+
+        images = sum(1 for b in _content_blocks(body) if b.get("type") in ("image", "document"))
+        delay_ms = self.latency_ms + images * self.latency_per_image_ms
+        if delay_ms:
+            await asyncio.sleep(delay_ms / 1000)
+
+        key = request_fingerprint(body)
+        response = self.recordings.get(key)
+        if response is not None:
+            self.stats["replayed"] += 1
+        elif self.record:
+            response = await self._forward(body)
+            self._save(key, response)
+        else:
+            self.stats["unrecorded"] += 1
+            response = self._synthesize(body)
+
+        usage = response.get("usage") or {}
+        self.stats["input_tokens"] += usage.get("input_tokens", 0)
+        self.stats["output_tokens"] += usage.get("output_tokens", 0)
+        return web.json_response(response)
+
+    async def get_stats(self, request: web.Request) -> web.Response:
+        return web.json_response(self.stats)
+
+    def create_app(self) -> web.Application:
+        app = web.Application(client_max_size=512 * 1024 * 1024)
+        app.router.add_post("/v1/messages", self.messages)
+        app.router.add_get("/stats", self.get_stats)
+        return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fake Anthropic Messages API (recorded responses)")
+    parser.add_argument("--recordings", help="JSONL of recorded responses")
+    parser.add_argument("--port", type=int, default=8788)
+    parser.add_argument("--latency-ms", type=float, default=0, help="Fixed latency per call")
+    parser.add_argument("--latency-per-image-ms", type=float, default=0, help="Extra latency per image")
+    parser.add_argument("--rate-429", type=float, default=0.0, help="Fraction of calls answered with 429")
+    parser.add_argument("--record", action="store_true", help="Forward misses to the real API and record them")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    fake = FakeAnthropic(args.recordings, args.latency_ms, args.latency_per_image_ms,
+                         args.rate_429, record=args.record)
+    web.run_app(fake.create_app(), port=args.port)
+
+
+if __name__ == "__main__":
+    main()
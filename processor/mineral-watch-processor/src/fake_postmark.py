@@ -0,0 +1,103 @@
+"""
+Local fake of the Postmark email API for testing notifications.
+
+Accepts /email and /email/batch like Postmark (server token header, per-message
+ErrorCode in batch responses, 500-message batch limit) and keeps every message
+in memory instead of sending it. GET /messages lists what was "sent", GET
+/stats counts requests, DELETE /messages resets.
+
+Usage:
+    python -m src.fake_postmark --port 8789 [--reject-to bounce@example.com]
+    POSTMARK_API_URL=http://localhost:8789 POSTMARK_API_KEY=dev python -m src.main
+"""
+
+import argparse
+import logging
+import uuid
+from datetime import datetime, timezone
+
+from aiohttp import web
+
+logger = logging.getLogger(__name__)
+
+BATCH_LIMIT = 500
+REQUIRED_FIELDS = ("From", "To", "Subject")
+
+
+class FakePostmark:
+    """In-memory Postmark that records messages."""
+
+    def __init__(self, reject_to: list[str] = None):
+        self.reject_to = {addr.lower() for addr in reject_to or []}
+        self.messages: list[dict] = []
+        self.stats = {"single_requests": 0, "batch_requests": 0, "accepted": 0, "rejected": 0}
+
+    def _accept(self, message: dict) -> dict:
+        missing = [f for f in REQUIRED_FIELDS if not message.get(f)]
+        if missing:
+            self.stats["rejected"] += 1
+            return {"ErrorCode": 300, "Message": f"Invalid email request: missing {', '.join(missing)}"}
+        if str(message["To"]).lower() in self.reject_to:
+            self.stats["rejected"] += 1
+            return {"ErrorCode": 406, "To": message["To"],
+                    "Message": "You tried to send to a recipient that has been marked as inactive."}
+        message_id = str(uuid.uuid4())
+        self.messages.append({**message, "MessageID": message_id})
+        self.stats["accepted"] += 1
+        return {"ErrorCode": 0, "Message": "OK", "MessageID": message_id, "To": message["To"],
+                "SubmittedAt": datetime.now(timezone.utc).isoformat()}
+
+    @web.middleware
+    async def auth(self, request, handler):
+        if request.path.startswith("/email") and not request.headers.get("X-Postmark-Server-Token"):
+            return web.json_response(
+                {"ErrorCode": 10, "Message": "No Account or Server API tokens were supplied in the HTTP headers."},
+                status=401)
+        return await handler(request)
+
+    async def send(self, request: web.Request) -> web.Response:
+        self.stats["single_requests"] += 1
+        outcome = self._accept(await request.json())
+        return web.json_response(outcome, status=200 if outcome["ErrorCode"] == 0 else 422)
+
+    async def send_batch(self, request: web.Request) -> web.Response:
+        self.stats["batch_requests"] += 1
+        messages = await request.json()
+        if not isinstance(messages, list) or len(messages) > BATCH_LIMIT:
+            return web.json_response(
+                {"ErrorCode": 300, "Message": f"Batch must be a list of at most {BATCH_LIMIT} messages"},
+                status=422)
+        return web.json_response([self._accept(m) for m in messages])
+
+    async def list_messages(self, request: web.Request) -> web.Response:
+        return web.json_response([{k: v for k, v in m.items() if k != "HtmlBody"} for m in self.messages])
+
+    async def reset(self, request: web.Request) -> web.Response:
+        self.messages.clear()
+        return web.json_response({"success": True})
+
+    async def get_stats(self, request: web.Request) -> web.Response:
+        return web.json_response({**self.stats, "messages": len(self.messages)})
+
+    def create_app(self) -> web.Application:
+        app = web.Application(middlewares=[self.auth])
+        app.router.add_post("/email", self.send)
+        app.router.add_post("/email/batch", self.send_batch)
+        app.router.add_get("/messages", self.list_messages)
+        app.router.add_delete("/messages", self.reset)
+        app.router.add_get("/stats", self.get_stats)
+        return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fake Postmark email API")
+    parser.add_argument("--port", type=int, default=8789)
+    parser.add_argument("--reject-to", action="append", help="Recipient to answer with an inactive-recipient error")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    web.run_app(FakePostmark(args.reject_to).create_app(), port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,305 @@
+"""
+Golden-corpus accuracy and speed harness for page splitting.
+
+Runs the text-only splitting paths over a stored corpus of page texts with
+labeled document boundaries (golden/*.json) and reports, per pipeline, boundary
+precision/recall, exact-split rate, type accuracy and CPU time per page. Run it
+before and after touching heuristic_page_check(), the title/continuation
+patterns, split_pages_into_documents(), the boundary scorer or a splitter, so a
+speedup can't quietly cost accuracy.
+
+Pipelines:
+    heuristic  classify_single_page() text path -> split_pages_into_documents()
+    local      heuristics + score_page_boundaries() decisions (all-confident
+               bundles go through _build_local_page_classifications(), as in Stage 1)
+    splitter   split_by_type() on the first page's heuristic type (DivisionOrderSplitter etc.);
+               bundles no splitter claims are counted under "skipped", not scored
+    visual     _build_visual_page_classifications() from a case's recorded
+               detect_documents() result (cases without one are skipped)
+
+Usage:
+    python -m src.golden                                  # table + JSON to stdout
+    python -m src.golden --repeat 50 --output golden-results.json
+    python -m src.golden --write-baseline golden/baseline.json
+    python -m src.golden --baseline golden/baseline.json  # exit 1 on an accuracy drop
+
+Case format (page numbers 1-indexed, like detect_documents()):
+    {"name": ..., "notes": ..., "pages": ["page 1 text", ...],
+     "documents": [{"start_page": 1, "end_page": 2, "coarse_type": "deed", "doc_type": "mineral_deed"}],
+     "visual_detection": {"documents": [{"type": "mineral_deed", "start_page": 1, "end_page": 2}]}}
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+import time
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CORPUS_DIR = Path(__file__).resolve().parent.parent / "golden"
+PIPELINES = ("heuristic", "local", "splitter", "visual")
+
+
+def load_cases(corpus_dir: Path) -> list[dict]:
+    """Load every golden case in corpus_dir (baseline files are skipped)."""
+    cases = []
+    for path in sorted(corpus_dir.glob("*.json")):
+        case = json.loads(path.read_text())
+        if "pages" not in case:
+            continue
+        case.setdefault("name", path.stem)
+        cases.append(case)
+    return cases
+
+
+def _starts(documents: list[dict]) -> set[int]:
+    """0-indexed pages that begin a document, excluding page 0 (always a start)."""
+    return {doc["start_page"] - 1 for doc in documents if doc["start_page"] > 1}
+
+
+# ============================================================================
+# PIPELINES - each returns [{"start_page", "end_page", "type"}] (1-indexed)
+# ============================================================================
+
+def _chunks_to_documents(split_result: dict) -> list[dict]:
+    return [{"start_page": c["page_start"] + 1, "end_page": c["page_end"] + 1, "type": c["coarse_type"]}
+            for c in split_result["chunks"]]
+
+
+async def _heuristic_classifications(pages: list[str]) -> list[dict]:
+    from .extractor import classify_single_page
+    # image_path is unused on the text path - no API call is made
+    return [await classify_single_page(None, i, text) for i, text in enumerate(pages)]
+
+
+async def run_heuristic(case: dict) -> list[dict]:
+    from .extractor import split_pages_into_documents
+    page_classifications = await _heuristic_classifications(case["pages"])
+    return _chunks_to_documents(split_pages_into_documents(page_classifications))
+
+
+async def run_local(case: dict) -> list[dict]:
+    from .extractor import (_build_local_page_classifications, score_page_boundaries,
+                            split_pages_into_documents)
+    pages = case["pages"]
+    boundary_scores = score_page_boundaries(pages)
+    page_classifications = None
+    if boundary_scores["all_confident"]:
+        page_classifications = _build_local_page_classifications(boundary_scores, pages)
+    if page_classifications is None:
+        page_classifications = await _heuristic_classifications(pages)
+    return _chunks_to_documents(split_pages_into_documents(page_classifications, boundary_scores))
+
+
+async def run_splitter(case: dict):
+    from .extractor import heuristic_page_check
+    from .splitters import split_by_type
+    pages = case["pages"]
+    heuristic_type = heuristic_page_check(pages[0], 0).get("heuristic_type")
+    splitter_type, result = split_by_type(heuristic_type, pages)
+    if not result.success:
+        return None
+    return [{"start_page": start, "end_page": end, "type": splitter_type} for start, end in result.page_ranges]
+
+
+async def run_visual(case: dict):
+    from .extractor import _build_visual_page_classifications, split_pages_into_documents
+    detection = case.get("visual_detection")
+    if not detection:
+        return None
+    page_classifications = _build_visual_page_classifications(detection, len(case["pages"]))
+    return _chunks_to_documents(split_pages_into_documents(page_classifications))
+
+
+RUNNERS = {"heuristic": run_heuristic, "local": run_local, "splitter": run_splitter, "visual": run_visual}
+
+
+# ============================================================================
+# SCORING
+# ============================================================================
+
+def score_case(case: dict, predicted: list[dict]) -> dict:
+    """Boundary confusion counts, exact match and type accuracy for one case."""
+    expected = case["documents"]
+    gold, found = _starts(expected), _starts(predicted)
+
+    # A type is right if it matches either the coarse or the fine label of the
+    # gold document starting on the same page (visual/splitter report fine types)
+    gold_by_start = {doc["start_page"]: doc for doc in expected}
+    typed = correct = 0
+    for doc in predicted:
+        truth = gold_by_start.get(doc["start_page"])
+        if truth is None:
+            continue
+        typed += 1
+        if doc["type"] in (truth.get("coarse_type"), truth.get("doc_type")):
+            correct += 1
+
+    ranges = lambda docs: [(d["start_page"], d["end_page"]) for d in docs]
+    return {
+        "tp": len(gold & found),
+        "fp": len(found - gold),
+        "fn": len(gold - found),
+        "exact": ranges(predicted) == ranges(expected),
+        "typed": typed,
+        "type_correct": correct,
+        "missed_starts": sorted(p + 1 for p in gold - found),
+        "false_starts": sorted(p + 1 for p in found - gold),
+    }
+
+
+def _ratio(num: float, den: float) -> float:
+    return round(num / den, 4) if den else 1.0
+
+
+def summarize(scores: list[dict]) -> dict:
+    tp = sum(s["tp"] for s in scores)
+    fp = sum(s["fp"] for s in scores)
+    fn = sum(s["fn"] for s in scores)
+    precision, recall = _ratio(tp, tp + fp), _ratio(tp, tp + fn)
+    return {
+        "cases": len(scores),
+        "boundaries": {"tp": tp, "fp": fp, "fn": fn},
+        "precision": precision,
+        "recall": recall,
+        "f1": round(2 * precision * recall / (precision + recall), 4) if precision + recall else 0.0,
+        "exact_cases": sum(1 for s in scores if s["exact"]),
+        "type_accuracy": _ratio(sum(s["type_correct"] for s in scores), sum(s["typed"] for s in scores)),
+    }
+
+
+# ============================================================================
+# RUN
+# ============================================================================
+
+async def _timed(runner, case: dict, repeat: int):
+    start = time.process_time()
+    for _ in range(repeat):
+        predicted = await runner(case)
+    return predicted, time.process_time() - start
+
+
+async def run_golden(cases: list[dict], pipelines: tuple = PIPELINES, repeat: int = 1) -> dict:
+    """
+    Run each pipeline over the corpus.
+
+    Args:
+        cases: Golden cases from load_cases()
+        pipelines: Pipeline names to run
+        repeat: Runs per case for CPU timing (results come from the last run)
+
+    Returns:
+        dict with per-pipeline summary, CPU ms/page and per-case detail
+    """
+    from .extractor import heuristic_page_check
+
+    total_pages = sum(len(case["pages"]) for case in cases)
+    results = {"corpus": {"cases": len(cases), "pages": total_pages, "repeat": repeat}, "pipelines": {}}
+
+    start = time.process_time()
+    for _ in range(repeat):
+        for case in cases:
+            for i, text in enumerate(case["pages"]):
+                heuristic_page_check(text, i)
+    results["heuristic_page_check_cpu_ms_per_page"] = round(
+        (time.process_time() - start) * 1000 / (total_pages * repeat), 4) if total_pages else 0.0
+
+    for name in pipelines:
+        scores, details, skipped = [], [], []
+        cpu_seconds, scored_pages = 0.0, 0
+        for case in cases:
+            predicted, elapsed = await _timed(RUNNERS[name], case, repeat)
+            if predicted is None:
+                skipped.append(case["name"])
+                continue
+            cpu_seconds += elapsed
+            scored_pages += len(case["pages"])
+            score = score_case(case, predicted)
+            scores.append(score)
+            details.append({"case": case["name"], "predicted": [(d["start_page"], d["end_page"], d["type"])
+                                                                for d in predicted], **score})
+        results["pipelines"][name] = {
+            **summarize(scores),
+            "cpu_ms_per_page": round(cpu_seconds * 1000 / (scored_pages * repeat), 4) if scored_pages else 0.0,
+            "skipped": skipped,
+            "details": details,
+        }
+    return results
+
+
+def compare_to_baseline(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Accuracy metrics that dropped more than tolerance below the baseline."""
+    regressions = []
+    for name, current in results["pipelines"].items():
+        previous = baseline.get("pipelines", {}).get(name)
+        if not previous:
+            continue
+        for metric in ("precision", "recall", "f1", "type_accuracy"):
+            if current[metric] < previous[metric] - tolerance:
+                regressions.append(f"{name}.{metric}: {previous[metric]:.3f} -> {current[metric]:.3f}")
+        if current["exact_cases"] < previous["exact_cases"]:
+            regressions.append(f"{name}.exact_cases: {previous['exact_cases']} -> {current['exact_cases']}")
+    return regressions
+
+
+def _print_table(results: dict, baseline: dict = None) -> None:
+    corpus = results["corpus"]
+    print(f"Golden corpus: {corpus['cases']} cases, {corpus['pages']} pages, repeat={corpus['repeat']}")
+    print(f"heuristic_page_check: {results['heuristic_page_check_cpu_ms_per_page']:.3f} ms/page")
+    print(f"{'pipeline':<10} {'P':>6} {'R':>6} {'F1':>6} {'exact':>7} {'type':>6} {'ms/page':>9}  skipped")
+    for name, p in results["pipelines"].items():
+        cpu = f"{p['cpu_ms_per_page']:.3f}"
+        previous = (baseline or {}).get("pipelines", {}).get(name)
+        if previous and previous.get("cpu_ms_per_page"):
+            cpu += f" ({p['cpu_ms_per_page'] / previous['cpu_ms_per_page']:.2f}x)"
+        print(f"{name:<10} {p['precision']:>6.3f} {p['recall']:>6.3f} {p['f1']:>6.3f} "
+              f"{p['exact_cases']:>3}/{p['cases']:<3} {p['type_accuracy']:>6.3f} {cpu:>9}  {len(p['skipped'])}")
+        for d in p["details"]:
+            if not d["exact"]:
+                print(f"    {d['case']}: missed starts {d['missed_starts']}, false starts {d['false_starts']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Golden-corpus accuracy/speed harness for page splitting")
+    parser.add_argument("--corpus", default=str(DEFAULT_CORPUS_DIR), help="Directory of golden case JSON files")
+    parser.add_argument("--pipeline", action="append", choices=PIPELINES, help="Run only these (repeatable)")
+    parser.add_argument("--repeat", type=int, default=20, help="Runs per case for CPU timing")
+    parser.add_argument("--output", help="Write full results JSON here")
+    parser.add_argument("--baseline", help="Compare against a previous results JSON")
+    parser.add_argument("--tolerance", type=float, default=0.0, help="Allowed drop in precision/recall/F1")
+    parser.add_argument("--write-baseline", help="Write the summary (no per-case detail) as a new baseline")
+    args = parser.parse_args()
+
+    # Pipeline logging is per page and would dominate both the output and the timing
+    logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    cases = load_cases(Path(args.corpus))
+    if not cases:
+        parser.error(f"No golden cases in {args.corpus}")
+    results = asyncio.run(run_golden(cases, tuple(args.pipeline or PIPELINES), max(args.repeat, 1)))
+
+    baseline = json.loads(Path(args.baseline).read_text()) if args.baseline else None
+    _print_table(results, baseline)
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2) + "\n")
+    if args.write_baseline:
+        summary = {**results, "pipelines": {name: {k: v for k, v in p.items() if k != "details"}
+                                            for name, p in results["pipelines"].items()}}
+        Path(args.write_baseline).write_text(json.dumps(summary, indent=2) + "\n")
+
+    if baseline:
+        regressions = compare_to_baseline(results, baseline, args.tolerance)
+        if regressions:
+            print("Accuracy regressions vs baseline:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print("No accuracy regressions vs baseline")
+
+
+if __name__ == "__main__":
+    main()
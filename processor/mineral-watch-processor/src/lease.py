@@ -0,0 +1,63 @@
+"""
+Lease renewal for claimed queue documents.
+
+Documents claimed with APIClient.claim_documents() stay invisible to other
+processor machines only while this worker keeps renewing their lease. A
+background task per document sends a heartbeat every LEASE_RENEW_SECONDS; if
+the server reports the lease lost (it expired and another machine reclaimed the
+document) the on_lost callback fires so the caller can abandon the work instead
+of racing the new owner.
+"""
+
+import asyncio
+import logging
+from typing import Callable
+
+from .config import CONFIG
+
+logger = logging.getLogger(__name__)
+
+
+class LeaseKeeper:
+    """Keeps leases alive for the documents this worker is processing."""
+
+    def __init__(self, client):
+        self.client = client
+        self._renewers: dict[str, asyncio.Task] = {}
+
+    @property
+    def held(self) -> list[str]:
+        return list(self._renewers)
+
+    def hold(self, doc_id: str, on_lost: Callable[[], None]) -> None:
+        """Start renewing the lease on doc_id until release() is called."""
+        self._renewers[doc_id] = asyncio.create_task(self._renew_loop(doc_id, on_lost))
+
+    async def release(self, doc_id: str, requeue: bool = False) -> None:
+        """Stop renewing and give the lease back (requeue=True for unfinished work)."""
+        renewer = self._renewers.pop(doc_id, None)
+        if renewer:
+            renewer.cancel()
+        try:
+            await self.client.release_lease(doc_id, requeue=requeue)
+        except Exception as e:
+            # Not fatal: the lease simply expires
+            logger.warning(f"Failed to release lease on {doc_id}: {e}")
+
+    async def _renew_loop(self, doc_id: str, on_lost: Callable[[], None]) -> None:
+        while True:
+            await asyncio.sleep(CONFIG.LEASE_RENEW_SECONDS)
+            try:
+                renewed = await self.client.renew_lease(doc_id)
+            except Exception as e:
+                # Transient - the lease has LEASE_SECONDS of slack, try again next interval
+                logger.warning(f"Lease heartbeat for {doc_id} failed: {e}")
+                continue
+            if renewed is None:
+                logger.info("Server has no lease support - stopping heartbeats")
+                return
+            if not renewed:
+                logger.error(f"Lease on {doc_id} lost (reclaimed by another worker) - abandoning")
+                self._renewers.pop(doc_id, None)
+                on_lost()
+                return
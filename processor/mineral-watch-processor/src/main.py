@@ -16,6 +16,7 @@ import json
 import logging
 import os
 import shutil
+import signal
 from aiohttp import web
 from pathlib import Path
 from PIL import Image
@@ -24,8 +25,15 @@ from .config import CONFIG
 from .api_client import APIClient
 from .pdf_converter import convert_pdf_to_images
 from .extractor import extract_document_data, extract_text_from_pdf, classify_pages, split_pages_into_documents
+from .boundary_scorer import score_page_boundaries
+from .checkpoint import DocumentCheckpoint, DrainRequested, is_draining, request_drain
+from .lease import LeaseKeeper
+from .memory_governor import GOVERNOR, estimate_document_bytes, spill_path_for
+from .model_router import ROUTE_STATS
+from .request_budget import ESTIMATES
 from .smart_naming import generate_display_name, generate_display_name_for_child
-from .notifier import send_completion_email, send_failure_email
+from .notifier import NOTIFIER
+from .diagnostics import DiagnosticRecorder, record
 
 # Configure logging
 log_level = os.environ.get("LOG_LEVEL", "INFO")
@@ -40,7 +48,8 @@ processor_status = {
     "healthy": True,
     "last_poll": None,
     "documents_processed": 0,
-    "errors": 0
+    "errors": 0,
+    "in_flight": 0
 }
 
 
@@ -239,7 +248,8 @@ async def prescan_document(client: APIClient, doc: dict) -> dict:
         image_paths = await convert_pdf_to_images(file_path)
         page_texts = extract_text_from_pdf(file_path)
         page_classifications = await classify_pages(image_paths, page_texts)
-        split_result = split_pages_into_documents(page_classifications)
+        boundary_scores = score_page_boundaries(page_texts, image_paths) if page_texts else None
+        split_result = split_pages_into_documents(page_classifications, boundary_scores=boundary_scores)
 
         # Cache OCR text for later full processing
         if page_texts and any(t.strip() for t in page_texts):
@@ -272,6 +282,25 @@ async def prescan_document(client: APIClient, doc: dict) -> dict:
         cleanup_temp_files(file_path, *image_paths)
 
 
+async def render_pdf_pages(file_path: str, checkpoint: DocumentCheckpoint = None) -> list[str]:
+    """Convert a PDF to page images, reusing a checkpointed render whose images are still on disk."""
+    if checkpoint is None:
+        return await convert_pdf_to_images(file_path)
+
+    rendered = checkpoint.get_stage("render")
+    if rendered and all(Path(p).exists() for p in rendered["image_paths"]):
+        logger.info(f"RESUME: reusing {len(rendered['image_paths'])} rendered page(s)")
+        return rendered["image_paths"]
+
+    # Fresh directory so stale pages/rotated copies from an earlier run can't mix in
+    pages_dir = checkpoint.work_dir / "pages"
+    shutil.rmtree(pages_dir, ignore_errors=True)
+    pages_dir.mkdir(parents=True)
+    image_paths = await convert_pdf_to_images(file_path, output_dir=str(pages_dir))
+    await checkpoint.put_stage("render", {"image_paths": image_paths})
+    return image_paths
+
+
 async def process_document(client: APIClient, doc: dict) -> dict:
     """
     Process a single document through the extraction pipeline.
@@ -305,10 +334,24 @@ async def process_document(client: APIClient, doc: dict) -> dict:
     file_path = None
     image_paths = []
     converted_tiff_path = None  # Track converted TIFF for cleanup
+    checkpoint = None
+    drained = False
+    cancelled = False
 
     try:
-        # 1. Download document from R2
-        file_path, content_type = await client.download_document(doc_id, content_type_hint)
+        if CONFIG.CHECKPOINT_ENABLED:
+            checkpoint = await DocumentCheckpoint.open(doc_id, client)
+
+        # 1. Download document from R2 (or reuse the download from an interrupted run)
+        downloaded = checkpoint.get_stage("download") if checkpoint else None
+        if downloaded and Path(downloaded["file_path"]).exists():
+            file_path, content_type = downloaded["file_path"], downloaded["content_type"]
+            logger.info(f"RESUME: reusing downloaded file {file_path}")
+        else:
+            file_path, content_type = await client.download_document(
+                doc_id, content_type_hint, output_dir=str(checkpoint.work_dir) if checkpoint else None)
+            if checkpoint:
+                await checkpoint.put_stage("download", {"file_path": file_path, "content_type": content_type})
         logger.info(f"Downloaded file type: {content_type}")
 
         # 2. Prepare images based on file type
@@ -316,7 +359,7 @@ async def process_document(client: APIClient, doc: dict) -> dict:
 
         if content_type == 'application/pdf':
             # PDF: Convert to images using pdftoppm (handles rotation internally)
-            image_paths = await convert_pdf_to_images(file_path)
+            image_paths = await render_pdf_pages(file_path, checkpoint)
             page_count = len(image_paths)
             logger.info(f"Converted PDF to {page_count} pages")
         elif content_type in ('image/jpeg', 'image/png'):
@@ -339,10 +382,11 @@ async def process_document(client: APIClient, doc: dict) -> dict:
         else:
             # Unknown type - try as PDF
             logger.warning(f"Unknown content type {content_type}, attempting PDF conversion")
-            image_paths = await convert_pdf_to_images(file_path)
+            image_paths = await render_pdf_pages(file_path, checkpoint)
             page_count = len(image_paths)
 
         logger.info(f"Prepared {page_count} image(s) for extraction")
+        GOVERNOR.update(doc_id, estimate_document_bytes(page_count))
 
         # 3. Determine pipeline type
         # Use flexible pipeline for images, phone uploads, or scan-only PDFs
@@ -379,7 +423,7 @@ async def process_document(client: APIClient, doc: dict) -> dict:
             logger.info(f"Re-analysis overrides flexible pipeline — using strict for better splitting")
             use_flexible = False
             pdf_path_for_splitting = file_path if content_type == 'application/pdf' else None
-        extraction_result = await extract_document_data(image_paths, pdf_path=pdf_path_for_splitting, flexible_pipeline=use_flexible, known_doc_type=known_doc_type, model_override=model_override, cached_page_texts=cached_page_texts, reanalyze=bool(reanalyze))
+        extraction_result = await extract_document_data(image_paths, pdf_path=pdf_path_for_splitting, flexible_pipeline=use_flexible, known_doc_type=known_doc_type, model_override=model_override, cached_page_texts=cached_page_texts, reanalyze=bool(reanalyze), checkpoint=checkpoint)
         
         # 4. Check for multi-document PDF
         if extraction_result.get('is_multi_document'):
@@ -488,7 +532,10 @@ async def process_document(client: APIClient, doc: dict) -> dict:
             }
         
         # 8. Update database
-        logger.info(f"Sending result to documents-worker: {json.dumps(result, indent=2)[:500]}...")
+        record("result", result)
+        logger.info(f"Sending result to documents-worker: status={result['status']}, "
+                    f"doc_type={result.get('doc_type')}, pages={page_count}, "
+                    f"fields_needing_review={len(result.get('fields_needing_review') or [])}")
         await client.complete_document(doc_id, result)
         
         logger.info(f"Completed document {doc_id}: {display_name} ({status})")
@@ -499,7 +546,23 @@ async def process_document(client: APIClient, doc: dict) -> dict:
             'is_multi': False,
             'needs_review': status == 'manual_review'
         }
-        
+
+    except DrainRequested as e:
+        # Shutting down mid-document: leave it 'processing' with its checkpoint intact.
+        # The queue re-claims stuck documents and the next run resumes from the journal.
+        drained = True
+        logger.warning(f"Document {doc_id} checkpointed for resume: {e}")
+        return {
+            'status': 'drained',
+            'user_id': user_id
+        }
+
+    except asyncio.CancelledError:
+        # Lease lost (or shutdown): the document is requeued or already owned by
+        # another worker, which resumes from the remote checkpoint and OCR cache
+        cancelled = True
+        raise
+
     except Exception as e:
         logger.error(f"Failed to process {doc_id}: {e}", exc_info=True)
         
@@ -519,13 +582,18 @@ async def process_document(client: APIClient, doc: dict) -> dict:
         }
         
     finally:
-        # Cleanup temp files
-        cleanup_temp_files(file_path, converted_tiff_path, *image_paths)
-        # Cleanup OCR cache from R2 (if it was used during prescan)
-        try:
-            await client.delete_ocr_cache(doc_id)
-        except Exception:
-            pass
+        if not drained:
+            # Cleanup temp files (including page payloads spilled under memory pressure)
+            spilled = [str(p) for p in map(spill_path_for, image_paths) if p.exists()]
+            cleanup_temp_files(file_path, converted_tiff_path, *spilled, *image_paths)
+            if not cancelled:
+                if checkpoint:
+                    await checkpoint.discard()
+                # Cleanup OCR cache from R2 (if it was used during prescan)
+                try:
+                    await client.delete_ocr_cache(doc_id)
+                except Exception:
+                    pass
 
 
 async def extract_and_upload_children(
@@ -702,56 +770,57 @@ async def handle_multi_document(
         await extract_and_upload_children(client, parent_doc_id, file_path, split_response['extraction_tasks'])
 
 
-async def check_and_notify_user(
-    client: APIClient,
-    user_id: str,
-    processing_results: list[dict]
-) -> None:
-    """
-    Check if user has completed all their queued docs and send notification.
-    
-    Args:
-        client: API client
-        user_id: User to check
-        processing_results: Results from this batch of processing
-    """
-    # Check if user has any remaining queued docs
-    queue_status = await client.get_user_queue_status(user_id)
-    
-    remaining_queued = queue_status.get('queued', 0)
-    remaining_processing = queue_status.get('processing', 0)
-    
-    if remaining_queued > 0 or remaining_processing > 0:
-        logger.debug(f"User {user_id} still has {remaining_queued} queued, {remaining_processing} processing")
-        return
-    
-    # Get user info for email
-    user_info = await client.get_user_info(user_id)
-    if not user_info:
-        logger.warning(f"Could not get user info for {user_id}, skipping notification")
-        return
-    
-    # Count results for this user in this batch
-    user_results = [r for r in processing_results if r.get('user_id') == user_id]
-    
-    completed = sum(1 for r in user_results if r.get('status') in ('complete', 'manual_review'))
-    needs_review = sum(1 for r in user_results if r.get('needs_review'))
-    failed = sum(1 for r in user_results if r.get('status') == 'failed')
-    
-    if completed > 0:
-        await send_completion_email(
-            user_email=user_info.get('email'),
-            user_name=user_info.get('name'),
-            doc_count=completed,
-            docs_needing_review=needs_review
-        )
-    
-    if failed > 0:
-        await send_failure_email(
-            user_email=user_info.get('email'),
-            user_name=user_info.get('name'),
-            doc_count=failed
-        )
+async def run_document(client: APIClient, doc: dict, leases: LeaseKeeper = None) -> dict:
+    """Process one claimed document, keeping its lease alive while it runs."""
+    doc_id = doc['id']
+
+    async def governed() -> dict:
+        # Wait for memory headroom (estimate refined in process_document once pages are rendered)
+        await GOVERNOR.acquire(doc_id, estimate_document_bytes(doc.get('page_count')))
+        # Page text, heuristic traces and model responses for this document (written on failure/sample)
+        recorder = DiagnosticRecorder.start(doc_id, {
+            key: doc.get(key) for key in ('original_filename', 'content_type', 'user_id', 'prescan_only')
+        })
+        result = None
+        try:
+            # Route prescan docs to prescan_document(), others to process_document()
+            if doc.get('prescan_only'):
+                result = await prescan_document(client, doc)
+            else:
+                result = await process_document(client, doc)
+            return result
+        except Exception as e:
+            result = {'status': 'failed', 'error': str(e)}
+            raise
+        finally:
+            # result stays None when cancelled (lease lost / shutdown) - nothing is written then
+            outcome = result or {'status': 'cancelled'}
+            recorder.finish(outcome.get('status'), outcome.get('error'))
+            await GOVERNOR.release(doc_id)
+
+    # The lease is renewed while waiting for admission too
+    task = asyncio.create_task(governed())
+
+    lost = []
+    if leases:
+        leases.hold(doc_id, on_lost=lambda: (lost.append(True), task.cancel()))
+
+    processor_status["in_flight"] += 1
+    try:
+        result = await task
+    except asyncio.CancelledError:
+        if not lost:
+            if leases:
+                await leases.release(doc_id, requeue=True)
+            raise
+        # Another worker owns it now - don't report anything for this document
+        return {'status': 'lease_lost', 'user_id': doc.get('user_id')}
+    finally:
+        processor_status["in_flight"] -= 1
+
+    if leases:
+        await leases.release(doc_id, requeue=result.get('status') == 'drained')
+    return result
 
 
 async def main():
@@ -771,46 +840,63 @@ async def main():
     logger.info(f"API URL: {CONFIG.DOCUMENTS_API_URL}")
     logger.info(f"Poll interval: {CONFIG.POLL_INTERVAL_SECONDS}s")
     logger.info(f"Batch size: {CONFIG.BATCH_SIZE}")
+    logger.info(f"Worker: {CONFIG.WORKER_ID} (capacity {CONFIG.WORKER_CAPACITY}, "
+                f"leases {'on' if CONFIG.QUEUE_LEASES_ENABLED else 'off'})")
     logger.info(f"Claude model: {CONFIG.CLAUDE_MODEL}")
     logger.info("="*60)
-    
-    while True:
+
+    # Graceful drain on shutdown (Fly sends SIGTERM, then SIGKILL after kill_timeout):
+    # stop claiming documents and checkpoint the in-flight one between chunks
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, request_drain)
+
+    leases = LeaseKeeper(client) if CONFIG.QUEUE_LEASES_ENABLED else None
+    slots = asyncio.Semaphore(CONFIG.WORKER_CAPACITY)
+
+    while not is_draining():
         try:
             # Update last poll time
             from datetime import datetime
             processor_status["last_poll"] = datetime.utcnow().isoformat()
             
-            # Get queued documents
-            docs = await client.get_queue(limit=CONFIG.BATCH_SIZE)
+            # Claim only what this machine has capacity for, so other machines
+            # pick up the rest of the queue
+            if leases:
+                docs = await client.claim_documents(CONFIG.WORKER_CAPACITY)
+            else:
+                docs = await client.get_queue(limit=CONFIG.BATCH_SIZE)
             
             if docs:
                 logger.info(f"Found {len(docs)} documents to process")
                 
                 # Track users and results for notifications
-                processing_results = []
                 users_in_batch = set()
-                
-                for doc in docs:
-                    user_id = doc.get('user_id')
-                    if user_id:
-                        users_in_batch.add(user_id)
-
-                    # Route prescan docs to prescan_document(), others to process_document()
-                    if doc.get('prescan_only'):
-                        result = await prescan_document(client, doc)
-                    else:
-                        result = await process_document(client, doc)
-                    processing_results.append(result)
-                    
-                    # Update stats
+
+                async def run_in_slot(doc: dict):
+                    async with slots:
+                        if is_draining():
+                            # Claimed but not started - hand it straight back to the queue
+                            logger.info(f"Draining - leaving {doc['id']} for the next worker")
+                            if leases:
+                                await leases.release(doc['id'], requeue=True)
+                            return None
+                        if doc.get('user_id'):
+                            users_in_batch.add(doc['user_id'])
+                        return await run_document(client, doc, leases)
+
+                results = await asyncio.gather(*(run_in_slot(doc) for doc in docs))
+                processing_results = [r for r in results if r]
+
+                # Update stats
+                for result in processing_results:
                     if result.get('status') == 'failed':
                         processor_status["errors"] += 1
-                    else:
+                    elif result.get('status') not in ('drained', 'lease_lost'):
                         processor_status["documents_processed"] += 1
                 
-                # Check if any users are now complete and should be notified
-                for user_id in users_in_batch:
-                    await check_and_notify_user(client, user_id, processing_results)
+                # Notify users whose queue is now empty (checked and sent in the background)
+                NOTIFIER.submit(client, users_in_batch, processing_results)
                 
                 logger.info(f"Batch complete. Processed {len(docs)} documents.")
             else:
@@ -818,8 +904,12 @@ async def main():
             
             processor_status["healthy"] = True
             
-            # Wait before next poll
-            await asyncio.sleep(CONFIG.POLL_INTERVAL_SECONDS)
+            # Wait before next poll (cut short by a drain request); after a
+            # non-empty batch, go straight back for more work
+            for _ in range(0 if docs else CONFIG.POLL_INTERVAL_SECONDS):
+                if is_draining():
+                    break
+                await asyncio.sleep(1)
             
         except KeyboardInterrupt:
             logger.info("Shutting down...")
@@ -830,6 +920,10 @@ async def main():
             # Back off on error
             await asyncio.sleep(60)
 
+    # Send notifications still waiting for the next Postmark batch
+    await NOTIFIER.close()
+    logger.info("Drained - exiting")
+
 
 # Health check HTTP handlers
 async def health_handler(request):
@@ -838,7 +932,14 @@ async def health_handler(request):
         "status": "healthy" if processor_status["healthy"] else "unhealthy",
         "last_poll": processor_status["last_poll"],
         "documents_processed": processor_status["documents_processed"],
-        "errors": processor_status["errors"]
+        "errors": processor_status["errors"],
+        "worker_id": CONFIG.WORKER_ID,
+        "capacity": CONFIG.WORKER_CAPACITY,
+        "in_flight": processor_status["in_flight"],
+        "memory": GOVERNOR.snapshot(),
+        "notifications": NOTIFIER.snapshot(),
+        "model_routes": ROUTE_STATS.snapshot(),
+        "request_estimates": ESTIMATES.snapshot()
     })
 
 
@@ -0,0 +1,183 @@
+"""
+Memory budget governor.
+
+Processing several large scans at once on a 2 GB VM can OOM: every page is
+rendered, OCR'd and base64-encoded into request payloads. The governor
+
+- estimates a document's peak footprint from page count and render DPI,
+- admits documents only while the estimates fit in MEMORY_BUDGET_MB (one
+  document is always admitted so an oversized scan still runs, just alone),
+- reports memory pressure (RSS over MEMORY_SPILL_FRACTION of the budget, or an
+  over-budget admission) so payload building spills prepared page images to
+  disk and windowed extraction runs one window at a time,
+- exposes its numbers on /health.
+
+The estimates are deliberately rough; RSS is the ground truth for pressure.
+"""
+
+import asyncio
+import logging
+import os
+import resource
+import sys
+import threading
+from pathlib import Path
+from typing import Optional
+
+from .config import CONFIG
+
+logger = logging.getLogger(__name__)
+
+MB = 1024 * 1024
+
+# Letter page (8.5" x 11") in square inches
+PAGE_AREA_SQ_IN = 93.5
+# Compressed JPEG size for a scanned page (pdftoppm -jpeg default quality)
+JPEG_BYTES_PER_PIXEL = 0.25
+# Per-page OCR text, layout data and PyMuPDF/tesseract working set
+TEXT_BYTES_PER_PAGE = 256 * 1024
+# Fixed per-document overhead (PDF handle, results, HTTP buffers)
+DOC_OVERHEAD_BYTES = 40 * MB
+# Page count assumed when the queue doesn't know it yet
+DEFAULT_PAGE_COUNT = 20
+# Long edge the API downsizes images to anyway - spilled payloads are prepared at this size
+API_MAX_EDGE = 1568
+
+
+def current_rss_bytes() -> int:
+    """Resident set size of this process."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        # Not Linux (local dev): peak RSS is the best we have (bytes on macOS, KB elsewhere)
+        maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return maxrss if sys.platform == "darwin" else maxrss * 1024
+
+
+def estimate_document_bytes(page_count: Optional[int], dpi: int = None) -> int:
+    """
+    Rough peak memory for processing one document.
+
+    Args:
+        page_count: Pages in the document (None if unknown)
+        dpi: Render resolution (default CONFIG.IMAGE_DPI)
+
+    Returns:
+        Estimated bytes
+    """
+    page_count = page_count or DEFAULT_PAGE_COUNT
+    dpi = dpi or CONFIG.IMAGE_DPI
+    pixels = PAGE_AREA_SQ_IN * dpi * dpi
+    jpeg_bytes = pixels * JPEG_BYTES_PER_PIXEL
+    decoded_page = pixels * 3  # One RGB page open in PIL at a time
+
+    # Largest single request: long chunks are windowed, so at most one window batch
+    # (or the unwindowed page limit) is base64-encoded at once, plus the serialized body
+    request_pages = min(page_count, max(
+        CONFIG.WINDOWED_EXTRACTION_MAX_PAGES,
+        CONFIG.WINDOWED_EXTRACTION_WINDOW_PAGES * CONFIG.WINDOWED_EXTRACTION_CONCURRENCY))
+    payload = request_pages * jpeg_bytes * 4 / 3 * 2
+
+    return int(DOC_OVERHEAD_BYTES + decoded_page + payload + page_count * TEXT_BYTES_PER_PAGE)
+
+
+def spill_path_for(image_path: str) -> Path:
+    """Where the prepared (API-sized) copy of a page image is spilled."""
+    path = Path(image_path)
+    return path.with_name(f"{path.stem}.spill{API_MAX_EDGE}.jpg")
+
+
+class MemoryGovernor:
+    """Admission control and pressure signal against an RSS budget."""
+
+    def __init__(self, budget_bytes: int = None, spill_fraction: float = None):
+        self.budget_bytes = budget_bytes or CONFIG.MEMORY_BUDGET_MB * MB
+        self.spill_fraction = spill_fraction or CONFIG.MEMORY_SPILL_FRACTION
+        self._reservations: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._changed: Optional[asyncio.Condition] = None
+        self._baseline_bytes: Optional[int] = None
+        self.peak_rss_bytes = 0
+        self.waiting = 0
+        self.delayed_admissions = 0
+        self.spilled_pages = 0
+
+    @property
+    def reserved_bytes(self) -> int:
+        with self._lock:
+            return sum(self._reservations.values())
+
+    def _condition(self) -> asyncio.Condition:
+        if self._changed is None:
+            self._changed = asyncio.Condition()
+        return self._changed
+
+    def _fits(self, estimate: int) -> bool:
+        if not self._reservations:
+            return True  # Never starve: an oversized document runs alone (and spills)
+        return self._baseline_bytes + self.reserved_bytes + estimate <= self.budget_bytes
+
+    async def acquire(self, doc_id: str, estimate: int) -> None:
+        """Wait until doc_id's estimated footprint fits in the budget, then reserve it."""
+        if self._baseline_bytes is None:
+            # Idle process footprint (interpreter + libraries), measured once everything is imported
+            self._baseline_bytes = current_rss_bytes()
+        changed = self._condition()
+        async with changed:
+            if not self._fits(estimate):
+                self.delayed_admissions += 1
+                logger.info(f"Memory budget: holding {doc_id} (~{estimate // MB} MB) until "
+                            f"{self.reserved_bytes // MB} MB in flight drains")
+                self.waiting += 1
+                try:
+                    await changed.wait_for(lambda: self._fits(estimate))
+                finally:
+                    self.waiting -= 1
+            with self._lock:
+                self._reservations[doc_id] = estimate
+
+    def update(self, doc_id: str, estimate: int) -> None:
+        """Replace an admitted document's estimate once its real page count is known."""
+        with self._lock:
+            if doc_id in self._reservations:
+                self._reservations[doc_id] = estimate
+        if self.under_pressure():
+            logger.info(f"Memory budget: {doc_id} re-estimated at ~{estimate // MB} MB - spilling payloads")
+
+    async def release(self, doc_id: str) -> None:
+        changed = self._condition()
+        async with changed:
+            with self._lock:
+                self._reservations.pop(doc_id, None)
+            changed.notify_all()
+
+    def under_pressure(self) -> bool:
+        """True when payloads should be spilled and parallelism reduced."""
+        rss = current_rss_bytes()
+        self.peak_rss_bytes = max(self.peak_rss_bytes, rss)
+        if rss > self.budget_bytes * self.spill_fraction:
+            return True
+        return (self._baseline_bytes or 0) + self.reserved_bytes > self.budget_bytes
+
+    def snapshot(self) -> dict:
+        """Numbers for /health."""
+        rss = current_rss_bytes()
+        self.peak_rss_bytes = max(self.peak_rss_bytes, rss)
+        with self._lock:
+            reservations = {doc_id: round(b / MB) for doc_id, b in self._reservations.items()}
+        return {
+            "budget_mb": round(self.budget_bytes / MB),
+            "rss_mb": round(rss / MB),
+            "peak_rss_mb": round(self.peak_rss_bytes / MB),
+            "baseline_mb": round((self._baseline_bytes or 0) / MB),
+            "reserved_mb": sum(reservations.values()),
+            "reservations_mb": reservations,
+            "under_pressure": self.under_pressure(),
+            "waiting": self.waiting,
+            "delayed_admissions": self.delayed_admissions,
+            "spilled_pages": self.spilled_pages,
+        }
+
+
+GOVERNOR = MemoryGovernor()
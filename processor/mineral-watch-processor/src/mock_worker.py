@@ -0,0 +1,286 @@
+"""
+Local mock of the documents-worker processing API.
+
+Serves a directory of files as a document queue with the same lease semantics as
+the real /api/processing/queue route (claim with worker_id/limit, heartbeat,
+release, reclaim on expiry), so several processors can be run against it to
+check horizontal scaling and that no document is processed twice.
+
+Usage:
+    python -m src.mock_worker --docs ./samples --port 8787 [--copies 10] [--lease-seconds 60]
+
+    # then, in other shells (one per simulated machine)
+    DOCUMENTS_API_URL=http://localhost:8787 PROCESSING_API_KEY=dev WORKER_ID=a python -m src.main
+    DOCUMENTS_API_URL=http://localhost:8787 PROCESSING_API_KEY=dev WORKER_ID=b python -m src.main
+
+GET /stats reports claims and completions per worker and any double processing.
+"""
+
+import argparse
+import logging
+import mimetypes
+import time
+from collections import Counter
+from pathlib import Path
+
+from aiohttp import web
+
+logger = logging.getLogger(__name__)
+
+MAX_ATTEMPTS = 3
+
+
+class MockQueue:
+    """In-memory documents table with lease-based claiming."""
+
+    def __init__(self, files: list[Path], copies: int = 1, default_lease_seconds: int = 300):
+        self.default_lease_seconds = default_lease_seconds
+        self.docs: dict[str, dict] = {}
+        for copy in range(copies):
+            for path in files:
+                doc_id = f"mock-{copy}-{path.stem}"
+                self.docs[doc_id] = {
+                    "id": doc_id,
+                    "path": path,
+                    "filename": path.name,
+                    "original_filename": path.name,
+                    "content_type": mimetypes.guess_type(path.name)[0] or "application/pdf",
+                    "user_id": "mock_user",
+                    "status": "pending",
+                    "processing_attempts": 0,
+                    "lease_owner": None,
+                    "lease_expires_at": None,
+                }
+        self.claims = Counter()
+        self.completions: dict[str, list[str]] = {}
+        self.lease_violations: list[dict] = []
+        self.blobs: dict[str, object] = {}
+
+    def reclaim_expired(self) -> None:
+        now = time.monotonic()
+        for doc in self.docs.values():
+            if (doc["status"] == "processing" and doc["lease_expires_at"] is not None
+                    and doc["lease_expires_at"] < now and doc["processing_attempts"] < MAX_ATTEMPTS):
+                logger.warning(f"Lease on {doc['id']} held by {doc['lease_owner']} expired - requeued")
+                doc.update(status="pending", lease_owner=None, lease_expires_at=None)
+
+    def claim(self, worker_id: str, limit: int, lease_seconds: int) -> list[dict]:
+        self.reclaim_expired()
+        claimed = []
+        for doc in self.docs.values():
+            if len(claimed) >= limit:
+                break
+            if doc["status"] != "pending" or doc["processing_attempts"] >= MAX_ATTEMPTS:
+                continue
+            doc.update(
+                status="processing",
+                processing_attempts=doc["processing_attempts"] + 1,
+                lease_owner=worker_id,
+                lease_expires_at=time.monotonic() + lease_seconds if worker_id else None,
+            )
+            self.claims[worker_id or "legacy"] += 1
+            claimed.append({k: v for k, v in doc.items() if k not in ("path", "lease_expires_at")})
+        return claimed
+
+    def heartbeat(self, doc_id: str, worker_id: str, lease_seconds: int) -> bool:
+        doc = self.docs.get(doc_id)
+        if not doc or doc["status"] != "processing" or doc["lease_owner"] != worker_id:
+            return False
+        doc["lease_expires_at"] = time.monotonic() + lease_seconds
+        return True
+
+    def release(self, doc_id: str, worker_id: str, requeue: bool) -> None:
+        doc = self.docs.get(doc_id)
+        if not doc or doc["lease_owner"] != worker_id:
+            return
+        if requeue and doc["status"] == "processing":
+            doc["status"] = "pending"
+            doc["processing_attempts"] = max(doc["processing_attempts"] - 1, 0)
+        doc.update(lease_owner=None, lease_expires_at=None)
+
+    def complete(self, doc_id: str, worker_id: str, status: str) -> None:
+        doc = self.docs[doc_id]
+        if doc["lease_owner"] not in (None, worker_id):
+            self.lease_violations.append({"doc_id": doc_id, "worker": worker_id, "owner": doc["lease_owner"]})
+            logger.error(f"{worker_id} completed {doc_id} while {doc['lease_owner']} holds the lease")
+        self.completions.setdefault(doc_id, []).append(worker_id)
+        if len(self.completions[doc_id]) > 1:
+            logger.error(f"{doc_id} completed {len(self.completions[doc_id])} times: {self.completions[doc_id]}")
+        doc["status"] = status or "complete"
+
+    def stats(self) -> dict:
+        statuses = Counter(doc["status"] for doc in self.docs.values())
+        per_worker = Counter(workers[-1] for workers in self.completions.values())
+        return {
+            "documents": len(self.docs),
+            "statuses": dict(statuses),
+            "claims_by_worker": dict(self.claims),
+            "completions_by_worker": dict(per_worker),
+            "double_processed": {d: w for d, w in self.completions.items() if len(w) > 1},
+            "lease_violations": self.lease_violations,
+        }
+
+
+def create_app(queue: MockQueue, api_key: str) -> web.Application:
+    @web.middleware
+    async def auth(request, handler):
+        if request.path.startswith("/api/") and request.headers.get("X-API-Key") != api_key:
+            return web.json_response({"error": "Invalid API key"}, status=401)
+        return await handler(request)
+
+    def worker_of(request) -> str:
+        return request.headers.get("X-Worker-Id", "unknown")
+
+    async def get_queue(request):
+        worker_id = request.query.get("worker_id")
+        lease_seconds = int(request.query.get("lease_seconds", queue.default_lease_seconds))
+        limit = int(request.query.get("limit", "1")) if worker_id else 10
+        docs = queue.claim(worker_id, min(max(limit, 1), 10), lease_seconds)
+        return web.json_response({"documents": docs, "count": len(docs),
+                                  "lease_seconds": lease_seconds if worker_id else None})
+
+    async def heartbeat(request):
+        data = await request.json()
+        ok = queue.heartbeat(request.match_info["doc_id"], data.get("worker_id"),
+                             int(data.get("lease_seconds", queue.default_lease_seconds)))
+        if not ok:
+            return web.json_response({"error": "Lease lost"}, status=409)
+        return web.json_response({"success": True})
+
+    async def release(request):
+        data = await request.json()
+        queue.release(request.match_info["doc_id"], data.get("worker_id"), bool(data.get("requeue")))
+        return web.json_response({"success": True})
+
+    async def download(request):
+        doc = queue.docs.get(request.match_info["doc_id"])
+        if not doc:
+            return web.json_response({"error": "Document not found"}, status=404)
+        url = f"{request.scheme}://{request.host}/files/{doc['id']}"
+        return web.json_response({"url": url, "filename": doc["filename"]})
+
+    async def serve_file(request):
+        doc = queue.docs.get(request.match_info["doc_id"])
+        if not doc:
+            raise web.HTTPNotFound()
+        return web.FileResponse(doc["path"], headers={"Content-Type": doc["content_type"]})
+
+    async def complete(request):
+        doc_id = request.match_info["doc_id"]
+        if doc_id not in queue.docs:
+            return web.json_response({"error": "Document not found"}, status=404)
+        data = await request.json()
+        queue.complete(doc_id, worker_of(request), data.get("status"))
+        return web.json_response({"success": True})
+
+    async def prescan_complete(request):
+        doc_id = request.match_info["doc_id"]
+        queue.complete(doc_id, worker_of(request), "prescan_complete")
+        return web.json_response({"success": True})
+
+    async def split(request):
+        data = await request.json()
+        return web.json_response({"success": True, "children": len(data.get("children", []))})
+
+    async def ok(request):
+        return web.json_response({"success": True})
+
+    def blob_routes(kind: str):
+        async def put_blob(request):
+            queue.blobs[f"{kind}:{request.match_info['doc_id']}"] = await request.json()
+            return web.json_response({"success": True})
+
+        async def get_blob(request):
+            key = f"{kind}:{request.match_info['doc_id']}"
+            if key not in queue.blobs:
+                return web.json_response({"error": "Not found"}, status=404)
+            return web.json_response(queue.blobs[key])
+
+        async def delete_blob(request):
+            queue.blobs.pop(f"{kind}:{request.match_info['doc_id']}", None)
+            return web.json_response({"success": True})
+
+        return put_blob, get_blob, delete_blob
+
+    # Checkpoints are mirrored one stage/chunk at a time ("stage.split", "chunk.3")
+    async def put_checkpoint_part(request):
+        parts = queue.blobs.setdefault(f"checkpoint:{request.match_info['doc_id']}", {})
+        parts[request.match_info['part']] = await request.json()
+        return web.json_response({"success": True})
+
+    async def get_checkpoint(request):
+        parts = queue.blobs.get(f"checkpoint:{request.match_info['doc_id']}")
+        if not parts:
+            return web.json_response({"error": "Not found"}, status=404)
+        checkpoint = {"stages": {}, "chunks": {}}
+        for part, payload in parts.items():
+            kind, name = part.split(".", 1)
+            checkpoint["stages" if kind == "stage" else "chunks"][name] = payload
+        return web.json_response(checkpoint)
+
+    async def delete_checkpoint(request):
+        queue.blobs.pop(f"checkpoint:{request.match_info['doc_id']}", None)
+        return web.json_response({"success": True})
+
+    async def user_info(request):
+        # No user record: the processor skips notification emails
+        return web.json_response({"error": "User not found"}, status=404)
+
+    async def user_queue_status(request):
+        return web.json_response({"queued": 0, "processing": 0})
+
+    async def users_queue_status(request):
+        data = await request.json()
+        statuses = {}
+        for user_id in data.get("user_ids", []):
+            docs = [d for d in queue.docs.values() if d["user_id"] == user_id]
+            statuses[user_id] = {"queued": sum(1 for d in docs if d["status"] == "pending"),
+                                 "processing": sum(1 for d in docs if d["status"] == "processing")}
+        return web.json_response({"statuses": statuses})
+
+    async def stats(request):
+        return web.json_response(queue.stats())
+
+    app = web.Application(middlewares=[auth], client_max_size=256 * 1024 * 1024)
+    app.router.add_get("/api/processing/queue", get_queue)
+    app.router.add_post("/api/processing/lease/{doc_id}/heartbeat", heartbeat)
+    app.router.add_post("/api/processing/lease/{doc_id}/release", release)
+    app.router.add_get("/api/processing/download/{doc_id}", download)
+    app.router.add_get("/files/{doc_id}", serve_file)
+    app.router.add_post("/api/processing/complete/{doc_id}", complete)
+    app.router.add_post("/api/processing/prescan-complete/{doc_id}", prescan_complete)
+    app.router.add_post("/api/processing/split/{doc_id}", split)
+    app.router.add_post("/api/processing/split-extracted/{doc_id}", ok)
+    put_blob, get_blob, delete_blob = blob_routes("ocr-cache")
+    app.router.add_post("/api/processing/ocr-cache/{doc_id}", put_blob)
+    app.router.add_get("/api/processing/ocr-cache/{doc_id}", get_blob)
+    app.router.add_delete("/api/processing/ocr-cache/{doc_id}", delete_blob)
+    app.router.add_post("/api/processing/checkpoint/{doc_id}/{part}", put_checkpoint_part)
+    app.router.add_get("/api/processing/checkpoint/{doc_id}", get_checkpoint)
+    app.router.add_delete("/api/processing/checkpoint/{doc_id}", delete_checkpoint)
+    app.router.add_get("/api/processing/user/{user_id}", user_info)
+    app.router.add_get("/api/processing/user/{user_id}/queue-status", user_queue_status)
+    app.router.add_post("/api/processing/users/queue-status", users_queue_status)
+    app.router.add_get("/stats", stats)
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mock documents-worker processing API")
+    parser.add_argument("--docs", required=True, help="Directory of PDFs/images to serve as the queue")
+    parser.add_argument("--port", type=int, default=8787)
+    parser.add_argument("--api-key", default="dev", help="Expected X-API-Key (PROCESSING_API_KEY)")
+    parser.add_argument("--copies", type=int, default=1, help="Queue each file this many times")
+    parser.add_argument("--lease-seconds", type=int, default=300, help="Lease when the client sends none")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    files = sorted(p for p in Path(args.docs).iterdir()
+                   if p.suffix.lower() in (".pdf", ".jpg", ".jpeg", ".png", ".tif", ".tiff"))
+    queue = MockQueue(files, copies=args.copies, default_lease_seconds=args.lease_seconds)
+    logger.info(f"Serving {len(queue.docs)} mock documents from {args.docs} on port {args.port}")
+    web.run_app(create_app(queue, args.api_key), port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""
+Cost-tiered model routing.
+
+Classification and simple, well-structured document types go to a faster,
+cheaper model. Extractions from the fast tier are escalated to the standard
+model when compute_review_flags() / calculate_document_confidence() signal
+trouble. Every call is recorded per route (latency, tokens, cost) and the
+escalation rate is exposed on /health.
+"""
+
+import logging
+import threading
+from typing import Optional
+
+from .config import CONFIG
+
+logger = logging.getLogger(__name__)
+
+TIER_FAST = "fast"
+TIER_STANDARD = "standard"
+TIER_ENHANCED = "enhanced"
+
+# USD per million tokens (input, output) by model ID. A dated snapshot
+# ("claude-opus-4-1-20250805") is priced by its alias; the longest matching ID
+# wins. Opus 4.5+ is priced lower than Opus 4/4.1, so there is deliberately no
+# bare "claude-opus-4" entry - an unlisted model has no price rather than a
+# wrong one.
+MODEL_PRICES = {
+    "claude-haiku-4-5": (1.00, 5.00),
+    "claude-3-5-haiku": (0.80, 4.00),
+    "claude-sonnet-4": (3.00, 15.00),
+    "claude-sonnet-4-5": (3.00, 15.00),
+    "claude-sonnet-4-6": (3.00, 15.00),
+    "claude-opus-4-0": (15.00, 75.00),
+    "claude-opus-4-20250514": (15.00, 75.00),
+    "claude-opus-4-1": (15.00, 75.00),
+    "claude-opus-4-5": (5.00, 25.00),
+    "claude-opus-4-6": (5.00, 25.00),
+}
+
+# Review levels from compute_review_flags() that warrant re-extraction on the stronger model
+ESCALATION_REVIEW_LEVELS = {"opus_reextract", "human_review"}
+
+
+def _fast_doc_types() -> set[str]:
+    return {t.strip() for t in CONFIG.FAST_MODEL_DOC_TYPES.split(",") if t.strip()}
+
+
+def tier_for_model(model: str) -> str:
+    """Name the tier a concrete model belongs to (for metrics)."""
+    if model == CONFIG.CLAUDE_FAST_MODEL:
+        return TIER_FAST
+    if model == CONFIG.CLAUDE_ENHANCED_MODEL:
+        return TIER_ENHANCED
+    return TIER_STANDARD
+
+
+def select_classification_model(model_override: str = None) -> str:
+    """Model for classification calls (quick_classify_document, sonnet_classify_chunk)."""
+    if model_override:
+        return model_override
+    return CONFIG.CLAUDE_FAST_MODEL if CONFIG.MODEL_ROUTING_ENABLED else CONFIG.CLAUDE_MODEL
+
+
+def select_extraction_model(doc_type: Optional[str], model_override: str = None) -> str:
+    """
+    Model for an extraction call.
+
+    Args:
+        doc_type: Classified document type (None if unknown)
+        model_override: Explicit model (e.g. enhanced extraction) — always wins
+
+    Returns:
+        Model name
+    """
+    if model_override:
+        return model_override
+    if CONFIG.MODEL_ROUTING_ENABLED and doc_type in _fast_doc_types():
+        return CONFIG.CLAUDE_FAST_MODEL
+    return CONFIG.CLAUDE_MODEL
+
+
+def escalation_reason(result) -> Optional[str]:
+    """
+    Decide whether a fast-tier extraction should be redone on the standard model.
+
+    Returns:
+        Reason string, or None if the result is acceptable
+    """
+    if not isinstance(result, dict):
+        return None  # Multi-instrument arrays are post-processed per item
+    if "error" in result:
+        return "extraction_failed"
+    review_level = (result.get("_review_flags") or {}).get("review_level")
+    if review_level in ESCALATION_REVIEW_LEVELS:
+        return f"review_level={review_level}"
+    if result.get("document_confidence") == "low":
+        return "document_confidence=low"
+    return None
+
+
+def estimate_cost(model: str, input_tokens: int, output_tokens: int) -> Optional[float]:
+    """USD cost of one call, or None for models without a known price."""
+    matches = [name for name in MODEL_PRICES if model == name or model.startswith(name + "-")]
+    if not matches:
+        return None
+    input_price, output_price = MODEL_PRICES[max(matches, key=len)]
+    return (input_tokens * input_price + output_tokens * output_price) / 1_000_000
+
+
+class RouteStats:
+    """Thread-safe per-route counters (route = "<task>:<tier>", e.g. "extract:fast")."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._routes: dict[str, dict] = {}
+
+    def _route(self, route: str) -> dict:
+        return self._routes.setdefault(route, {
+            "calls": 0, "latency_s": 0.0, "input_tokens": 0, "output_tokens": 0,
+            "cost_usd": 0.0, "escalations": 0,
+        })
+
+    def record_call(self, task: str, model: str, latency_s: float, usage=None) -> None:
+        """Record one API call. usage is the Anthropic response.usage object (may be None)."""
+        input_tokens = getattr(usage, "input_tokens", 0) or 0
+        output_tokens = getattr(usage, "output_tokens", 0) or 0
+        cost = estimate_cost(model, input_tokens, output_tokens) or 0.0
+        with self._lock:
+            stats = self._route(f"{task}:{tier_for_model(model)}")
+            stats["calls"] += 1
+            stats["latency_s"] += latency_s
+            stats["input_tokens"] += input_tokens
+            stats["output_tokens"] += output_tokens
+            stats["cost_usd"] += cost
+
+    def record_escalation(self, task: str, model: str) -> None:
+        """Record that a call on this route had to be redone on a stronger model."""
+        with self._lock:
+            self._route(f"{task}:{tier_for_model(model)}")["escalations"] += 1
+
+    def snapshot(self) -> dict:
+        """Per-route summary for /health and logs."""
+        with self._lock:
+            summary = {}
+            for route, stats in self._routes.items():
+                calls = stats["calls"] or 1
+                summary[route] = {
+                    "calls": stats["calls"],
+                    "avg_latency_s": round(stats["latency_s"] / calls, 2),
+                    "input_tokens": stats["input_tokens"],
+                    "output_tokens": stats["output_tokens"],
+                    "cost_usd": round(stats["cost_usd"], 4),
+                    "escalations": stats["escalations"],
+                    "escalation_rate": round(stats["escalations"] / calls, 3),
+                }
+            return summary
+
+
+ROUTE_STATS = RouteStats()
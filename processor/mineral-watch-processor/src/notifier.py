@@ -1,21 +1,40 @@
-"""Email notifications via Postmark."""
+"""
+Email notifications via Postmark.
 
+Completion/failure emails are queued on NOTIFIER and sent from a background
+task through Postmark's batch endpoint, so the notify phase never holds up
+document processing. Each user's results are counted across batches until
+their queue is empty, so a user whose upload is processed one document per
+batch still gets one email with the full count. A batch's users are checked
+with one queue-status call, user info is cached for USER_INFO_TTL_SECONDS, and
+counts for the same user queued within one flush window are merged into a
+single email.
+
+Point POSTMARK_API_URL at src.fake_postmark to test without sending mail.
+"""
+
+import asyncio
 import httpx
 import logging
+import time
+from typing import Optional
 
 from .config import CONFIG
 
 logger = logging.getLogger(__name__)
 
+# Postmark accepts at most 500 messages per /email/batch request
+POSTMARK_BATCH_LIMIT = 500
 
-async def send_completion_email(
+
+def completion_message(
     user_email: str,
     user_name: str,
     doc_count: int,
     docs_needing_review: int = 0
-) -> bool:
+) -> Optional[dict]:
     """
-    Send completion notification via Postmark.
+    Build the Postmark message for a completion notification.
     
     Args:
         user_email: Recipient email address
@@ -24,11 +43,11 @@ async def send_completion_email(
         docs_needing_review: Number that need manual review
     
     Returns:
-        True if email sent successfully, False otherwise
+        Postmark message dict, or None if there is no address
     """
     if not user_email:
         logger.warning("No email address provided, skipping notification")
-        return False
+        return None
     
     # Build subject line
     if doc_count == 1:
@@ -87,43 +106,23 @@ async def send_completion_email(
     </html>
     """
     
-    try:
-        async with httpx.AsyncClient(timeout=30) as client:
-            response = await client.post(
-                "https://api.postmarkapp.com/email",
-                headers={
-                    "X-Postmark-Server-Token": CONFIG.POSTMARK_API_KEY,
-                    "Content-Type": "application/json"
-                },
-                json={
-                    "From": CONFIG.FROM_EMAIL,
-                    "To": user_email,
-                    "Subject": subject,
-                    "HtmlBody": html_body,
-                    "MessageStream": "outbound"
-                }
-            )
-            
-            if response.status_code == 200:
-                logger.info(f"Sent completion email to {user_email}")
-                return True
-            else:
-                logger.error(f"Postmark error ({response.status_code}): {response.text}")
-                return False
-                
-    except Exception as e:
-        logger.error(f"Failed to send email to {user_email}: {e}")
-        return False
+    return {
+        "From": CONFIG.FROM_EMAIL,
+        "To": user_email,
+        "Subject": subject,
+        "HtmlBody": html_body,
+        "MessageStream": "outbound"
+    }
 
 
-async def send_failure_email(
+def failure_message(
     user_email: str,
     user_name: str,
     doc_count: int,
     error_summary: str = None
-) -> bool:
+) -> Optional[dict]:
     """
-    Send notification when processing fails.
+    Build the Postmark message for a processing failure notification.
     
     Args:
         user_email: Recipient email address
@@ -132,10 +131,10 @@ async def send_failure_email(
         error_summary: Optional error description
     
     Returns:
-        True if email sent successfully, False otherwise
+        Postmark message dict, or None if there is no address
     """
     if not user_email:
-        return False
+        return None
     
     subject = f"Document processing issue - {doc_count} document{'s' if doc_count > 1 else ''}"
     
@@ -178,30 +177,238 @@ async def send_failure_email(
     </html>
     """
     
+    return {
+        "From": CONFIG.FROM_EMAIL,
+        "To": user_email,
+        "Subject": subject,
+        "HtmlBody": html_body,
+        "MessageStream": "outbound"
+    }
+
+
+async def _post_email(message: dict) -> bool:
     try:
         async with httpx.AsyncClient(timeout=30) as client:
             response = await client.post(
-                "https://api.postmarkapp.com/email",
+                f"{CONFIG.POSTMARK_API_URL}/email",
                 headers={
                     "X-Postmark-Server-Token": CONFIG.POSTMARK_API_KEY,
                     "Content-Type": "application/json"
                 },
-                json={
-                    "From": CONFIG.FROM_EMAIL,
-                    "To": user_email,
-                    "Subject": subject,
-                    "HtmlBody": html_body,
-                    "MessageStream": "outbound"
-                }
+                json=message
             )
             
             if response.status_code == 200:
-                logger.info(f"Sent failure email to {user_email}")
+                logger.info(f"Sent \"{message['Subject']}\" to {message['To']}")
                 return True
             else:
                 logger.error(f"Postmark error ({response.status_code}): {response.text}")
                 return False
                 
     except Exception as e:
-        logger.error(f"Failed to send email to {user_email}: {e}")
+        logger.error(f"Failed to send email to {message['To']}: {e}")
         return False
+
+
+async def send_completion_email(user_email: str, user_name: str, doc_count: int,
+                                docs_needing_review: int = 0) -> bool:
+    """Send a completion notification immediately (one Postmark request)."""
+    message = completion_message(user_email, user_name, doc_count, docs_needing_review)
+    return await _post_email(message) if message else False
+
+
+async def send_failure_email(user_email: str, user_name: str, doc_count: int,
+                             error_summary: str = None) -> bool:
+    """Send a failure notification immediately (one Postmark request)."""
+    message = failure_message(user_email, user_name, doc_count, error_summary)
+    return await _post_email(message) if message else False
+
+
+class UserInfoCache:
+    """get_user_info() results (including misses) kept for a TTL."""
+
+    def __init__(self, ttl_seconds: int = None):
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else CONFIG.USER_INFO_TTL_SECONDS
+        self._entries: dict[str, tuple[float, Optional[dict]]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    async def get_many(self, client, user_ids: list[str]) -> dict[str, Optional[dict]]:
+        now = time.monotonic()
+        found, missing = {}, []
+        for user_id in user_ids:
+            entry = self._entries.get(user_id)
+            if entry and now - entry[0] < self.ttl_seconds:
+                found[user_id] = entry[1]
+                self.hits += 1
+            else:
+                missing.append(user_id)
+        if missing:
+            self.misses += len(missing)
+            infos = await asyncio.gather(*(client.get_user_info(u) for u in missing), return_exceptions=True)
+            for user_id, info in zip(missing, infos):
+                if isinstance(info, Exception):
+                    logger.warning(f"Could not fetch user info for {user_id}: {info}")
+                    continue  # Not cached - retry next time
+                self._entries[user_id] = (now, info)
+                found[user_id] = info
+        return found
+
+
+class Notifier:
+    """Accumulates per-user result counts and sends them in Postmark batches once the user's queue is empty."""
+
+    def __init__(self):
+        self.users = UserInfoCache()
+        self._counts: dict[str, dict] = {}
+        self._pending: dict[str, dict] = {}
+        self._tasks: set[asyncio.Task] = set()
+        self._sender: Optional[asyncio.Task] = None
+        self._flushing: Optional[asyncio.Task] = None
+        self._wake: Optional[asyncio.Event] = None
+        self.stats = {"batches": 0, "sent": 0, "failed": 0, "merged": 0}
+
+    def submit(self, client, user_ids, processing_results: list[dict]) -> None:
+        """Add a finished batch's results to its users' counts and check them in the background."""
+        user_ids = sorted(set(user_ids))
+        if not user_ids:
+            return
+        for user_id in user_ids:
+            user_results = [r for r in processing_results if r.get('user_id') == user_id]
+            counts = self._counts.setdefault(user_id, {"completed": 0, "needs_review": 0, "failed": 0})
+            counts["completed"] += sum(1 for r in user_results if r.get('status') in ('complete', 'manual_review'))
+            counts["needs_review"] += sum(1 for r in user_results if r.get('needs_review'))
+            counts["failed"] += sum(1 for r in user_results if r.get('status') == 'failed')
+        task = asyncio.create_task(self._check_users(client, user_ids))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _check_users(self, client, user_ids: list[str]) -> None:
+        try:
+            statuses = await client.get_users_queue_status(user_ids)
+            # A user missing from the response has an unknown status - keep their
+            # counts until a later check reports an empty queue
+            done = [u for u in user_ids if u in statuses
+                    and not statuses[u].get('queued', 0) and not statuses[u].get('processing', 0)]
+            for user_id in set(user_ids) - set(done):
+                status = statuses.get(user_id)
+                if status is None:
+                    logger.debug(f"No queue status for user {user_id}, keeping results pending")
+                    continue
+                logger.debug(f"User {user_id} still has {status.get('queued', 0)} queued, "
+                             f"{status.get('processing', 0)} processing")
+            if not done:
+                return
+
+            infos = await self.users.get_many(client, done)
+            for user_id in done:
+                # Another check may already have sent this user's counts
+                counts = self._counts.pop(user_id, None)
+                if not counts:
+                    continue
+                user_info = infos.get(user_id)
+                if not user_info:
+                    logger.warning(f"Could not get user info for {user_id}, skipping notification")
+                    continue
+                self._queue(user_id, user_info, counts)
+        except Exception as e:
+            logger.error(f"Notification check failed for {len(user_ids)} users: {e}", exc_info=True)
+
+    def _queue(self, user_id: str, user_info: dict, counts: dict) -> None:
+        if not any(counts.values()):
+            return
+        pending = self._pending.get(user_id)
+        if pending:
+            # Same user finished twice within one flush window - one email with the totals
+            self.stats["merged"] += 1
+            for key, value in counts.items():
+                pending["counts"][key] += value
+        else:
+            self._pending[user_id] = {"info": user_info, "counts": counts}
+        self._ensure_sender()
+        self._wake.set()
+
+    def _ensure_sender(self) -> None:
+        if self._wake is None:
+            self._wake = asyncio.Event()
+        if self._sender is None or self._sender.done():
+            self._sender = asyncio.create_task(self._send_loop())
+
+    def _drain_messages(self) -> list[dict]:
+        pending, self._pending = self._pending, {}
+        messages = []
+        for entry in pending.values():
+            info, counts = entry["info"], entry["counts"]
+            if counts["completed"] > 0:
+                messages.append(completion_message(info.get('email'), info.get('name'),
+                                                   counts["completed"], counts["needs_review"]))
+            if counts["failed"] > 0:
+                messages.append(failure_message(info.get('email'), info.get('name'), counts["failed"]))
+        return [m for m in messages if m]
+
+    async def _send_loop(self) -> None:
+        while True:
+            await self._wake.wait()
+            # Let results from concurrently finishing batches accumulate into one request
+            await asyncio.sleep(CONFIG.NOTIFY_FLUSH_SECONDS)
+            self._wake.clear()
+            # Shielded so close() cancelling the loop can't drop a batch mid-send
+            self._flushing = asyncio.create_task(self.flush())
+            await asyncio.shield(self._flushing)
+
+    async def flush(self) -> None:
+        """Send everything queued so far."""
+        messages = self._drain_messages()
+        for i in range(0, len(messages), POSTMARK_BATCH_LIMIT):
+            await self._send_batch(messages[i:i + POSTMARK_BATCH_LIMIT])
+
+    async def _send_batch(self, messages: list[dict]) -> None:
+        self.stats["batches"] += 1
+        try:
+            async with httpx.AsyncClient(timeout=30) as client:
+                response = await client.post(
+                    f"{CONFIG.POSTMARK_API_URL}/email/batch",
+                    headers={
+                        "X-Postmark-Server-Token": CONFIG.POSTMARK_API_KEY,
+                        "Content-Type": "application/json"
+                    },
+                    json=messages
+                )
+            if response.status_code != 200:
+                logger.error(f"Postmark batch error ({response.status_code}): {response.text}")
+                self.stats["failed"] += len(messages)
+                return
+            # The batch endpoint answers 200 with a per-message ErrorCode
+            for message, outcome in zip(messages, response.json()):
+                if outcome.get("ErrorCode", 0) == 0:
+                    self.stats["sent"] += 1
+                    logger.info(f"Sent \"{message['Subject']}\" to {message['To']}")
+                else:
+                    self.stats["failed"] += 1
+                    logger.error(f"Postmark rejected email to {message['To']}: {outcome.get('Message')}")
+        except Exception as e:
+            logger.error(f"Failed to send {len(messages)} notification emails: {e}")
+            self.stats["failed"] += len(messages)
+
+    async def close(self) -> None:
+        """Finish pending checks and send what is queued (call on shutdown)."""
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self._sender:
+            self._sender.cancel()
+        # A flush the sender had started keeps running; wait for it before exiting
+        if self._flushing and not self._flushing.done():
+            await self._flushing
+        await self.flush()
+        if self._counts:
+            logger.info(f"Dropping notification counts for {len(self._counts)} user(s) "
+                        f"whose queue was not empty yet")
+
+    def snapshot(self) -> dict:
+        """Numbers for /health."""
+        return {**self.stats, "pending_users": len(self._pending), "counting_users": len(self._counts),
+                "checks_in_flight": len(self._tasks),
+                "user_info_cache": {"hits": self.users.hits, "misses": self.users.misses}}
+
+
+NOTIFIER = Notifier()
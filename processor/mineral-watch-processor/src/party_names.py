@@ -0,0 +1,247 @@
+"""
+Party-name normalization for chain-of-title matching.
+
+Chain-of-title and heirship extraction normalize thousands of grantor/grantee
+names per document, most of them repeats. Patterns are compiled once, the ~30
+company indicators are checked with a single combined pattern, title/suffix
+rewrites are skipped when a cheap pre-check finds nothing to rewrite, and
+results are memoized (LRU) per raw name.
+
+Output is identical to the original per-call regex implementation; the
+expected outputs are pinned in golden/party_names.json:
+
+    python -m src.party_names              # equivalence check + benchmark
+    python -m src.party_names --names names.txt --repeat 20
+"""
+
+import argparse
+import json
+import re
+import sys
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import List
+
+# Distinct raw names remembered (a title opinion rarely has more than a few thousand)
+NAME_CACHE_SIZE = 65536
+
+# Applied in order, each to the result of the previous one (order matters for
+# overlapping titles such as MR/MRS)
+_TITLE_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'\bMR\.?\s*', r'\bMRS\.?\s*', r'\bMS\.?\s*', r'\bMISS\s+',
+    r'\bDR\.?\s*', r'\bREV\.?\s*', r'\bHON\.?\s*'
+)]
+# Matches wherever any title pattern does - if it finds nothing, no title rewrite applies
+_ANY_TITLE = re.compile(r'\b(?:MR|MRS|MS|MISS|DR|REV|HON)', re.IGNORECASE)
+
+# First match wins
+_SUFFIX_PATTERNS = [(re.compile(p), replacement) for p, replacement in (
+    (r'\bJUNIOR\b', 'JR'),
+    (r'\bJR\.?\b', 'JR'),
+    (r'\bSENIOR\b', 'SR'),
+    (r'\bSR\.?\b', 'SR'),
+    (r'\bII\b', 'II'),
+    (r'\bIII\b', 'III'),
+    (r'\bIV\b', 'IV'),
+)]
+_ANY_SUFFIX = re.compile(r'\b(?:JUNIOR|JR|SENIOR|SR|II|III|IV)\b')
+
+_COMPANY_INDICATOR = re.compile('|'.join((
+    r'\bLLC\b', r'\bL\.L\.C\.?\b', r'\bLIMITED LIABILITY\b',
+    r'\bINC\.?\b', r'\bINCORPORATED\b',
+    r'\bCORP\.?\b', r'\bCORPORATION\b',
+    r'\bCO\.?\b', r'\bCOMPANY\b',
+    r'\bLTD\.?\b', r'\bLIMITED\b',
+    r'\bLP\b', r'\bL\.P\.?\b', r'\bLIMITED PARTNERSHIP\b',
+    r'\bLLP\b', r'\bL\.L\.P\.?\b',
+    r'\bTRUST\b', r'\bESTATE\b', r'\bESTATE OF\b',
+    r'\bPARTNERS\b', r'\bPARTNERSHIP\b',
+    r'\bASSOCIATES\b', r'\bGROUP\b', r'\bHOLDINGS\b',
+    r'\bENERGY\b', r'\bRESOURCES\b', r'\bOIL\b', r'\bGAS\b',
+    r'\bPETROLEUM\b', r'\bOPERATING\b', r'\bPRODUCTION\b',
+    r'\b&\b', r'\bAND\b',
+)))
+
+# Applied in order
+_CORPORATE_SUFFIX_REWRITES = [(re.compile(p), replacement) for p, replacement in (
+    (r'\bL\.L\.C\.?\b', 'LLC'),
+    (r'\bLIMITED LIABILITY COMPANY\b', 'LLC'),
+    (r'\bINCORPORATED\b', 'INC'),
+    (r'\bCORPORATION\b', 'CORP'),
+    (r'\bLIMITED PARTNERSHIP\b', 'LP'),
+    (r'\bL\.P\.?\b', 'LP'),
+    (r'\bL\.L\.P\.?\b', 'LLP'),
+    (r'\bCOMPANY\b', 'CO'),
+    (r'\bLIMITED\b', 'LTD'),
+)]
+
+_WHITESPACE = re.compile(r'\s+')
+_COMMA = re.compile(r'\s*,\s*')
+
+
+def normalize_party_name(name: str) -> str:
+    """
+    Normalize a party name for chain of title matching.
+
+    Rules:
+    - Convert to uppercase
+    - Format individuals as "LAST, FIRST MIDDLE"
+    - Remove titles (Mr., Mrs., Dr., etc.)
+    - Standardize suffixes (Jr., Sr., III, etc.)
+    - Standardize corporate suffixes (LLC, Inc., etc.)
+    - Preserve maiden names in parentheses
+
+    Args:
+        name: Raw name string from document
+
+    Returns:
+        Normalized name string for matching
+    """
+    if not name:
+        return ""
+    return _normalize(str(name))
+
+
+@lru_cache(maxsize=NAME_CACHE_SIZE)
+def _normalize(name: str) -> str:
+    name = name.strip()
+    if not name:
+        return ""
+
+    # Convert to uppercase for consistency
+    name = name.upper()
+
+    # Remove common titles
+    if _ANY_TITLE.search(name):
+        for title in _TITLE_PATTERNS:
+            name = title.sub('', name)
+
+    # Standardize suffixes
+    suffix_found = None
+    if _ANY_SUFFIX.search(name):
+        for pattern, replacement in _SUFFIX_PATTERNS:
+            if pattern.search(name):
+                suffix_found = replacement
+                name = pattern.sub('', name)
+                break
+
+    # Check if this is a company/entity (not an individual)
+    if _COMPANY_INDICATOR.search(name):
+        # For companies, standardize common suffixes and clean up
+        for pattern, replacement in _CORPORATE_SUFFIX_REWRITES:
+            name = pattern.sub(replacement, name)
+        # Clean up extra spaces and punctuation
+        name = _WHITESPACE.sub(' ', name).strip()
+        name = _COMMA.sub(', ', name)
+        return name
+
+    # For individuals, convert to "LAST, FIRST MIDDLE" format
+    # (split() also collapses whitespace, including around removed commas)
+    parts = name.replace(',', ' ').split()
+
+    if len(parts) == 0:
+        return ""
+    elif len(parts) == 1:
+        # Just a last name
+        result = parts[0]
+    elif len(parts) == 2:
+        # First Last -> LAST, FIRST
+        result = f"{parts[1]}, {parts[0]}"
+    else:
+        # First Middle Last -> LAST, FIRST MIDDLE
+        # Or First Middle Middle Last -> LAST, FIRST MIDDLE MIDDLE
+        result = f"{parts[-1]}, {' '.join(parts[:-1])}"
+
+    # Add suffix back if found
+    if suffix_found:
+        result = f"{result} {suffix_found}"
+
+    return result
+
+
+def normalize_party_names(names: List[str]) -> List[str]:
+    """
+    Normalize a list of party names.
+
+    Each distinct name is normalized once; empty entries are dropped.
+
+    Args:
+        names: List of raw name strings
+
+    Returns:
+        List of normalized name strings
+    """
+    if not names:
+        return []
+    present = [name for name in names if name]
+    normalized = {name: normalize_party_name(name) for name in dict.fromkeys(present)}
+    return [normalized[name] for name in present]
+
+
+def cache_info():
+    """LRU statistics for the name memo."""
+    return _normalize.cache_info()
+
+
+# ============================================================================
+# EQUIVALENCE CHECK + BENCHMARK
+# ============================================================================
+
+DEFAULT_GOLDEN = Path(__file__).resolve().parent.parent / "golden" / "party_names.json"
+
+
+def check_equivalence(golden_path: Path = DEFAULT_GOLDEN) -> list[tuple[str, str, str]]:
+    """(raw, expected, actual) for every pinned name whose output changed."""
+    cases = json.loads(golden_path.read_text())["cases"]
+    return [(raw, expected, actual) for raw, expected in cases
+            if (actual := normalize_party_name(raw)) != expected]
+
+
+def _bench(names: list[str], repeat: int) -> dict:
+    _normalize.cache_clear()
+    start = time.perf_counter()
+    for name in names:
+        _normalize.__wrapped__(name)
+    uncached = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        normalize_party_names(names)
+    bulk = (time.perf_counter() - start) / repeat
+
+    return {
+        "names": len(names),
+        "distinct": len(set(names)),
+        "uncached_us_per_name": round(uncached * 1e6 / len(names), 2),
+        "bulk_us_per_name": round(bulk * 1e6 / len(names), 2),
+        "cache": cache_info()._asdict(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Party-name normalizer equivalence check and benchmark")
+    parser.add_argument("--golden", default=str(DEFAULT_GOLDEN), help="Pinned [raw, expected] pairs")
+    parser.add_argument("--names", help="Benchmark on these names (one per line) instead of the golden set")
+    parser.add_argument("--repeat", type=int, default=10, help="Bulk passes to average")
+    args = parser.parse_args()
+
+    mismatches = check_equivalence(Path(args.golden))
+    for raw, expected, actual in mismatches[:20]:
+        print(f"MISMATCH {raw!r}: expected {expected!r}, got {actual!r}")
+
+    if args.names:
+        names = [line.rstrip("\n") for line in open(args.names) if line.strip()]
+    else:
+        # A title opinion repeats each party many times - simulate with the golden set x10
+        names = [raw for raw, _ in json.loads(Path(args.golden).read_text())["cases"]] * 10
+    print(json.dumps(_bench(names, max(args.repeat, 1)), indent=2))
+
+    if mismatches:
+        print(f"{len(mismatches)} names normalize differently from golden/party_names.json")
+        sys.exit(1)
+    print("Normalized output matches golden/party_names.json")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,13 +10,14 @@ from .config import CONFIG
 logger = logging.getLogger(__name__)
 
 
-async def convert_pdf_to_images(pdf_path: str, dpi: int = None) -> list[str]:
+async def convert_pdf_to_images(pdf_path: str, dpi: int = None, output_dir: str = None) -> list[str]:
     """
     Convert PDF to JPEG images using pdftoppm.
     
     Args:
         pdf_path: Path to the PDF file
         dpi: Resolution for output images (default from config)
+        output_dir: Directory for the page images (default: a new temp dir)
     
     Returns:
         List of paths to generated JPEG images
@@ -24,7 +25,8 @@ async def convert_pdf_to_images(pdf_path: str, dpi: int = None) -> list[str]:
     if dpi is None:
         dpi = CONFIG.IMAGE_DPI
     
-    output_dir = tempfile.mkdtemp()
+    if output_dir is None:
+        output_dir = tempfile.mkdtemp()
     output_prefix = Path(output_dir) / "page"
     
     logger.info(f"Converting {pdf_path} to images at {dpi} DPI")
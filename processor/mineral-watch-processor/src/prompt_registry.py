@@ -0,0 +1,129 @@
+"""
+Lazy, versioned registry of prompt templates.
+
+Templates are plain-text resources under src/prompts/ ("extraction/deed" is
+src/prompts/extraction/deed.txt). A template is read from disk the first time
+it is rendered, so importing the extractor no longer materializes ~400 KB of
+prompt literals, and is pre-split once at its substitution points:
+
+- {current_date} placeholders,
+- the end of the first line, where an OCR quality warning is inserted.
+
+Rendering is then a join of the cached pieces instead of a .replace() and
+.split() over the whole mega-prompt on every call. Each template exposes a
+content hash (its version) that is stable across processes and usable as a
+cache key for anything derived from the template.
+
+Templates are substituted with plain string replacement, not str.format():
+"{{" / "}}" in a template are sent to the model verbatim.
+"""
+
+import hashlib
+import logging
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+PROMPTS_DIR = Path(__file__).resolve().parent / "prompts"
+DATE_PLACEHOLDER = "{current_date}"
+
+
+class PromptTemplate:
+    """One prompt resource, loaded and pre-split on first use."""
+
+    def __init__(self, name: str, path: Path):
+        self.name = name
+        self.path = path
+        self._text: Optional[str] = None
+        self._hash: Optional[str] = None
+        self._head: list[str] = []
+        self._body: list[str] = []
+        self._has_body = False
+        self._lock = threading.Lock()
+
+    def _load(self) -> str:
+        if self._text is None:
+            with self._lock:
+                if self._text is None:
+                    # newline="" keeps the file byte-for-byte (no newline translation)
+                    with open(self.path, encoding="utf-8", newline="") as f:
+                        text = f.read()
+                    head, sep, body = text.partition("\n")
+                    self._head = head.split(DATE_PLACEHOLDER)
+                    self._body = body.split(DATE_PLACEHOLDER)
+                    self._has_body = bool(sep)
+                    self._hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
+                    self._text = text
+                    logger.debug(f"Loaded prompt {self.name} ({len(text)} chars, {self.version})")
+        return self._text
+
+    @property
+    def text(self) -> str:
+        """Raw template text."""
+        return self._load()
+
+    @property
+    def content_hash(self) -> str:
+        """SHA-256 of the template text."""
+        self._load()
+        return self._hash
+
+    @property
+    def version(self) -> str:
+        """Short content hash, e.g. for logs and cache keys."""
+        return self.content_hash[:12]
+
+    def render(self, current_date: str, ocr_quality_warning: str = None) -> str:
+        """
+        Fill in the date and insert an optional warning after the first line.
+
+        Args:
+            current_date: Replaces every {current_date}
+            ocr_quality_warning: Optional text inserted as its own paragraph after line 1
+
+        Returns:
+            Rendered prompt
+        """
+        self._load()
+        return self._render(current_date, ocr_quality_warning)
+
+    @lru_cache(maxsize=32)
+    def _render(self, current_date: str, ocr_quality_warning: Optional[str]) -> str:
+        head = current_date.join(self._head)
+        body = current_date.join(self._body)
+        if ocr_quality_warning:
+            return f"{head}\n\n{ocr_quality_warning}\n\n{body}"
+        return f"{head}\n{body}" if self._has_body else head
+
+
+class PromptRegistry:
+    """Name -> PromptTemplate for every resource under a prompts directory."""
+
+    def __init__(self, root: Path = PROMPTS_DIR):
+        self.root = root
+        self._templates: dict[str, PromptTemplate] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> PromptTemplate:
+        """Template by name ("extraction/deed"); raises KeyError if there is no such resource."""
+        template = self._templates.get(name)
+        if template is None:
+            path = self.root / f"{name}.txt"
+            if not path.is_file():
+                raise KeyError(f"No prompt template '{name}' ({path})")
+            with self._lock:
+                template = self._templates.setdefault(name, PromptTemplate(name, path))
+        return template
+
+    def names(self) -> list[str]:
+        return sorted(str(p.relative_to(self.root).with_suffix("")) for p in self.root.rglob("*.txt"))
+
+    def versions(self) -> dict[str, str]:
+        """Short content hash of every template (loads them all)."""
+        return {name: self.get(name).version for name in self.names()}
+
+
+PROMPTS = PromptRegistry()
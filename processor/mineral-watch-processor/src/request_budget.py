@@ -0,0 +1,315 @@
+"""
+Pre-flight size estimates for Claude requests.
+
+Nothing used to look at a request's size before sending it: process_image_batch
+kept each image under 5 MB / 2000 px, but a long chunk could still exceed the
+request-size or context limit and only fail after the upload. Requests are now
+planned before their payloads are built, from
+
+- image tokens predicted from page dimensions (the API's own resize rules),
+- text tokens predicted from the prompt,
+- base64 payload bytes predicted from file sizes.
+
+plan_extraction() takes the first representation that fits the limits: the
+native PDF slice (when the caller offers one), page images as prepared today,
+page images downscaled to the size the API works at anyway, and finally fewer
+pages per call (windowed extraction with a window that fits).
+
+Predictions are logged next to response.usage / the built payload, and the
+predicted-vs-actual ratios are exposed on /health so the constants below can
+be calibrated.
+"""
+
+import logging
+import math
+import os
+import threading
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Optional
+
+from .config import CONFIG
+from .memory_governor import API_MAX_EDGE, JPEG_BYTES_PER_PIXEL, MB
+
+logger = logging.getLogger(__name__)
+
+# API limits
+MAX_REQUEST_BYTES = 32 * MB
+MAX_IMAGES_PER_REQUEST = 100
+MAX_PDF_PAGES = 100
+CONTEXT_TOKENS = 200_000
+
+# The API scales images down to fit API_MAX_EDGE and ~1.15 megapixels, then
+# charges about one token per 750 px²
+API_MAX_PIXELS = 1_150_000
+PIXELS_PER_TOKEN = 750
+
+# _page_payload re-encodes pages over these (JPEG quality 85, long edge <= 2000)
+PAYLOAD_MAX_EDGE = 2000
+PAYLOAD_MAX_IMAGE_BYTES = 5 * MB
+# JPEG quality 85 is larger per pixel than pdftoppm's default
+REENCODED_BYTES_PER_PIXEL = JPEG_BYTES_PER_PIXEL * 1.4
+
+# English prose and JSON schema text; conservative (real prompts run ~3.8)
+CHARS_PER_TOKEN = 3.5
+# "Page N - all M pages" label after each image
+PAGE_LABEL_TOKENS = 15
+# A native PDF page is sent as its image plus its extracted text layer
+PDF_PAGE_TEXT_TOKENS = 1000
+# JSON framing, headers, model/params around the base64 blobs
+REQUEST_OVERHEAD_BYTES = 64 * 1024
+
+# Page size assumed when an image can't be opened (letter at 150 DPI)
+DEFAULT_PAGE_SIZE = (1275, 1650)
+
+REPRESENTATION_PDF = "pdf"
+REPRESENTATION_IMAGES = "images"
+REPRESENTATION_DOWNSCALED = "images_downscaled"
+
+
+def api_working_size(width: int, height: int) -> tuple[int, int]:
+    """Dimensions the API resizes an image to before tokenizing it."""
+    scale = min(1.0, API_MAX_EDGE / max(width, height), math.sqrt(API_MAX_PIXELS / (width * height)))
+    return max(1, int(width * scale)), max(1, int(height * scale))
+
+
+def image_tokens(width: int, height: int) -> int:
+    """Predicted input tokens for one image."""
+    w, h = api_working_size(width, height)
+    return math.ceil(w * h / PIXELS_PER_TOKEN)
+
+
+def text_tokens(text: str) -> int:
+    """Predicted input tokens for a text block."""
+    return math.ceil(len(text) / CHARS_PER_TOKEN) if text else 0
+
+
+def b64_size(n: int) -> int:
+    return 4 * math.ceil(n / 3)
+
+
+@dataclass(frozen=True)
+class PageImage:
+    """What the planner needs to know about one rendered page."""
+
+    width: int
+    height: int
+    file_bytes: int
+
+    @property
+    def tokens(self) -> int:
+        return image_tokens(self.width, self.height)
+
+    def payload_bytes(self, downscaled: bool = False) -> int:
+        """Base64 bytes this page contributes as prepared by _page_payload / _spilled_page_payload."""
+        if downscaled:
+            w, h = api_working_size(self.width, self.height)
+            return b64_size(int(w * h * REENCODED_BYTES_PER_PIXEL))
+        long_edge = max(self.width, self.height)
+        if self.file_bytes <= PAYLOAD_MAX_IMAGE_BYTES and long_edge <= PAYLOAD_MAX_EDGE:
+            return b64_size(self.file_bytes)  # Sent as-is
+        scale = min(1.0, PAYLOAD_MAX_EDGE / long_edge)
+        return b64_size(int(self.width * self.height * scale * scale * REENCODED_BYTES_PER_PIXEL))
+
+
+def probe_page(image_path: str) -> PageImage:
+    """Dimensions and size of a page image (header read only; cached per file version)."""
+    try:
+        stat = os.stat(image_path)
+    except OSError:
+        width, height = DEFAULT_PAGE_SIZE
+        return PageImage(width, height, int(width * height * JPEG_BYTES_PER_PIXEL))
+    return _probe(image_path, stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=4096)
+def _probe(image_path: str, mtime_ns: int, size: int) -> PageImage:
+    try:
+        from PIL import Image
+        with Image.open(image_path) as img:
+            width, height = img.size
+    except Exception:
+        width, height = DEFAULT_PAGE_SIZE
+    return PageImage(width, height, size)
+
+
+@dataclass
+class RequestPlan:
+    """Predicted size of one request and how to send it."""
+
+    representation: str
+    pages: int
+    input_tokens: int
+    payload_bytes: int
+    # Set when no representation fits in one call: pages per call that do
+    pages_per_call: Optional[int] = None
+    rejected: dict = field(default_factory=dict)
+
+    @property
+    def fits(self) -> bool:
+        return self.pages_per_call is None
+
+    def describe(self) -> str:
+        text = (f"{self.representation}, {self.pages} pages, ~{self.input_tokens} input tokens, "
+                f"~{self.payload_bytes / MB:.1f} MB")
+        if not self.fits:
+            text += f" - too large for one call, {self.pages_per_call} pages per call"
+        if self.rejected:
+            text += f" (rejected: {'; '.join(f'{k}: {v}' for k, v in self.rejected.items())})"
+        return text
+
+
+def input_token_budget(max_output_tokens: int) -> int:
+    """Input tokens one request may use, leaving room for the response."""
+    return min(CONFIG.REQUEST_MAX_INPUT_TOKENS, CONTEXT_TOKENS - max_output_tokens)
+
+
+def payload_byte_budget() -> int:
+    """Payload bytes one request may use."""
+    return min(CONFIG.REQUEST_MAX_PAYLOAD_MB * MB, MAX_REQUEST_BYTES)
+
+
+def _limit_problem(plan: RequestPlan, token_budget: int, max_pages: int) -> Optional[str]:
+    if plan.pages > max_pages:
+        return f"{plan.pages} pages > {max_pages}"
+    if plan.input_tokens > token_budget:
+        return f"{plan.input_tokens} tokens > {token_budget}"
+    if plan.payload_bytes > payload_byte_budget():
+        return f"{plan.payload_bytes / MB:.1f} MB > {payload_byte_budget() / MB:.0f} MB"
+    return None
+
+
+def estimate_images(image_paths: list[str], prompt: str = "", downscaled: bool = False) -> RequestPlan:
+    """Predicted size of a request with one image (plus page label) per page and a prompt."""
+    pages = [probe_page(p) for p in image_paths]
+    return RequestPlan(
+        representation=REPRESENTATION_DOWNSCALED if downscaled else REPRESENTATION_IMAGES,
+        pages=len(pages),
+        input_tokens=sum(p.tokens + PAGE_LABEL_TOKENS for p in pages) + text_tokens(prompt),
+        payload_bytes=sum(p.payload_bytes(downscaled) for p in pages) + len(prompt) + REQUEST_OVERHEAD_BYTES)
+
+
+def plan_extraction(image_paths: list[str], prompt: str, max_output_tokens: int,
+                    pdf_bytes: Optional[int] = None) -> RequestPlan:
+    """
+    Choose how to send one extraction request.
+
+    Args:
+        image_paths: Page images of the chunk, in order
+        prompt: Full text prompt sent with the pages
+        max_output_tokens: max_tokens of the call (reserved out of the context window)
+        pdf_bytes: Size of the native PDF slice for these pages, when the caller can send one
+
+    Returns:
+        The first plan that fits (PDF slice, images, downscaled images); if none does,
+        the downscaled plan with pages_per_call set to a window size that fits
+    """
+    token_budget = input_token_budget(max_output_tokens)
+    rejected = {}
+
+    if pdf_bytes is not None:
+        pages = [probe_page(p) for p in image_paths]
+        pdf_plan = RequestPlan(
+            representation=REPRESENTATION_PDF,
+            pages=len(pages),
+            input_tokens=sum(p.tokens + PDF_PAGE_TEXT_TOKENS for p in pages) + text_tokens(prompt),
+            payload_bytes=b64_size(pdf_bytes) + len(prompt) + REQUEST_OVERHEAD_BYTES)
+        problem = _limit_problem(pdf_plan, token_budget, MAX_PDF_PAGES)
+        if problem is None:
+            return pdf_plan
+        rejected[REPRESENTATION_PDF] = problem
+
+    for downscaled in (False, True):
+        plan = estimate_images(image_paths, prompt, downscaled)
+        problem = _limit_problem(plan, token_budget, MAX_IMAGES_PER_REQUEST)
+        if problem is None:
+            plan.rejected = rejected
+            return plan
+        rejected[plan.representation] = problem
+
+    # Fewer pages per call: size the window on the largest page
+    pages = [probe_page(p) for p in image_paths]
+    page_tokens = max(p.tokens for p in pages) + PAGE_LABEL_TOKENS
+    page_bytes = max(p.payload_bytes(downscaled=True) for p in pages)
+    fixed_bytes = len(prompt) + REQUEST_OVERHEAD_BYTES
+    plan.pages_per_call = max(1, min(
+        MAX_IMAGES_PER_REQUEST,
+        (token_budget - text_tokens(prompt)) // page_tokens,
+        (payload_byte_budget() - fixed_bytes) // page_bytes))
+    plan.rejected = rejected
+    return plan
+
+
+def content_payload_bytes(content: list[dict]) -> int:
+    """Actual base64 + text bytes of a built content array (for calibration)."""
+    total = REQUEST_OVERHEAD_BYTES
+    for block in content:
+        source = block.get("source")
+        if source:
+            total += len(source.get("data", ""))
+        total += len(block.get("text", ""))
+    return total
+
+
+class EstimateStats:
+    """Predicted vs actual input tokens and payload bytes per call type."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: dict[str, dict] = {}
+        self.plans: dict[str, int] = {}
+
+    def record_plan(self, plan: RequestPlan) -> None:
+        """Count which representation (or split) the planner chose."""
+        key = plan.representation if plan.fits else "split"
+        with self._lock:
+            self.plans[key] = self.plans.get(key, 0) + 1
+
+    def record_actual(self, call: str, plan: RequestPlan, usage=None, payload_bytes: int = None) -> None:
+        """
+        Log a prediction next to what the call actually used.
+
+        Args:
+            call: Call type ("extract", "detect", ...)
+            plan: Prediction made before the payload was built
+            usage: Anthropic response.usage (input_tokens)
+            payload_bytes: Bytes of the built payload (content_payload_bytes)
+        """
+        actual_tokens = getattr(usage, "input_tokens", None)
+        token_ratio = actual_tokens / plan.input_tokens if actual_tokens and plan.input_tokens else None
+        byte_ratio = payload_bytes / plan.payload_bytes if payload_bytes and plan.payload_bytes else None
+        logger.info(f"Request size ({call}, {plan.representation}, {plan.pages} pages): "
+                    f"predicted {plan.input_tokens} tokens / {plan.payload_bytes / MB:.2f} MB, "
+                    f"actual {actual_tokens} tokens / "
+                    f"{f'{payload_bytes / MB:.2f} MB' if payload_bytes else '?'}"
+                    f"{f' (token ratio {token_ratio:.2f})' if token_ratio else ''}")
+        with self._lock:
+            stats = self._calls.setdefault(f"{call}:{plan.representation}", {
+                "calls": 0, "token_ratio_sum": 0.0, "token_ratio_max": 0.0, "token_samples": 0,
+                "byte_ratio_sum": 0.0, "byte_samples": 0,
+            })
+            stats["calls"] += 1
+            if token_ratio:
+                stats["token_samples"] += 1
+                stats["token_ratio_sum"] += token_ratio
+                stats["token_ratio_max"] = max(stats["token_ratio_max"], token_ratio)
+            if byte_ratio:
+                stats["byte_samples"] += 1
+                stats["byte_ratio_sum"] += byte_ratio
+
+    def snapshot(self) -> dict:
+        """Mean actual/predicted ratios per call type, for /health."""
+        with self._lock:
+            calls = {
+                key: {
+                    "calls": s["calls"],
+                    "avg_token_ratio": round(s["token_ratio_sum"] / s["token_samples"], 3) if s["token_samples"] else None,
+                    "max_token_ratio": round(s["token_ratio_max"], 3),
+                    "avg_byte_ratio": round(s["byte_ratio_sum"] / s["byte_samples"], 3) if s["byte_samples"] else None,
+                }
+                for key, s in self._calls.items()
+            }
+            return {"plans": dict(self.plans), "calls": calls}
+
+
+ESTIMATES = EstimateStats()
@@ -6,10 +6,22 @@ Each document type has its own splitter with family-specific rules.
 """
 
 from .base import BaseSplitter, SplitResult
+from .check_stub import CheckStubSplitter
+from .completion_report import CompletionReportSplitter
 from .division_order import DivisionOrderSplitter
+from .nris import NrisWellRecordSplitter
+from .occ_order import OccOrderSplitter
+from .registry import SPLITTER_REGISTRY, get_splitter, split_by_type
 
 __all__ = [
     'BaseSplitter',
     'SplitResult',
+    'CheckStubSplitter',
+    'CompletionReportSplitter',
     'DivisionOrderSplitter',
+    'NrisWellRecordSplitter',
+    'OccOrderSplitter',
+    'SPLITTER_REGISTRY',
+    'get_splitter',
+    'split_by_type',
 ]
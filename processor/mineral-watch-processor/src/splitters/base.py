@@ -5,6 +5,7 @@ Provides common functionality for all document splitters.
 """
 
 import logging
+import re
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Optional
@@ -74,9 +75,67 @@ class BaseSplitter(ABC):
     # Document type this splitter handles
     doc_type: str = "unknown"
 
+    # Pattern that identifies this family on the first page with text.
+    # The registry only hands a PDF to a splitter whose family pattern matches.
+    FAMILY_PATTERN: Optional[re.Pattern] = None
+
+    # Combined pattern of named groups scanned once per page by scan_pages()
+    SIGNAL_PATTERN: Optional[re.Pattern] = None
+
     def __init__(self):
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
 
+    def matches(self, text_by_page: list[str]) -> bool:
+        """Check whether this PDF belongs to the splitter's document family."""
+        if self.FAMILY_PATTERN is None:
+            return True
+        first_text = next((page for page in text_by_page if page and page.strip()), "")
+        return bool(self.FAMILY_PATTERN.search(first_text))
+
+    def scan_pages(self, text_by_page: list[str]) -> list[dict]:
+        """
+        Collect SIGNAL_PATTERN hits for every page in a single pass.
+
+        Returns:
+            One dict per page mapping group name -> first matched value
+        """
+        signals = []
+        for text in text_by_page:
+            page_signals = {}
+            for match in self.SIGNAL_PATTERN.finditer(text or ""):
+                for name, value in match.groupdict().items():
+                    if value is not None and name not in page_signals:
+                        page_signals[name] = value
+            signals.append(page_signals)
+        return signals
+
+    def result_from_starts(self, starts: list[int], total_pages: int,
+                           metadata: list[dict] = None, reason: str = None) -> SplitResult:
+        """
+        Build a SplitResult from 0-indexed document start pages.
+
+        Args:
+            starts: Sorted 0-indexed pages that begin a document (must include 0)
+            total_pages: Number of pages in the PDF
+            metadata: Optional metadata per document
+            reason: Description of how the split was made
+
+        Returns:
+            SplitResult with 1-indexed inclusive page ranges
+        """
+        if len(starts) <= 1:
+            return SplitResult.single_document(total_pages)
+
+        bounds = starts + [total_pages]
+        page_ranges = [(bounds[i] + 1, bounds[i + 1]) for i in range(len(starts))]
+        return SplitResult(
+            page_ranges=page_ranges,
+            document_count=len(page_ranges),
+            success=True,
+            document_metadata=metadata,
+            reason=reason
+        )
+
     @abstractmethod
     def split(self, text_by_page: list[str]) -> SplitResult:
         """
@@ -0,0 +1,99 @@
+"""
+Check Stub Splitter
+
+Deterministic splitting for royalty check stubs, revenue statements and JIB
+invoices based on:
+- Key: Check # / Invoice # (one per logical document)
+- Boundary: key change, or "Page 1 of N" restart
+- Every page must carry a key; an unkeyed page (another family, e.g. a deed
+  scanned in behind the stubs) fails the split so the PDF goes to LLM detection
+"""
+
+import re
+import logging
+from typing import Optional
+
+from .base import BaseSplitter, SplitResult
+
+logger = logging.getLogger(__name__)
+
+
+class CheckStubSplitter(BaseSplitter):
+    """
+    Splitter for check stubs and joint interest billing statements.
+
+    Operator statement bundles print one check (or invoice) per stub, with the
+    check/invoice number repeated on every overflow page of that stub.
+    """
+
+    doc_type = "check_stub"
+
+    FAMILY_PATTERN = re.compile(
+        r'CHECK\s+STUB|ROYALTY\s+STATEMENT|REVENUE\s+STATEMENT|OWNER\s+STATEMENT|'
+        r'SUPPLEMENTAL\s+CHECK\s+VOUCHER|CHECK\s+DETAIL|JOINT\s+OWNER\s+INVOICE|'
+        r'JOINT\s+INTEREST\s+BILLING|CHECK\s*(?:NO\.?|NUMBER|#)\s*[:\s]*\d{3,}',
+        re.IGNORECASE
+    )
+
+    SIGNAL_PATTERN = re.compile(
+        r'CHECK\s*(?:NO\.?|NUMBER|#)\s*[:\s]*(?P<check>\d{3,})'
+        r'|INVOICE\s*(?:NO\.?|NUMBER|#)\s*[:\s]*(?P<invoice>[A-Z0-9][A-Z0-9\-]{2,})'
+        r'|\bPage\s+(?P<page_one>1)\s+of\s+\d+',
+        re.IGNORECASE
+    )
+
+    def split(self, text_by_page: list[str]) -> SplitResult:
+        """
+        Split a check stub / JIB bundle into individual statements.
+
+        Strategy:
+        1. Scan every page once for check #, invoice # and "Page 1 of N"
+        2. Start a new document when the key changes or numbering restarts
+        3. Fail (LLM fallback) if any page carries no key to anchor on
+        """
+        if not text_by_page:
+            return SplitResult.failed("No text content provided", 0)
+
+        total_pages = len(text_by_page)
+        if self.is_text_empty(text_by_page):
+            return SplitResult.no_text(total_pages)
+
+        signals = self.scan_pages(text_by_page)
+        first_key = self._page_key(signals[0])
+        if first_key is None:
+            return SplitResult.failed("No check/invoice number on first page", total_pages)
+
+        starts = [0]
+        keys = [first_key]
+        current_key = first_key
+        for i in range(1, total_pages):
+            page_key = self._page_key(signals[i])
+            if page_key is None:
+                return SplitResult.failed(f"No check/invoice number on page {i + 1}", total_pages)
+            restarts = "page_one" in signals[i]
+            if page_key != current_key or restarts:
+                starts.append(i)
+                keys.append(page_key)
+                current_key = page_key
+
+        logger.info(f"Check stub split: {len(starts)} document(s), keys {keys}")
+        return self.result_from_starts(
+            starts, total_pages,
+            metadata=[{'check_number': key} for key in keys],
+            reason=f"Split by check/invoice #: {keys}"
+        )
+
+    @staticmethod
+    def _page_key(page_signals: dict) -> Optional[str]:
+        return page_signals.get('check') or page_signals.get('invoice')
+
+    def validate_segment(self, text: str) -> tuple[bool, Optional[str]]:
+        """
+        Validate a check stub segment.
+
+        Invariant: at most one distinct check number per segment.
+        """
+        check_numbers = set(re.findall(r'CHECK\s*(?:NO\.?|NUMBER|#)\s*[:\s]*(\d{3,})', text, re.IGNORECASE))
+        if len(check_numbers) > 1:
+            return False, f"Multiple check numbers in segment: {check_numbers}"
+        return True, None
@@ -0,0 +1,103 @@
+"""
+Completion Report Splitter
+
+Deterministic splitting for OCC Form 1002A/1002C completion reports based on:
+- Start page: "FORM 1002A" / "COMPLETION REPORT" title without back-page markers
+- Key: API number (one well per report)
+- Back pages (FORMATION RECORD, CASING RECORD, ...) stay with the current report
+- A page with no title, back-page marker or API number belongs to another
+  family and fails the split
+"""
+
+import re
+import logging
+from typing import Optional
+
+from .base import BaseSplitter, SplitResult
+
+logger = logging.getLogger(__name__)
+
+
+def _normalize_api(api: str) -> str:
+    return re.sub(r'[\s\-]', '', api)
+
+
+class CompletionReportSplitter(BaseSplitter):
+    """
+    Splitter for Form 1002A/1002C completion report bundles.
+
+    Each report is a front page (title, well identity) followed by one or more
+    back pages (formation/casing/perforation records) for the same well.
+    """
+
+    doc_type = "completion_report"
+
+    FAMILY_PATTERN = re.compile(r'FORM\s+1002\s*-?\s*[AC]\b|COMPLETION\s+REPORT', re.IGNORECASE)
+
+    SIGNAL_PATTERN = re.compile(
+        r'(?P<back_page>FORMATION\s+RECORD|FOR\s+COMMISSION\s+USE\s+ONLY|Initial\s+Test\s+Data'
+        r'|CASING\s+RECORD|CEMENTING\s+RECORD|PERFORATION\s+RECORD|\bPage\s+(?:[2-9]|\d{2,})\s+of\s+\d+)'
+        r'|(?P<title>FORM\s+1002\s*-?\s*[AC]\b|(?:WELL\s+)?COMPLETION\s+REPORT|RECOMPLETION\s+REPORT)'
+        r'|API\s*(?:NO\.?|NUMBER|#)?\s*[:\s]*(?P<api>35\s*-?\s*\d{3}\s*-?\s*\d{5})',
+        re.IGNORECASE
+    )
+
+    def split(self, text_by_page: list[str]) -> SplitResult:
+        """
+        Split a completion report bundle into individual reports.
+
+        Strategy:
+        1. Scan every page once for titles, back-page markers and API numbers
+        2. A titled page without back-page markers starts a report
+        3. An API number change also starts a report
+        4. Fail (LLM fallback) if the first page is not a report front page or
+           any page carries none of these signals
+        """
+        if not text_by_page:
+            return SplitResult.failed("No text content provided", 0)
+
+        total_pages = len(text_by_page)
+        if self.is_text_empty(text_by_page):
+            return SplitResult.no_text(total_pages)
+
+        signals = self.scan_pages(text_by_page)
+        if 'title' not in signals[0] and 'api' not in signals[0]:
+            return SplitResult.failed("First page is not a completion report front page", total_pages)
+
+        starts = [0]
+        current_api = _normalize_api(signals[0]['api']) if 'api' in signals[0] else None
+        apis = [current_api]
+        for i in range(1, total_pages):
+            page = signals[i]
+            if not page:
+                return SplitResult.failed(f"Page {i + 1} is not part of a completion report", total_pages)
+            page_api = _normalize_api(page['api']) if 'api' in page else None
+            is_front_page = 'title' in page and 'back_page' not in page
+            api_changed = page_api is not None and current_api is not None and page_api != current_api
+
+            if is_front_page or api_changed:
+                starts.append(i)
+                apis.append(page_api)
+                current_api = page_api
+            elif current_api is None and page_api:
+                current_api = page_api
+                apis[-1] = page_api
+
+        logger.info(f"Completion report split: {len(starts)} document(s), APIs {apis}")
+        return self.result_from_starts(
+            starts, total_pages,
+            metadata=[{'api_number': api} for api in apis],
+            reason=f"Split by 1002A front page / API number: {apis}"
+        )
+
+    def validate_segment(self, text: str) -> tuple[bool, Optional[str]]:
+        """
+        Validate a completion report segment.
+
+        Invariant: at most one distinct API number per segment.
+        """
+        apis = {_normalize_api(a) for a in re.findall(
+            r'API\s*(?:NO\.?|NUMBER|#)?\s*[:\s]*(35\s*-?\s*\d{3}\s*-?\s*\d{5})', text, re.IGNORECASE)}
+        if len(apis) > 1:
+            return False, f"Multiple API numbers in segment: {apis}"
+        return True, None
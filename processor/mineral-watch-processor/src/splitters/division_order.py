@@ -28,6 +28,8 @@ class DivisionOrderSplitter(BaseSplitter):
 
     doc_type = "division_order"
 
+    FAMILY_PATTERN = re.compile(r'DIVISION\s+ORDER', re.IGNORECASE)
+
     # Patterns for detecting document boundaries
     # Header patterns - indicate start of a new Division Order
     HEADER_PATTERNS = [
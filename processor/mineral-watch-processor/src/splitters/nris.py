@@ -0,0 +1,103 @@
+"""
+NRIS Well Record Splitter
+
+Deterministic splitting for Oklahoma GIS NRIS well record printouts based on:
+- Boundary: "Page 1 of N" in the printout footer/header
+- Invariant: each record spans exactly the N pages its numbering declares
+- Invariant: each record's first page is an NRIS printout (family marker or
+  API number), so numbered pages from another family fail the split
+"""
+
+import re
+import logging
+from typing import Optional
+
+from .base import BaseSplitter, SplitResult
+
+logger = logging.getLogger(__name__)
+
+
+class NrisWellRecordSplitter(BaseSplitter):
+    """
+    Splitter for NRIS well record printouts.
+
+    Browser printouts from the NRIS system number every page "Page X of N",
+    so the numbering alone defines each record. A numbering gap means pages
+    are missing or out of order and the split is rejected.
+    """
+
+    doc_type = "nris_well_record"
+
+    FAMILY_PATTERN = re.compile(r'\bNRIS\b', re.IGNORECASE)
+
+    SIGNAL_PATTERN = re.compile(
+        r'\bPage\s+(?P<page_num>\d{1,3})\s+of\s+(?P<page_total>\d{1,3})\b'
+        r'|API\s*(?:NO\.?|NUMBER|#)?\s*[:\s]*(?P<api>35\s*-?\s*\d{3}\s*-?\s*\d{5})',
+        re.IGNORECASE
+    )
+
+    def split(self, text_by_page: list[str]) -> SplitResult:
+        """
+        Split an NRIS printout bundle into individual well records.
+
+        Strategy:
+        1. Scan every page once for "Page X of N" and API numbers
+        2. Start a new record at every "Page 1 of N"
+        3. Fail (LLM fallback) unless every page is numbered consistently and
+           every record opens with an NRIS marker or API number
+        """
+        if not text_by_page:
+            return SplitResult.failed("No text content provided", 0)
+
+        total_pages = len(text_by_page)
+        if self.is_text_empty(text_by_page):
+            return SplitResult.no_text(total_pages)
+
+        signals = self.scan_pages(text_by_page)
+        starts = []
+        metadata = []
+        expected = None  # (next page number, total) within the current record
+
+        for i, page in enumerate(signals):
+            if 'page_num' not in page:
+                return SplitResult.failed(f"Page {i + 1} has no 'Page X of N' numbering", total_pages)
+            page_num, page_total = int(page['page_num']), int(page['page_total'])
+
+            if page_num == 1:
+                if expected is not None and expected[0] <= expected[1]:
+                    return SplitResult.failed(
+                        f"Record ending at page {i} is missing pages {expected[0]}-{expected[1]}", total_pages)
+                if 'api' not in page and not self.FAMILY_PATTERN.search(text_by_page[i]):
+                    return SplitResult.failed(f"Record starting at page {i + 1} is not an NRIS printout", total_pages)
+                starts.append(i)
+                metadata.append({'api_number': page.get('api'), 'page_count': page_total})
+            elif expected is None or (page_num, page_total) != expected:
+                return SplitResult.failed(
+                    f"Page {i + 1} numbered {page_num} of {page_total}, expected {expected}", total_pages)
+            expected = (page_num + 1, page_total)
+
+        if expected[0] <= expected[1]:
+            return SplitResult.failed("Last record is missing pages", total_pages)
+
+        logger.info(f"NRIS split: {len(starts)} record(s) at pages {[s + 1 for s in starts]}")
+        return self.result_from_starts(
+            starts, total_pages,
+            metadata=metadata,
+            reason=f"Split by NRIS page numbering: {len(starts)} record(s)"
+        )
+
+    def validate_segment(self, text: str) -> tuple[bool, Optional[str]]:
+        """
+        Validate an NRIS segment.
+
+        Invariants:
+        - Must contain a "Page 1 of N"
+        - At most one distinct API number
+        """
+        if not re.search(r'\bPage\s+1\s+of\s+\d{1,3}\b', text, re.IGNORECASE):
+            return False, "Missing 'Page 1 of N'"
+        apis = {re.sub(r'[\s\-]', '', a) for a in re.findall(
+            r'API\s*(?:NO\.?|NUMBER|#)?\s*[:\s]*(35\s*-?\s*\d{3}\s*-?\s*\d{5})', text, re.IGNORECASE)}
+        if len(apis) > 1:
+            return False, f"Multiple API numbers in segment: {apis}"
+        return True, None
@@ -0,0 +1,128 @@
+"""
+OCC Order Splitter
+
+Deterministic splitting for Oklahoma Corporation Commission orders based on:
+- Key: "ORDER NO. XXXXX" running header at the top of every page of an order
+- Boundary: header order number change confirmed by a second signal (the
+  commission caption or a new CAUSE CD NO. in the header)
+- Pages without a header (exhibits, plats) stay with the current order only
+  when their header lines carry the order's cause number; any other unkeyed
+  page fails the split
+- Order numbers cited in the body of an order are ignored
+"""
+
+import re
+import logging
+from typing import Optional
+
+from .base import BaseSplitter, SplitResult
+
+logger = logging.getLogger(__name__)
+
+
+class OccOrderSplitter(BaseSplitter):
+    """
+    Splitter for OCC orders (pooling, spacing, increased density, etc.).
+
+    Multi-page orders repeat "ORDER NO. XXXXX" as a running header, so a
+    change in the header order number marks a document boundary. Only the
+    first HEADER_LINES lines of a page are searched, and a change must be
+    confirmed by the commission caption or a different cause number before
+    it splits; an unconfirmed change fails over to LLM detection.
+    """
+
+    doc_type = "occ_order"
+
+    # Minimum share of pages that must carry an order number before the split
+    # is trusted — scanned orders with little text go to visual detection
+    MIN_KEY_COVERAGE = 0.5
+
+    # Non-empty lines at the top of a page searched for the order header.
+    # Page 1 carries the full caption above ORDER NO., continuation pages a
+    # one-line running header.
+    HEADER_LINES = 15
+
+    CAPTION_PATTERN = re.compile(r'BEFORE\s+THE\s+CORPORATION\s+COMMISSION', re.IGNORECASE)
+
+    FAMILY_PATTERN = re.compile(r'ORDER\s+NO\.?\s*\d{4,}', re.IGNORECASE)
+
+    SIGNAL_PATTERN = re.compile(
+        r'ORDER\s+NO\.?\s*[:\-]?\s*(?P<order>\d{4,})'
+        r'|CAUSE\s+(?:CD\s+)?NO\.?\s*[:\-]?\s*(?P<cause>(?:CD\s*)?\d[\d\-]{5,})',
+        re.IGNORECASE
+    )
+
+    def split(self, text_by_page: list[str]) -> SplitResult:
+        """
+        Split an OCC order bundle into individual orders.
+
+        Strategy:
+        1. Scan the header lines of every page for ORDER NO. and CAUSE CD NO.
+        2. Start a new document when the header order number changes and the
+           page carries the commission caption or a different cause number
+        3. Fail (LLM fallback) when too few pages carry an order number, a
+           change is not confirmed, or a page without an order number cannot
+           be tied to the current order by its cause number
+        """
+        if not text_by_page:
+            return SplitResult.failed("No text content provided", 0)
+
+        total_pages = len(text_by_page)
+        if self.is_text_empty(text_by_page):
+            return SplitResult.no_text(total_pages)
+
+        headers = [self.header_text(text) for text in text_by_page]
+        signals = self.scan_pages(headers)
+        keyed_pages = sum(1 for s in signals if 'order' in s)
+        if 'order' not in signals[0]:
+            return SplitResult.failed("No ORDER NO. on first page", total_pages)
+        if keyed_pages / total_pages < self.MIN_KEY_COVERAGE:
+            return SplitResult.failed(
+                f"ORDER NO. found on only {keyed_pages}/{total_pages} pages", total_pages)
+
+        starts = [0]
+        metadata = [{'order_number': signals[0]['order'], 'cause_number': signals[0].get('cause')}]
+        current_order = signals[0]['order']
+        current_cause = signals[0].get('cause')
+        for i in range(1, total_pages):
+            page_order = signals[i].get('order')
+            page_cause = signals[i].get('cause')
+            if not page_order:
+                if not (page_cause and page_cause == current_cause):
+                    return SplitResult.failed(
+                        f"Page {i + 1} has no ORDER NO. or cause number of order {current_order}", total_pages)
+                continue
+            if page_order == current_order:
+                continue
+            new_cause = page_cause and current_cause and page_cause != current_cause
+            if not (self.CAPTION_PATTERN.search(headers[i]) or new_cause):
+                return SplitResult.failed(
+                    f"ORDER NO. changes {current_order} -> {page_order} on page {i + 1} "
+                    f"without a caption or new cause number", total_pages)
+            starts.append(i)
+            metadata.append({'order_number': page_order, 'cause_number': page_cause})
+            current_order, current_cause = page_order, page_cause
+
+        order_numbers = [m['order_number'] for m in metadata]
+        logger.info(f"OCC order split: {len(starts)} document(s), orders {order_numbers}")
+        return self.result_from_starts(
+            starts, total_pages,
+            metadata=metadata,
+            reason=f"Split by ORDER NO.: {order_numbers}"
+        )
+
+    def header_text(self, text: str) -> str:
+        """The first HEADER_LINES non-empty lines of a page."""
+        lines = [line for line in (text or "").splitlines() if line.strip()]
+        return "\n".join(lines[:self.HEADER_LINES])
+
+    def validate_segment(self, text: str) -> tuple[bool, Optional[str]]:
+        """
+        Validate an OCC order segment.
+
+        Invariant: the segment opens with an ORDER NO. header. Later pages
+        are checked by split() (body text may cite other orders).
+        """
+        if not self.FAMILY_PATTERN.search(self.header_text(text)):
+            return False, "Missing ORDER NO. header"
+        return True, None
@@ -0,0 +1,76 @@
+"""
+Splitter Registry
+
+Maps heuristic document types (from heuristic_page_check) to the
+family-specific deterministic splitters that can handle them.
+"""
+
+import logging
+from typing import Optional
+
+from .base import BaseSplitter, SplitResult
+from .check_stub import CheckStubSplitter
+from .completion_report import CompletionReportSplitter
+from .division_order import DivisionOrderSplitter
+from .nris import NrisWellRecordSplitter
+from .occ_order import OccOrderSplitter
+
+logger = logging.getLogger(__name__)
+
+# Heuristic type -> candidate splitters, most specific first.
+# The first splitter whose FAMILY_PATTERN matches the PDF is used.
+SPLITTER_REGISTRY: dict[str, list[type[BaseSplitter]]] = {
+    "check": [DivisionOrderSplitter, CheckStubSplitter],
+    "order": [OccOrderSplitter],
+    "permit": [CompletionReportSplitter],
+    "completion_report": [NrisWellRecordSplitter, CompletionReportSplitter],
+}
+
+
+def get_splitter(heuristic_type: Optional[str], text_by_page: list[str]) -> Optional[BaseSplitter]:
+    """
+    Pick the deterministic splitter for a PDF.
+
+    Args:
+        heuristic_type: Coarse type from heuristic_page_check() on the first page
+        text_by_page: Text content, one string per page
+
+    Returns:
+        Splitter instance, or None if no registered splitter claims the PDF
+    """
+    for splitter_cls in SPLITTER_REGISTRY.get(heuristic_type, []):
+        splitter = splitter_cls()
+        if splitter.matches(text_by_page):
+            return splitter
+    return None
+
+
+def split_by_type(heuristic_type: Optional[str], text_by_page: list[str]) -> tuple[Optional[str], SplitResult]:
+    """
+    Run the registered deterministic splitter and validate every segment.
+
+    Args:
+        heuristic_type: Coarse type from heuristic_page_check() on the first page
+        text_by_page: Text content, one string per page
+
+    Returns:
+        Tuple of (splitter doc_type or None, SplitResult). success=False means
+        the caller should fall back to LLM detection.
+    """
+    total_pages = len(text_by_page)
+    splitter = get_splitter(heuristic_type, text_by_page)
+    if splitter is None:
+        return None, SplitResult.failed(f"No splitter registered for type '{heuristic_type}'", total_pages)
+
+    result = splitter.split(text_by_page)
+    if not result.success:
+        logger.info(f"{splitter.__class__.__name__} could not split: {result.reason}")
+        return splitter.doc_type, result
+
+    for start, end in result.page_ranges:
+        is_valid, error = splitter.validate_segment("\n".join(text_by_page[start - 1:end]))
+        if not is_valid:
+            logger.info(f"{splitter.__class__.__name__} segment pages {start}-{end} failed validation: {error}")
+            return splitter.doc_type, SplitResult.failed(f"Segment {start}-{end} invalid: {error}", total_pages)
+
+    return splitter.doc_type, result
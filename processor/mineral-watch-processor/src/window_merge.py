@@ -0,0 +1,112 @@
+"""
+Deterministic merge of per-window partial extractions.
+
+Long instruments are extracted in page windows (see extract_single_document_windowed
+in extractor.py). Each window returns the normal schema populated only with what
+appears on its pages; this module folds those partials into one result.
+
+Merge rules:
+- Scalars: the non-empty candidate with the highest field score wins; ties go to
+  the earliest window (titles, parties and dates usually lead the instrument)
+- Lists: concatenated in page order, exact duplicates dropped
+- Dicts: merged recursively with the same rules
+- doc_type: majority vote across windows
+- field_scores: highest score per field
+- key_takeaway: first window's; ai_observations: joined in page order
+- Private keys (leading "_") are dropped — the caller recomputes them
+"""
+
+import json
+from collections import Counter
+
+# Score assumed for a field the window did not score
+DEFAULT_FIELD_SCORE = 0.5
+
+
+def _is_empty(value) -> bool:
+    return value is None or value == "" or value == [] or value == {}
+
+
+def _canonical(value) -> str:
+    return json.dumps(value, sort_keys=True, default=str)
+
+
+def _merge_values(candidates: list[tuple[object, float]], path: str, conflicts: list[str]):
+    """Merge (value, score) candidates for one key, in window order."""
+    present = [(v, s) for v, s in candidates if not _is_empty(v)]
+    if not present:
+        return candidates[0][0] if candidates else None
+
+    if all(isinstance(v, list) for v, _ in present):
+        merged, seen = [], set()
+        for value, _ in present:
+            for item in value:
+                key = _canonical(item)
+                if key not in seen:
+                    seen.add(key)
+                    merged.append(item)
+        return merged
+
+    if all(isinstance(v, dict) for v, _ in present):
+        keys = list(dict.fromkeys(k for v, _ in present for k in v))
+        return {
+            k: _merge_values([(v.get(k), s) for v, s in present], f"{path}.{k}", conflicts)
+            for k in keys
+        }
+
+    if len({_canonical(v) for v, _ in present}) > 1:
+        conflicts.append(path)
+    best_value, _ = max(present, key=lambda vs: vs[1])  # max() keeps the first of equal scores
+    return best_value
+
+
+def merge_window_extractions(partials: list[dict]) -> dict:
+    """
+    Merge per-window extractions of one document into a single result.
+
+    Args:
+        partials: Window results in page order (error results are skipped)
+
+    Returns:
+        Merged extraction dict with "_window_conflicts" listing fields whose
+        windows disagreed (candidates for an optional reconcile pass)
+    """
+    usable = [p for p in partials if isinstance(p, dict) and "error" not in p]
+    if not usable:
+        return {"error": "All extraction windows failed"}
+
+    conflicts = []
+    merged = {}
+
+    doc_types = Counter(p.get("doc_type") for p in usable if p.get("doc_type"))
+    if doc_types:
+        merged["doc_type"] = doc_types.most_common(1)[0][0]
+
+    field_scores = {}
+    for partial in usable:
+        for field, score in (partial.get("field_scores") or {}).items():
+            if isinstance(score, (int, float)):
+                field_scores[field] = max(score, field_scores.get(field, 0.0))
+
+    skip = {"doc_type", "field_scores", "key_takeaway", "ai_observations"}
+    keys = list(dict.fromkeys(k for p in usable for k in p if not k.startswith("_") and k not in skip))
+    for key in keys:
+        candidates = []
+        for partial in usable:
+            score = (partial.get("field_scores") or {}).get(key, DEFAULT_FIELD_SCORE)
+            candidates.append((partial.get(key), score if isinstance(score, (int, float)) else DEFAULT_FIELD_SCORE))
+        merged[key] = _merge_values(candidates, key, conflicts)
+
+    if field_scores:
+        merged["field_scores"] = field_scores
+
+    takeaways = [p["key_takeaway"] for p in usable if p.get("key_takeaway")]
+    if takeaways:
+        merged["key_takeaway"] = takeaways[0]
+
+    observations = [p["ai_observations"] for p in usable if p.get("ai_observations")]
+    if observations:
+        merged["ai_observations"] = "\n\n".join(observations)
+
+    merged["_window_conflicts"] = conflicts
+    return merged
@@ -17,14 +17,21 @@ Usage:
 """
 
 import argparse
+import collections
+import hashlib
 import json
 import os
+import queue
 import re
+import shutil
 import sqlite3
 import sys
+import tempfile
+import threading
 import time
 import urllib.error
 import urllib.request
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
 
 # ---------------------------------------------------------------------------
@@ -33,12 +40,14 @@ from pathlib import Path
 
 try:
     import boto3
+    from boto3.s3.transfer import TransferConfig
     from botocore.config import Config as BotoConfig
 except ImportError:
     boto3 = None  # checked at upload time
 
 try:
     from pypdf import PdfReader, PdfWriter
+    from pypdf.generic import ArrayObject, DictionaryObject, IndirectObject
 except ImportError:
     PdfReader = PdfWriter = None  # checked at split time
 
@@ -66,8 +75,33 @@ R2_ENDPOINT = f"https://{R2_ACCOUNT_ID}.r2.cloudflarestorage.com" if R2_ACCOUNT_
 STATE_DB_PATH = Path(__file__).parent / ".ingest-state.db"
 PARSE_BATCH = 50  # items per /ingest-parse call (lightweight, no DB)
 DEDUP_BATCH = 25
+HASH_WORKERS = 8  # files hashed concurrently during scan
+SCAN_WORKERS = 16  # folders listed concurrently (NAS round trips dominate)
+HASH_CHUNK = 1024 * 1024  # bytes read per hash update
 MATCH_BATCH = 20  # items per /ingest-match call (each item can generate several bind params)
-QUEUE_POLL_INTERVAL = 30  # seconds
+MATCH_CACHE_TTL = 24 * 3600  # seconds a cached match is trusted (properties and wells change)
+QUEUE_POLL_INTERVAL = 10  # seconds between /queue-status polls
+QUEUE_POLL_MAX_INTERVAL = 120  # poll backoff ceiling while /queue-status is failing
+QUEUE_HORIZON = 120  # seconds over which admission closes the gap to the target depth
+QUEUE_INITIAL_RATE = 0.5  # files/s admitted before the drain rate is measured
+QUEUE_MAX_ERRORS = 3  # consecutive failed polls before admission pauses
+MB = 1024 * 1024
+
+# PDF splitting
+SPLIT_DIR = Path(tempfile.gettempdir()) / "mw-ingest-split"  # parts are written under <SPLIT_DIR>/<pid>/
+SPLIT_HEADROOM = 0.95  # fraction of the threshold parts are packed to (xref, trailer, estimate error)
+PDF_OBJECT_OVERHEAD = 64  # bytes per object for its dictionary and xref entry
+
+# Upload engine defaults (overridable on the command line)
+UPLOAD_WORKERS = 8  # files uploading to R2 at once
+REGISTER_WORKERS = 4  # concurrent registration calls
+REGISTER_BATCH = 25  # documents per /register-external-batch call (1 = one call per document)
+REGISTER_BATCH_MAX = 50  # server-side limit per batch call
+REGISTER_LINGER = 0.5  # seconds a registration worker waits for a batch to fill
+MULTIPART_CHUNK_MB = 16  # S3 multipart part size; files above this use multipart
+MULTIPART_CONCURRENCY = 4  # parts in flight per file
+DASHBOARD_INTERVAL = 10  # seconds between throughput lines
+ETA_WINDOW = 60  # seconds of recent throughput the upload ETA is based on
 
 
 # ---------------------------------------------------------------------------
@@ -75,11 +109,84 @@ QUEUE_POLL_INTERVAL = 30  # seconds
 # ---------------------------------------------------------------------------
 
 
-def scan_folder(root_path: str, filter_county: str | None = None) -> list[dict]:
+def list_directory(root: Path, rel_dir: str, cached: tuple | None) -> tuple:
+    """
+    One directory of the walk. A directory whose mtime matches the index has
+    the same entries as last time, so its cached listing is reused without
+    enumerating it. Returns (rel_dir, mtime_ns, subdirs, pdfs, reused) with
+    pdfs as [(name, size, mtime_ns)] (None when reused).
+    """
+    path = root / rel_dir if rel_dir else root
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+        if cached is not None and cached[0] == mtime_ns:
+            return rel_dir, mtime_ns, cached[1], None, True
+
+        subdirs, pdfs = [], []
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(f"{rel_dir}/{entry.name}" if rel_dir else entry.name)
+                elif entry.name.endswith(".pdf") and not entry.name.startswith(".") and entry.is_file():
+                    st = entry.stat()
+                    pdfs.append((entry.name, st.st_size, st.st_mtime_ns))
+        return rel_dir, mtime_ns, subdirs, pdfs, False
+    except OSError as e:
+        print(f"  Warning: cannot read {path}: {e}", file=sys.stderr)
+        return rel_dir, None, [], [], False
+
+
+def walk_tree(root: Path, dir_index: dict, file_index: dict, workers: int) -> tuple[dict, dict, int]:
+    """
+    Walk root in parallel (one list_directory per folder on a thread pool).
+
+    dir_index {rel_dir: (mtime_ns, subdirs)} and file_index {rel_dir: pdfs}
+    are the previous scan's listing. Returns the new (dirs, pdfs_by_dir,
+    folders_listed) in the same shapes.
+    """
+    dirs: dict[str, tuple] = {}
+    pdfs_by_dir: dict[str, list] = {}
+    listed = 0
+    with ThreadPoolExecutor(workers, thread_name_prefix="ingest-scan") as pool:
+        pending = {pool.submit(list_directory, root, "", dir_index.get(""))}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                rel_dir, mtime_ns, subdirs, pdfs, reused = future.result()
+                if mtime_ns is None:
+                    continue
+                if reused:
+                    pdfs = file_index.get(rel_dir, [])
+                else:
+                    listed += 1
+                dirs[rel_dir] = (mtime_ns, subdirs)
+                pdfs_by_dir[rel_dir] = pdfs
+                pending |= {pool.submit(list_directory, root, d, dir_index.get(d)) for d in subdirs}
+    return dirs, pdfs_by_dir, listed
+
+
+def scan_folder(
+    root_path: str,
+    user_id: str,
+    org_id: str | None,
+    filter_county: str | None = None,
+    hash_workers: int = HASH_WORKERS,
+    scan_workers: int = SCAN_WORKERS,
+    full_scan: bool = False,
+    use_cache: bool = True,
+) -> list[dict]:
     """
     Walk directory tree, find PDFs, collect filenames and ancestor folder names.
 
-    Returns list of dicts: {path, filename, file_size, folders, needs_split}
+    Folders are listed in parallel; folders unchanged since the last scan of
+    this root (same mtime) reuse the listing stored in the state DB instead of
+    being enumerated (full_scan lists everything, and also catches PDFs
+    rewritten in place, which don't change their folder's mtime). PDFs that an
+    earlier session for the same user/org already recorded with the same size
+    and mtime, other than failures, are left out, so only new or modified files are parsed, hashed,
+    deduped and matched.
+
+    Returns list of dicts: {path, filename, file_size, folders, needs_split, mtime_ns, sha256}
     Parsing (county, TRS, API, well name) is deferred to the server.
     """
     root = Path(root_path)
@@ -87,38 +194,111 @@ def scan_folder(root_path: str, filter_county: str | None = None) -> list[dict]:
         print(f"Error: {root_path} is not a directory", file=sys.stderr)
         sys.exit(1)
 
-    files = []
-
-    for pdf_path in sorted(root.rglob("*.pdf")):
-        if pdf_path.name.startswith("."):
-            continue
-
-        # Collect ancestor folder names (closest first) for server-side county resolution
-        rel = pdf_path.relative_to(root)
-        folders = [p.name for p in rel.parents if p.name]
+    conn = init_state_db()
+    root_key = str(root.resolve())
+    dir_index, file_index = ({}, {}) if full_scan else load_scan_index(conn, root_key)
 
-        file_size = pdf_path.stat().st_size
+    start = time.monotonic()
+    dirs, pdfs_by_dir, listed = walk_tree(root, dir_index, file_index, scan_workers)
+    save_scan_index(conn, root_key, dirs, pdfs_by_dir)
+    print(f"  {len(dirs)} folders ({listed} listed, {len(dirs) - listed} unchanged) in {time.monotonic() - start:.1f}s")
 
-        files.append({
-            "path": str(pdf_path),
-            "filename": pdf_path.name,
-            "file_size": file_size,
-            "folders": folders,
-            "needs_split": file_size > 100 * 1024 * 1024,  # default 100MB
-        })
+    files = []
+    for rel_dir in sorted(pdfs_by_dir):
+        # Ancestor folder names (closest first) for server-side county resolution
+        folders = rel_dir.split("/")[::-1] if rel_dir else []
+        for name, file_size, mtime_ns in pdfs_by_dir[rel_dir]:
+            files.append({
+                "path": str(root / rel_dir / name),
+                "filename": name,
+                "file_size": file_size,
+                "mtime_ns": mtime_ns,
+                "folders": folders,
+                "needs_split": file_size > 100 * 1024 * 1024,  # default 100MB
+            })
+    files.sort(key=lambda f: f["path"])
+
+    seen = previously_ingested(conn, files, user_id, org_id)
+    conn.close()
+    if seen:
+        files = [f for i, f in enumerate(files) if i not in seen]
+        print(f"  {len(seen)} PDFs unchanged since an earlier session (skipped)")
 
     # If filter_county specified, we need to parse first to filter.
-    # Do a quick server parse of all files, then filter by county.
+    # Do a quick server parse of the new files, then filter by county.
     if filter_county and files:
         print(f"Parsing filenames to filter by county '{filter_county}'...")
-        parsed = parse_filenames(files)
+        parsed = parse_filenames(files, use_cache)
         apply_parsed(files, parsed)
         fc_upper = filter_county.upper()
         files = [f for f in files if f.get("county") and f["county"].upper() == fc_upper]
 
+    hash_files(files, hash_workers)
     return files
 
 
+# ---------------------------------------------------------------------------
+# Content hashing (SHA-256, cached in the state DB by path + mtime + size)
+# ---------------------------------------------------------------------------
+
+
+def sha256_file(path: str) -> str:
+    """Streaming SHA-256 of a file."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        while chunk := fh.read(HASH_CHUNK):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def hash_files(files: list[dict], workers: int = HASH_WORKERS) -> None:
+    """
+    Set f["sha256"] for every file. Unchanged files (same path, mtime and size
+    as a previous scan) reuse the cached hash, so rescans only read new files.
+    """
+    if not files:
+        return
+    conn = init_state_db()
+    cached = load_cached_hashes(conn, files)
+    todo = []
+    for f in files:
+        sha = cached.get((f["path"], f["mtime_ns"], f["file_size"]))
+        if sha:
+            f["sha256"] = sha
+        else:
+            todo.append(f)
+
+    if todo:
+        todo_gb = sum(f["file_size"] for f in todo) / (1024 ** 3)
+        print(f"Hashing {len(todo)} files ({todo_gb:.1f} GB, {len(files) - len(todo)} cached)...")
+        start = time.monotonic()
+        with ThreadPoolExecutor(workers, thread_name_prefix="ingest-hash") as pool:
+            # hashlib releases the GIL on large updates, so threads hash in parallel
+            for f, sha in zip(todo, pool.map(lambda f: sha256_file(f["path"]), todo)):
+                f["sha256"] = sha
+        save_cached_hashes(conn, todo)
+        print(f"  Hashed in {time.monotonic() - start:.1f}s")
+    conn.close()
+
+
+def find_local_duplicates(files: list[dict]) -> dict:
+    """
+    Identical content within the scanned tree. Returns {index: dup_info} for
+    every copy after the first (in scan order) of each hash.
+    """
+    first_by_hash: dict[str, int] = {}
+    dupes = {}
+    for i, f in enumerate(files):
+        sha = f.get("sha256")
+        if not sha:
+            continue
+        if sha in first_by_hash:
+            dupes[i] = {"matchType": "local", "duplicateOf": files[first_by_hash[sha]]["path"]}
+        else:
+            first_by_hash[sha] = i
+    return dupes
+
+
 # ---------------------------------------------------------------------------
 # HTTP helpers (stdlib only — no requests dependency)
 # ---------------------------------------------------------------------------
@@ -170,18 +350,60 @@ def api_get(endpoint: str, timeout: int = 15) -> dict:
 # ---------------------------------------------------------------------------
 
 
-def parse_filenames(files: list[dict]) -> list[dict]:
+def get_server_versions() -> dict:
+    """
+    {parser, matcher} versions of the server's /ingest-parse and /ingest-match,
+    which key the local result cache. Empty if the server doesn't report them
+    (nothing is then cached).
+    """
+    global _server_versions
+    if _server_versions is None:
+        try:
+            _server_versions = api_get("/api/documents/ingest-versions")
+        except Exception:
+            _server_versions = {}
+    return _server_versions
+
+
+_server_versions: dict | None = None
+
+
+def parse_filenames(files: list[dict], use_cache: bool = True) -> list[dict]:
     """
     POST batches to /ingest-parse. Server parses county, TRS, API, well name
     from filenames and folder names. Returns list of parsed dicts (same order).
+
+    Results are cached in the state DB by (parser version, filename, folders);
+    only names not parsed by the current server version are sent.
     """
+    version = get_server_versions().get("parser")
+    conn = init_state_db()
+    cached = load_parse_cache(conn, version) if version and use_cache else {}
+
     all_parsed = [None] * len(files)
-    for i in range(0, len(files), PARSE_BATCH):
-        batch = files[i : i + PARSE_BATCH]
-        items = [{"filename": f["filename"], "folders": f["folders"]} for f in batch]
+    keys = [(f["filename"], json.dumps(f["folders"])) for f in files]
+    todo: dict[tuple, list[int]] = {}
+    for i, key in enumerate(keys):
+        if key in cached:
+            all_parsed[i] = cached[key]
+        else:
+            todo.setdefault(key, []).append(i)
+    if cached:
+        print(f"  {len(files) - sum(map(len, todo.values())):,} cached, {len(todo):,} to parse")
+
+    todo_keys = list(todo)
+    fresh = {}
+    for i in range(0, len(todo_keys), PARSE_BATCH):
+        batch = todo_keys[i : i + PARSE_BATCH]
+        items = [{"filename": filename, "folders": json.loads(folders)} for filename, folders in batch]
         resp = api_post("/api/documents/ingest-parse", {"items": items})
-        for j, p in enumerate(resp.get("parsed", [])):
-            all_parsed[i + j] = p
+        for key, p in zip(batch, resp.get("parsed", [])):
+            fresh[key] = p
+            for idx in todo[key]:
+                all_parsed[idx] = p
+    if version and fresh:
+        save_parse_cache(conn, version, fresh)
+    conn.close()
     return all_parsed
 
 
@@ -200,52 +422,97 @@ def apply_parsed(files: list[dict], parsed: list[dict]) -> None:
 
 def check_duplicates(files: list[dict], user_id: str, org_id: str | None) -> dict:
     """
-    POST batches to /ingest-dedup. Returns {filename: existingDocId} for dupes.
+    Dedup by content hash: copies within the tree, then POST batches to
+    /ingest-dedup for files already uploaded. The server matches by SHA-256,
+    and by filename + size only against documents registered without a hash.
+
+    Returns {index_in_files: {matchType, existingDocId? | duplicateOf?}} for dupes.
     """
-    dupes = {}
-    for i in range(0, len(files), DEDUP_BATCH):
-        batch = files[i : i + DEDUP_BATCH]
+    dupes = find_local_duplicates(files)
+    remaining = [i for i in range(len(files)) if i not in dupes]
+
+    for start in range(0, len(remaining), DEDUP_BATCH):
+        batch = remaining[start : start + DEDUP_BATCH]
         payload = {
             "userId": user_id,
             "organizationId": org_id,
-            "files": [{"filename": f["filename"], "fileSize": f["file_size"]} for f in batch],
+            "files": [
+                {"filename": files[i]["filename"], "fileSize": files[i]["file_size"], "sha256": files[i].get("sha256")}
+                for i in batch
+            ],
         }
         resp = api_post("/api/documents/ingest-dedup", payload)
         for d in resp.get("duplicates", []):
-            dupes[d["filename"]] = d["existingDocId"]
+            for i in batch:
+                f = files[i]
+                if d.get("sha256"):
+                    hit = f.get("sha256") == d["sha256"]
+                else:
+                    hit = f["filename"] == d["filename"] and f["file_size"] == d["fileSize"]
+                if hit:
+                    dupes[i] = {"matchType": d.get("matchType", "name_size"), "existingDocId": d["existingDocId"]}
     return dupes
 
 
-def match_entities(files: list[dict], user_id: str, org_id: str | None) -> dict:
+def match_item(f: dict) -> dict:
+    """The /ingest-match input for a parsed file (all the matcher looks at)."""
+    item = {}
+    if f.get("section"):
+        item["section"] = f["section"]
+    if f.get("township"):
+        item["township"] = f["township"]
+    if f.get("range"):
+        item["range"] = f["range"]
+    if f.get("county"):
+        item["county"] = f["county"]
+    if f.get("api_number"):
+        item["apiNumber"] = f["api_number"]
+    if f.get("well_name"):
+        item["wellName"] = f["well_name"]
+    return item
+
+
+def match_entities(files: list[dict], user_id: str, org_id: str | None, use_cache: bool = True) -> dict:
     """
     POST batches to /ingest-match. Returns {index_in_files: match_result}.
     match_result = {propertyId?, wellId?, wellApiNumber?, matchType}
+
+    Files with identical parsed fields share one request item. Results are
+    cached in the state DB by (matcher version, owner, item) for
+    MATCH_CACHE_TTL seconds, since the owner's properties and wells change.
     """
+    version = get_server_versions().get("matcher")
+    owner = f"{user_id}:{org_id or ''}"
+    conn = init_state_db()
+    cached = load_match_cache(conn, version, owner, MATCH_CACHE_TTL) if version and use_cache else {}
+
     results = {}
-    for i in range(0, len(files), MATCH_BATCH):
-        batch = files[i : i + MATCH_BATCH]
-        items = []
-        for f in batch:
-            item = {}
-            if f.get("section"):
-                item["section"] = f["section"]
-            if f.get("township"):
-                item["township"] = f["township"]
-            if f.get("range"):
-                item["range"] = f["range"]
-            if f.get("county"):
-                item["county"] = f["county"]
-            if f.get("api_number"):
-                item["apiNumber"] = f["api_number"]
-            if f.get("well_name"):
-                item["wellName"] = f["well_name"]
-            items.append(item)
-
-        payload = {"userId": user_id, "organizationId": org_id, "items": items}
+    keys = [json.dumps(match_item(f), sort_keys=True) for f in files]
+    todo: dict[str, list[int]] = {}
+    for i, key in enumerate(keys):
+        if key == "{}":
+            results[i] = {"index": i, "matchType": "none"}  # nothing parsed, nothing to match on
+        elif key in cached:
+            results[i] = cached[key]
+        else:
+            todo.setdefault(key, []).append(i)
+    if cached:
+        print(f"  {len(results):,} cached, {len(todo):,} distinct items to match")
+
+    todo_keys = list(todo)
+    fresh = {}
+    for i in range(0, len(todo_keys), MATCH_BATCH):
+        batch = todo_keys[i : i + MATCH_BATCH]
+        payload = {"userId": user_id, "organizationId": org_id, "items": [json.loads(k) for k in batch]}
         resp = api_post("/api/documents/ingest-match", payload, timeout=60)
         for m in resp.get("matches", []):
-            global_idx = i + m["index"]
-            results[global_idx] = m
+            key = batch[m["index"]]
+            fresh[key] = m
+            for idx in todo[key]:
+                results[idx] = m
+    if version and fresh:
+        save_match_cache(conn, version, owner, fresh)
+    conn.close()
     return results
 
 
@@ -254,8 +521,8 @@ def match_entities(files: list[dict], user_id: str, org_id: str | None) -> dict:
 # ---------------------------------------------------------------------------
 
 
-def get_r2_client():
-    """Create boto3 S3 client for R2."""
+def get_r2_client(max_connections: int = 10):
+    """Create boto3 S3 client for R2 (thread-safe; share one across upload workers)."""
     if boto3 is None:
         print("Error: boto3 is required for uploads. Run: pip install boto3", file=sys.stderr)
         sys.exit(1)
@@ -270,21 +537,40 @@ def get_r2_client():
         config=BotoConfig(
             signature_version="s3v4",
             retries={"max_attempts": 3, "mode": "adaptive"},
+            max_pool_connections=max_connections,
         ),
         region_name="auto",
     )
 
 
+_key_lock = threading.Lock()
+_last_key_ts = 0
+
+
 def generate_r2_key(user_id: str, filename: str) -> str:
     """Generate R2 object key: uploads/{user_id}/{timestamp}-{sanitized_filename}"""
+    global _last_key_ts
     sanitized = re.sub(r'[^\w.\-]', '_', filename)
-    ts = int(time.time() * 1000)
+    # Strictly increasing across threads, so same-named files in different folders never collide
+    with _key_lock:
+        ts = max(int(time.time() * 1000), _last_key_ts + 1)
+        _last_key_ts = ts
     return f"uploads/{user_id}/{ts}-{sanitized}"
 
 
-def upload_to_r2(client, local_path: str, r2_key: str) -> None:
-    """Upload file to R2 via S3 multipart API."""
-    client.upload_file(local_path, R2_BUCKET, r2_key)
+def get_transfer_config(chunk_mb: int = MULTIPART_CHUNK_MB, concurrency: int = MULTIPART_CONCURRENCY):
+    """Multipart settings for upload_file (boto3's defaults are 8MB parts, 10 threads per file)."""
+    return TransferConfig(
+        multipart_threshold=chunk_mb * 1024 * 1024,
+        multipart_chunksize=chunk_mb * 1024 * 1024,
+        max_concurrency=concurrency,
+        use_threads=concurrency > 1,
+    )
+
+
+def upload_to_r2(client, local_path: str, r2_key: str, transfer_config=None, progress=None) -> None:
+    """Upload file to R2 via S3 multipart API. progress(bytes) is called as chunks are sent."""
+    client.upload_file(local_path, R2_BUCKET, r2_key, Config=transfer_config, Callback=progress)
 
 
 # ---------------------------------------------------------------------------
@@ -292,16 +578,15 @@ def upload_to_r2(client, local_path: str, r2_key: str) -> None:
 # ---------------------------------------------------------------------------
 
 
-def register_document(
+def registration_item(
     r2_key: str,
-    user_id: str,
-    org_id: str | None,
     filename: str,
     file_size: int,
     match: dict | None,
     source_meta: dict | None = None,
+    sha256: str | None = None,
 ) -> dict:
-    """Register document with documents-worker via /register-external."""
+    """Per-document registration fields (everything but the owner)."""
     metadata = {
         "sourceType": "bulk_onboarding",
         "uploadedVia": "ingest-cli",
@@ -314,68 +599,231 @@ def register_document(
             metadata["well_id"] = match["wellId"]
         metadata["matchType"] = match.get("matchType", "none")
 
-    payload = {
+    item = {
         "r2Key": r2_key,
-        "userId": user_id,
-        "organizationId": org_id,
         "filename": filename,
         "fileSize": file_size,
         "contentType": "application/pdf",
         "sourceType": "bulk_onboarding",
         "metadata": metadata,
     }
+    if sha256:
+        item["contentSha256"] = sha256
+    return item
+
+
+def register_document(item: dict, user_id: str, org_id: str | None) -> dict:
+    """Register one registration_item() with documents-worker via /register-external."""
+    payload = {"userId": user_id, "organizationId": org_id, **item}
     return api_post("/api/documents/register-external", payload, timeout=30)
 
 
+def register_documents(items: list[dict], user_id: str, org_id: str | None) -> list[dict]:
+    """
+    Register up to REGISTER_BATCH_MAX registration_item()s in one
+    /register-external-batch call. Returns one result per item, in order:
+    {index, success, document?: {id, ...}, existing?, error?}. An r2Key that
+    is already registered comes back as its existing document, so a batch is
+    safe to retry.
+    """
+    payload = {"userId": user_id, "organizationId": org_id, "items": items}
+    resp = api_post("/api/documents/register-external-batch", payload, timeout=60)
+    results: list[dict | None] = [None] * len(items)
+    for r in resp.get("results", []):
+        if 0 <= r.get("index", -1) < len(items):
+            results[r["index"]] = r
+    return [r or {"success": False, "error": "No result returned"} for r in results]
+
+
 # ---------------------------------------------------------------------------
 # PDF splitting
 # ---------------------------------------------------------------------------
 
 
-def check_and_split_pdf(filepath: str, max_mb: int = 100) -> list[str]:
+def page_object_sizes(reader) -> list[dict[int, int]]:
     """
-    If file > threshold, split into chunks. Returns list of file paths
-    (original if no split, or temp split files).
+    For each page, the indirect objects it needs ({object number: bytes}):
+    content streams, images, fonts, annotations. Objects shared between pages
+    (fonts, repeated logos) appear under every page that uses them and are
+    written once per part, so a part's size is the size of the union.
+
+    Streams are dropped from the reader's object cache once measured, so peak
+    memory stays near the largest single stream rather than the file size.
     """
-    size_mb = os.path.getsize(filepath) / (1024 * 1024)
-    if size_mb <= max_mb:
-        return [filepath]
+    pages = []
+    for page in reader.pages:
+        sizes: dict[int, int] = {}
+        stack = list(page.values())
+        while stack:
+            obj = stack.pop()
+            if isinstance(obj, IndirectObject):
+                if obj.idnum in sizes:
+                    continue
+                resolved = obj.get_object()
+                # Links and annotation back-references point at other pages; they aren't part of this one
+                if isinstance(resolved, DictionaryObject) and resolved.get("/Type") in ("/Page", "/Pages"):
+                    continue
+                data = getattr(resolved, "_data", None)
+                sizes[obj.idnum] = PDF_OBJECT_OVERHEAD + (len(data) if data is not None else 0)
+                if data is not None:
+                    reader.resolved_objects.pop((obj.generation, obj.idnum), None)
+                obj = resolved
+            if isinstance(obj, DictionaryObject):
+                stack.extend(v for k, v in obj.items() if k != "/Parent")
+            elif isinstance(obj, ArrayObject):
+                stack.extend(obj)
+        # The page's own dictionary and content reference
+        sizes[-(len(pages) + 1)] = PDF_OBJECT_OVERHEAD
+        pages.append(sizes)
+    return pages
+
+
+def outline_boundaries(reader) -> set[int]:
+    """First pages of the top-level bookmarks — likely document boundaries in a scanned bundle."""
+    try:
+        return {
+            reader.get_destination_page_number(item)
+            for item in reader.outline
+            if not isinstance(item, list)
+        } - {None, -1, 0}
+    except Exception:
+        return set()
 
-    if PdfReader is None or PdfWriter is None:
-        print(f"  Warning: pypdf not installed, cannot split {filepath} ({size_mb:.0f}MB). Skipping.", file=sys.stderr)
-        return []
 
-    try:
-        reader = PdfReader(filepath)
-        num_pages = len(reader.pages)
-        if num_pages == 0:
-            return [filepath]
+def plan_pdf_split(page_sizes: list[dict[int, int]], max_bytes: int, boundaries: set[int] = frozenset()) -> list[tuple[int, int]]:
+    """
+    Greedily pack pages into parts of at most max_bytes, returning [start, end)
+    page ranges. When a part fills up and a boundary page falls in its second
+    half, the part is cut at that boundary instead and the pages after it
+    start the next part. A single page larger than max_bytes gets its own part.
+    """
+    ranges = []
+    start = 0
+    objects: dict[int, int] = {}
+    size = 0
+    size_at: list[int] = []  # part size after each page of the current part
+    page = 0
+    while page < len(page_sizes):
+        new = {k: v for k, v in page_sizes[page].items() if k not in objects}
+        added = sum(new.values())
+        if size + added > max_bytes and page > start:
+            cut = page
+            for b in range(page, start, -1):
+                if b in boundaries and size_at[b - start - 1] >= max_bytes // 2:
+                    cut = b
+                    break
+            ranges.append((start, cut))
+            start, page = cut, cut
+            objects, size, size_at = {}, 0, []
+            continue
+        objects.update(new)
+        size += added
+        size_at.append(size)
+        page += 1
+    if start < len(page_sizes):
+        ranges.append((start, len(page_sizes)))
+    return ranges
+
+
+def split_workspace() -> Path:
+    """This process's directory for split parts; removes ones left by runs that are no longer alive."""
+    root = Path(SPLIT_DIR)
+    root.mkdir(parents=True, exist_ok=True)
+    for stale in root.iterdir():
+        if not stale.name.isdigit() or int(stale.name) == os.getpid():
+            continue
+        try:
+            os.kill(int(stale.name), 0)
+        except ProcessLookupError:
+            shutil.rmtree(stale, ignore_errors=True)
+        except OSError:
+            pass  # alive under another user
+    workspace = root / str(os.getpid())
+    workspace.mkdir(exist_ok=True)
+    return workspace
 
-        avg_page_mb = size_mb / num_pages
-        pages_per_chunk = max(1, int(max_mb * 0.8 / avg_page_mb))  # 80% of limit for safety
 
-        parts = []
-        stem = Path(filepath).stem
-        parent = Path(filepath).parent
-        suffix = Path(filepath).suffix
+class PdfSplit:
+    """
+    The parts of one PDF, written one at a time as they are iterated.
 
-        for chunk_start in range(0, num_pages, pages_per_chunk):
-            chunk_end = min(chunk_start + pages_per_chunk, num_pages)
-            writer = PdfWriter()
-            for p in range(chunk_start, chunk_end):
-                writer.add_page(reader.pages[p])
+    Iterating yields part paths; each part is written just before it is
+    yielded and deleted when the next one is requested, so at most one part
+    per file is on disk. An unsplit file yields its own path. cleanup() removes
+    the file's part directory (call it in a finally).
+    """
+
+    def __init__(self, filepath: str, reader=None, ranges: list[tuple[int, int]] | None = None, workspace: Path | None = None):
+        self.filepath = filepath
+        self.reader = reader
+        self.ranges = ranges or []
+        self.part_dir = Path(tempfile.mkdtemp(prefix=Path(filepath).stem[:40] + "-", dir=workspace)) if ranges else None
+
+    def __len__(self) -> int:
+        return len(self.ranges) or 1
 
-            part_path = str(parent / f"{stem}_part{chunk_start + 1}-{chunk_end}{suffix}")
+    def __iter__(self):
+        if not self.ranges:
+            yield self.filepath
+            return
+        stem, suffix = Path(self.filepath).stem, Path(self.filepath).suffix
+        for start, end in self.ranges:
+            part_path = self.part_dir / f"{stem}_part{start + 1}-{end}{suffix}"
+            writer = PdfWriter()
+            for p in range(start, end):
+                writer.add_page(self.reader.pages[p])
             with open(part_path, "wb") as f:
                 writer.write(f)
-            parts.append(part_path)
+            del writer
+            yield str(part_path)
+            part_path.unlink(missing_ok=True)
+
+    def cleanup(self) -> None:
+        if self.reader is not None:
+            self.reader.stream.close()
+        if self.part_dir is not None:
+            shutil.rmtree(self.part_dir, ignore_errors=True)
+
 
-        print(f"  Split {Path(filepath).name} ({size_mb:.0f}MB) into {len(parts)} parts")
-        return parts
+def check_and_split_pdf(filepath: str, max_mb: int = 100, workspace: Path | None = None) -> PdfSplit | None:
+    """
+    If file > threshold, plan a split from measured per-page object sizes,
+    cutting at bookmark boundaries where possible. Returns a PdfSplit whose
+    parts are written into workspace as they are iterated (the original file
+    alone if no split is needed or possible), or None if pypdf is missing.
+    """
+    size = os.path.getsize(filepath)
+    max_bytes = max_mb * 1024 * 1024
+    if size <= max_bytes:
+        return PdfSplit(filepath)
+
+    if PdfReader is None or PdfWriter is None:
+        print(f"  Warning: pypdf not installed, cannot split {filepath} ({size / MB:.0f}MB). Skipping.", file=sys.stderr)
+        return None
+
+    reader = None
+    try:
+        # From an open file, not a path: pypdf then reads objects on demand instead of loading the whole file
+        reader = PdfReader(open(filepath, "rb"))
+        if len(reader.pages) == 0:
+            reader.stream.close()
+            return PdfSplit(filepath)
+
+        page_sizes = page_object_sizes(reader)
+        ranges = plan_pdf_split(page_sizes, int(max_bytes * SPLIT_HEADROOM), outline_boundaries(reader))
+        oversized = [r for r in ranges if r[1] - r[0] == 1 and sum(page_sizes[r[0]].values()) > max_bytes]
+        if oversized:
+            print(f"  Warning: {Path(filepath).name} has {len(oversized)} page(s) over {max_mb}MB on their own",
+                  file=sys.stderr)
+
+        print(f"  Split {Path(filepath).name} ({size / MB:.0f}MB, {len(reader.pages)} pages) into {len(ranges)} parts")
+        return PdfSplit(filepath, reader, ranges, workspace)
 
     except Exception as e:
+        if reader is not None:
+            reader.stream.close()
         print(f"  Warning: Failed to split {filepath}: {e}", file=sys.stderr)
-        return [filepath]
+        return PdfSplit(filepath)
 
 
 # ---------------------------------------------------------------------------
@@ -384,23 +832,141 @@ def check_and_split_pdf(filepath: str, max_mb: int = 100) -> list[str]:
 
 
 def check_queue_depth(user_id: str) -> int:
-    """Get count of pending + processing documents for this user."""
-    try:
-        resp = api_get(f"/api/processing/user/{user_id}/queue-status")
-        return (resp.get("queued") or 0) + (resp.get("processing") or 0)
-    except Exception:
-        return 0  # assume ok if endpoint unreachable
+    """Get count of pending + processing documents for this user (raises if the endpoint fails)."""
+    resp = api_get(f"/api/processing/user/{user_id}/queue-status")
+    return (resp.get("queued") or 0) + (resp.get("processing") or 0)
 
 
-def wait_for_queue_space(user_id: str, max_depth: int, verbose: bool = False) -> None:
-    """Block until queue depth drops below max_depth."""
-    while True:
-        depth = check_queue_depth(user_id)
-        if depth < max_depth:
+def _duration(seconds: float | None) -> str:
+    return time.strftime("%H:%M:%S", time.gmtime(seconds)) if seconds is not None and seconds < 86400 * 30 else "?"
+
+
+class QueueController:
+    """
+    Paces file admission so the processing queue stays near a target depth.
+
+    A poller thread reads /queue-status every QUEUE_POLL_INTERVAL seconds and
+    measures the processor's drain rate (documents that left the queue, i.e.
+    previous depth + documents registered since - current depth, smoothed).
+    Files are admitted at that rate plus a correction that closes the gap to
+    the target over QUEUE_HORIZON seconds, and not at all while the projected
+    depth is at max_depth. The projected depth is the polled depth plus
+    documents registered since that poll plus files admitted but not yet
+    finished (still uploading or waiting to register), so the pipeline's
+    in-flight files can't push the queue past max_depth. A failing endpoint halves the admission rate and doubles the
+    poll interval on each consecutive error, and pauses admission after
+    QUEUE_MAX_ERRORS until a poll succeeds again.
+    """
+
+    def __init__(self, user_id: str, target_depth: int, max_depth: int, registered, finished, total_files: int,
+                 verbose: bool = False):
+        self.user_id = user_id
+        self.target_depth = target_depth
+        self.max_depth = max_depth
+        self.registered = registered  # callable: documents registered so far
+        self.finished = finished  # callable: admitted files registered or failed so far
+        self.total_files = total_files
+        self.verbose = verbose
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self.depth: int | None = None
+        self.drain_rate: float | None = None  # documents/s
+        self.rate = QUEUE_INITIAL_RATE  # files/s admitted
+        self.errors = 0
+        self.admitted = 0
+        self._tokens = 1.0
+        self._refilled = time.monotonic()
+        self._last_poll: tuple[float, int, int] | None = None  # (time, depth, registered)
+        self._thread = threading.Thread(target=self._run, name="ingest-queue", daemon=True)
+
+    def start(self) -> None:
+        self._poll()
+        self._thread.start()
+
+    def close(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def projected_depth(self) -> int:
+        """Polled depth + documents registered since the poll + admitted files not yet finished."""
+        registered, finished = self.registered(), self.finished()
+        with self._lock:
+            registered_at_poll = self._last_poll[2] if self._last_poll else registered
+            return (self.depth or 0) + (registered - registered_at_poll) + max(self.admitted - finished, 0)
+
+    def acquire(self) -> None:
+        """Block until the next file may be admitted."""
+        while True:
+            projected = self.projected_depth()
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self._tokens + self.rate * (now - self._refilled),
+                                   max(1.0, self.target_depth - projected) if self.errors == 0 else 1.0)
+                self._refilled = now
+                if projected < self.max_depth and self._tokens >= 1:
+                    self._tokens -= 1
+                    self.admitted += 1
+                    return
+                if projected >= self.max_depth:
+                    wait_s = 1.0  # until uploads register or the processor drains
+                else:
+                    wait_s = (1 - self._tokens) / self.rate if self.rate > 0 else QUEUE_POLL_INTERVAL
+            time.sleep(min(wait_s, 1.0))
+
+    def _run(self) -> None:
+        interval = QUEUE_POLL_INTERVAL
+        while not self._stop.wait(interval):
+            self._poll()
+            interval = min(QUEUE_POLL_INTERVAL * 2 ** self.errors, QUEUE_POLL_MAX_INTERVAL)
+
+    def _poll(self) -> None:
+        try:
+            depth = check_queue_depth(self.user_id)
+        except Exception as e:
+            with self._lock:
+                self.errors += 1
+                self.rate = 0.0 if self.errors >= QUEUE_MAX_ERRORS else self.rate / 2
+                paused = self.rate == 0
+            _emit(f"  Queue status unavailable ({e}); "
+                  f"{'pausing uploads' if paused else f'slowing to {self.rate * 60:.0f} files/min'}")
             return
-        if verbose:
-            print(f"  Queue depth {depth} >= {max_depth}, waiting {QUEUE_POLL_INTERVAL}s...")
-        time.sleep(QUEUE_POLL_INTERVAL)
+
+        now, registered = time.monotonic(), self.registered()
+        with self._lock:
+            recovered = self.errors >= QUEUE_MAX_ERRORS
+            self.errors = 0
+            if self._last_poll is not None:
+                t0, depth0, registered0 = self._last_poll
+                drained = max(depth0 + (registered - registered0) - depth, 0)
+                measured = drained / max(now - t0, 1e-6)
+                self.drain_rate = measured if self.drain_rate is None else 0.7 * self.drain_rate + 0.3 * measured
+            self._last_poll = (now, depth, registered)
+            self.depth = depth
+            if depth >= self.max_depth:
+                self.rate = 0.0
+            elif self.drain_rate is not None:
+                self.rate = max(self.drain_rate + (self.target_depth - depth) / QUEUE_HORIZON, 0.0)
+            elif depth < self.target_depth:
+                self.rate = max(QUEUE_INITIAL_RATE, (self.target_depth - depth) / QUEUE_HORIZON)
+        if recovered:
+            _emit("  Queue status available again — resuming uploads")
+        if self.verbose:
+            _emit(self.line())
+
+    def line(self) -> str:
+        projected = self.projected_depth()
+        with self._lock:
+            if self.errors:
+                return f"  -- queue status unavailable ({self.errors} errors) | admitting {self.rate * 60:.0f} files/min"
+            drain = self.drain_rate
+            remaining = self.total_files - self.admitted + (self.depth or 0)
+            eta = remaining / drain if drain else None
+            return (
+                f"  -- queue {self.depth}, {projected} with uploads in flight "
+                f"(target {self.target_depth}, max {self.max_depth}) | "
+                f"processing {drain * 60 if drain is not None else 0:.1f} docs/min | "
+                f"admitting {self.rate * 60:.1f} files/min | processing ETA {_duration(eta)}"
+            )
 
 
 # ---------------------------------------------------------------------------
@@ -410,8 +976,10 @@ def wait_for_queue_space(user_id: str, max_depth: int, verbose: bool = False) ->
 
 def init_state_db() -> sqlite3.Connection:
     """Initialize or open the local state database."""
-    conn = sqlite3.connect(str(STATE_DB_PATH))
+    conn = sqlite3.connect(str(STATE_DB_PATH), timeout=30)
     conn.row_factory = sqlite3.Row
+    # WAL: the upload engine's writer thread commits while the main thread reads
+    conn.execute("PRAGMA journal_mode=WAL")
     conn.execute("""
         CREATE TABLE IF NOT EXISTS sessions (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -445,17 +1013,188 @@ def init_state_db() -> sqlite3.Connection:
             status TEXT DEFAULT 'pending',
             error TEXT,
             updated_at TEXT DEFAULT (datetime('now')),
+            sha256 TEXT,
+            duplicate_of TEXT,
             FOREIGN KEY (session_id) REFERENCES sessions(id)
         )
     """)
+    # State DBs from before content hashing / incremental scans
+    for column, column_type in (("sha256", "TEXT"), ("duplicate_of", "TEXT"), ("mtime_ns", "INTEGER")):
+        try:
+            conn.execute(f"ALTER TABLE files ADD COLUMN {column} {column_type}")
+        except sqlite3.OperationalError:
+            pass  # already there
     conn.execute("""
         CREATE INDEX IF NOT EXISTS idx_files_session_status
         ON files (session_id, status)
     """)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_files_path ON files (path)")
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS file_hashes (
+            path TEXT PRIMARY KEY,
+            mtime_ns INTEGER NOT NULL,
+            file_size INTEGER NOT NULL,
+            sha256 TEXT NOT NULL
+        )
+    """)
+    # Listing of the last scan of each root, for incremental rescans
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS scan_dirs (
+            root TEXT NOT NULL,
+            rel_path TEXT NOT NULL,
+            mtime_ns INTEGER NOT NULL,
+            subdirs TEXT NOT NULL,
+            PRIMARY KEY (root, rel_path)
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS scan_files (
+            root TEXT NOT NULL,
+            rel_dir TEXT NOT NULL,
+            name TEXT NOT NULL,
+            file_size INTEGER NOT NULL,
+            mtime_ns INTEGER NOT NULL,
+            PRIMARY KEY (root, rel_dir, name)
+        )
+    """)
+    # Server parse/match results, keyed by the server's parser/matcher version
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS parse_cache (
+            version TEXT NOT NULL,
+            filename TEXT NOT NULL,
+            folders TEXT NOT NULL,
+            parsed TEXT NOT NULL,
+            PRIMARY KEY (version, filename, folders)
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS match_cache (
+            version TEXT NOT NULL,
+            owner TEXT NOT NULL,
+            item TEXT NOT NULL,
+            result TEXT NOT NULL,
+            cached_at REAL NOT NULL,
+            PRIMARY KEY (version, owner, item)
+        )
+    """)
     conn.commit()
     return conn
 
 
+def load_scan_index(conn: sqlite3.Connection, root: str) -> tuple[dict, dict]:
+    """The last scan of root as ({rel_dir: (mtime_ns, subdirs)}, {rel_dir: [(name, size, mtime_ns)]})."""
+    dirs = {
+        r["rel_path"]: (r["mtime_ns"], json.loads(r["subdirs"]))
+        for r in conn.execute("SELECT rel_path, mtime_ns, subdirs FROM scan_dirs WHERE root = ?", (root,))
+    }
+    files: dict[str, list] = {}
+    for r in conn.execute("SELECT rel_dir, name, file_size, mtime_ns FROM scan_files WHERE root = ?", (root,)):
+        files.setdefault(r["rel_dir"], []).append((r["name"], r["file_size"], r["mtime_ns"]))
+    return dirs, files
+
+
+def load_parse_cache(conn: sqlite3.Connection, version: str) -> dict:
+    """{(filename, folders_json): parsed} cached for this parser version."""
+    return {
+        (r["filename"], r["folders"]): json.loads(r["parsed"])
+        for r in conn.execute("SELECT filename, folders, parsed FROM parse_cache WHERE version = ?", (version,))
+    }
+
+
+def save_parse_cache(conn: sqlite3.Connection, version: str, parsed: dict) -> None:
+    conn.execute("DELETE FROM parse_cache WHERE version != ?", (version,))
+    conn.executemany(
+        "INSERT OR REPLACE INTO parse_cache (version, filename, folders, parsed) VALUES (?, ?, ?, ?)",
+        [(version, filename, folders, json.dumps(p)) for (filename, folders), p in parsed.items()],
+    )
+    conn.commit()
+
+
+def load_match_cache(conn: sqlite3.Connection, version: str, owner: str, ttl: float) -> dict:
+    """{item_json: match} cached for this matcher version and owner within ttl seconds."""
+    return {
+        r["item"]: json.loads(r["result"])
+        for r in conn.execute(
+            "SELECT item, result FROM match_cache WHERE version = ? AND owner = ? AND cached_at >= ?",
+            (version, owner, time.time() - ttl),
+        )
+    }
+
+
+def save_match_cache(conn: sqlite3.Connection, version: str, owner: str, matches: dict) -> None:
+    conn.execute("DELETE FROM match_cache WHERE version != ?", (version,))
+    now = time.time()
+    conn.executemany(
+        "INSERT OR REPLACE INTO match_cache (version, owner, item, result, cached_at) VALUES (?, ?, ?, ?, ?)",
+        [(version, owner, item, json.dumps(m), now) for item, m in matches.items()],
+    )
+    conn.commit()
+
+
+def save_scan_index(conn: sqlite3.Connection, root: str, dirs: dict, pdfs_by_dir: dict) -> None:
+    """Replace root's stored listing with this scan's."""
+    conn.execute("DELETE FROM scan_dirs WHERE root = ?", (root,))
+    conn.execute("DELETE FROM scan_files WHERE root = ?", (root,))
+    conn.executemany(
+        "INSERT INTO scan_dirs (root, rel_path, mtime_ns, subdirs) VALUES (?, ?, ?, ?)",
+        [(root, rel, mtime_ns, json.dumps(subdirs)) for rel, (mtime_ns, subdirs) in dirs.items()],
+    )
+    conn.executemany(
+        "INSERT INTO scan_files (root, rel_dir, name, file_size, mtime_ns) VALUES (?, ?, ?, ?, ?)",
+        [(root, rel, *pdf) for rel, pdfs in pdfs_by_dir.items() for pdf in pdfs],
+    )
+    conn.commit()
+
+
+def previously_ingested(conn: sqlite3.Connection, files: list[dict], user_id: str, org_id: str | None) -> set[int]:
+    """
+    Indexes of files a session for the same user and org already recorded with
+    the same path, size and mtime and did not fail (uploaded, pending or
+    skipped as duplicates). Rows from before mtimes were recorded match on
+    size alone.
+    """
+    recorded: dict[str, list] = {}
+    paths = [f["path"] for f in files]
+    for i in range(0, len(paths), 500):  # SQLite bind-parameter limit
+        chunk = paths[i : i + 500]
+        rows = conn.execute(
+            f"SELECT f.path, f.file_size, f.mtime_ns FROM files f JOIN sessions s ON s.id = f.session_id "
+            f"WHERE f.status != 'failed' AND s.user_id = ? AND s.org_id IS ? "
+            f"AND f.path IN ({', '.join('?' * len(chunk))})",
+            [user_id, org_id, *chunk],
+        ).fetchall()
+        for r in rows:
+            recorded.setdefault(r["path"], []).append((r["file_size"], r["mtime_ns"]))
+    return {
+        i for i, f in enumerate(files)
+        if any(size == f["file_size"] and mtime in (None, f["mtime_ns"]) for size, mtime in recorded.get(f["path"], ()))
+    }
+
+
+def load_cached_hashes(conn: sqlite3.Connection, files: list[dict]) -> dict:
+    """{(path, mtime_ns, file_size): sha256} for the given files' paths."""
+    cached = {}
+    paths = [f["path"] for f in files]
+    for i in range(0, len(paths), 500):  # SQLite bind-parameter limit
+        chunk = paths[i : i + 500]
+        rows = conn.execute(
+            f"SELECT path, mtime_ns, file_size, sha256 FROM file_hashes WHERE path IN ({', '.join('?' * len(chunk))})",
+            chunk,
+        ).fetchall()
+        for r in rows:
+            cached[(r["path"], r["mtime_ns"], r["file_size"])] = r["sha256"]
+    return cached
+
+
+def save_cached_hashes(conn: sqlite3.Connection, files: list[dict]) -> None:
+    """Remember hashes keyed by path; a changed mtime or size invalidates the entry."""
+    conn.executemany(
+        "INSERT OR REPLACE INTO file_hashes (path, mtime_ns, file_size, sha256) VALUES (?, ?, ?, ?)",
+        [(f["path"], f["mtime_ns"], f["file_size"], f["sha256"]) for f in files],
+    )
+    conn.commit()
+
+
 def create_session(conn: sqlite3.Connection, root_path: str, user_id: str, org_id: str | None) -> int:
     """Create a new ingestion session."""
     cur = conn.execute(
@@ -473,28 +1212,33 @@ def save_scan_results(
     """Save scan + dedup + match results into state DB."""
     for i, f in enumerate(files):
         m = matches.get(i, {})
+        dupe = dupes.get(i)
         conn.execute(
             """INSERT INTO files (
                 session_id, path, filename, file_size, county, section, township,
                 range_val, api_number, well_name, is_duplicate, match_type,
-                match_property_id, match_well_id, match_well_api, status
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                match_property_id, match_well_id, match_well_api, status,
+                sha256, duplicate_of, mtime_ns
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
             (
                 session_id, f["path"], f["filename"], f["file_size"],
                 f.get("county"), f.get("section"), f.get("township"),
                 f.get("range"), f.get("api_number"), f.get("well_name"),
-                1 if f["filename"] in dupes else 0,
+                1 if dupe else 0,
                 m.get("matchType", "none"),
                 m.get("propertyId"),
                 m.get("wellId"),
                 m.get("wellApiNumber"),
-                "skipped" if f["filename"] in dupes else "pending",
+                "skipped" if dupe else "pending",
+                f.get("sha256"),
+                (dupe.get("existingDocId") or dupe.get("duplicateOf")) if dupe else None,
+                f.get("mtime_ns"),
             ),
         )
     conn.commit()
 
 
-def update_file_status(conn: sqlite3.Connection, file_id: int, status: str, **kwargs) -> None:
+def update_file_status(conn: sqlite3.Connection, file_id: int, status: str, commit: bool = True, **kwargs) -> None:
     """Update a file's status in the state DB."""
     sets = ["status = ?", "updated_at = datetime('now')"]
     params: list = [status]
@@ -503,7 +1247,8 @@ def update_file_status(conn: sqlite3.Connection, file_id: int, status: str, **kw
         params.append(v)
     params.append(file_id)
     conn.execute(f"UPDATE files SET {', '.join(sets)} WHERE id = ?", params)
-    conn.commit()
+    if commit:
+        conn.commit()
 
 
 def get_latest_session(conn: sqlite3.Connection) -> dict | None:
@@ -514,11 +1259,16 @@ def get_latest_session(conn: sqlite3.Connection) -> dict | None:
     return dict(row) if row else None
 
 
+# Statuses a resumed session picks up again: never started, interrupted mid-upload,
+# or uploaded but not yet registered (registration is retried without re-uploading)
+RESUMABLE_STATUSES = ("pending", "uploading", "uploaded")
+
+
 def get_pending_files(conn: sqlite3.Connection, session_id: int) -> list[dict]:
-    """Get files that still need uploading."""
+    """Get files that still need uploading or registering."""
     rows = conn.execute(
-        "SELECT * FROM files WHERE session_id = ? AND status = 'pending' ORDER BY id",
-        (session_id,),
+        f"SELECT * FROM files WHERE session_id = ? AND status IN ({', '.join('?' * len(RESUMABLE_STATUSES))}) ORDER BY id",
+        (session_id, *RESUMABLE_STATUSES),
     ).fetchall()
     return [dict(r) for r in rows]
 
@@ -555,7 +1305,7 @@ def print_dry_run(
     match_counts = {"api_exact": 0, "name_trs": 0, "name_only": 0, "trs": 0, "none": 0}
     name_only_files = []
     for i, f in enumerate(files):
-        if f["filename"] in dupes:
+        if i in dupes:
             continue
         m = matches.get(i, {})
         mt = m.get("matchType", "none")
@@ -590,8 +1340,10 @@ def print_dry_run(
     print(f"    No TRS info:       {no_trs:>6,}")
     print()
 
-    print("  DEDUPLICATION")
-    print(f"    Already uploaded:  {len(dupes):>6,}     (skipping)")
+    local_dupes = sum(1 for d in dupes.values() if d["matchType"] == "local")
+    print("  DEDUPLICATION (SHA-256)")
+    print(f"    Already uploaded:  {len(dupes) - local_dupes:>6,}     (skipping)")
+    print(f"    Copies in tree:    {local_dupes:>6,}     (skipping, first copy uploaded)")
     print()
 
     print("  MATCHING")
@@ -662,7 +1414,7 @@ def print_status() -> None:
             print(f"  {status}: {cnt}")
     print(f"  Total: {stats['total']}")
 
-    pending = stats.get("pending", 0)
+    pending = sum(stats.get(s, 0) for s in RESUMABLE_STATUSES)
     registered = stats.get("registered", 0)
     total = stats["total"]
     if total > 0:
@@ -671,6 +1423,422 @@ def print_status() -> None:
     conn.close()
 
 
+# ---------------------------------------------------------------------------
+# Upload engine (worker pools, single state writer, throughput dashboard)
+# ---------------------------------------------------------------------------
+
+_print_lock = threading.Lock()
+
+
+def _emit(line: str) -> None:
+    """Print from any worker thread without interleaving lines."""
+    with _print_lock:
+        print(line, flush=True)
+
+
+class StateWriter:
+    """
+    Owns every write to the state DB from one thread.
+
+    Upload and registration workers enqueue status changes; the writer applies
+    everything queued so far in a single transaction, so thousands of files
+    cost a few commits per second instead of one commit per status change.
+    """
+
+    def __init__(self, db_path: Path | None = None):
+        self._db_path = db_path or STATE_DB_PATH
+        self._queue: queue.Queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="ingest-state-writer", daemon=True)
+        self._thread.start()
+
+    def update(self, file_id: int, status: str, **kwargs) -> None:
+        self._queue.put((file_id, status, kwargs))
+
+    def close(self) -> None:
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self) -> None:
+        conn = sqlite3.connect(str(self._db_path), timeout=30)
+        try:
+            while True:
+                items = [self._queue.get()]
+                while True:
+                    try:
+                        items.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+
+                stop = False
+                waiters = []
+                for item in items:
+                    if item is None:
+                        stop = True
+                    elif isinstance(item, threading.Event):
+                        waiters.append(item)
+                    else:
+                        file_id, status, kwargs = item
+                        try:
+                            update_file_status(conn, file_id, status, commit=False, **kwargs)
+                        except sqlite3.Error as e:
+                            _emit(f"  Warning: state DB update failed for file {file_id}: {e}")
+                conn.commit()
+                for waiter in waiters:
+                    waiter.set()
+                if stop:
+                    return
+        finally:
+            conn.close()
+
+
+class UploadStats:
+    """Counters shared by the workers; line() renders the throughput dashboard."""
+
+    def __init__(self, total_files: int, total_bytes: int):
+        self._lock = threading.Lock()
+        self.total_files = total_files
+        self.total_bytes = total_bytes
+        self.started = time.monotonic()
+        self.bytes_sent = 0
+        self.done = 0
+        self.failed = 0
+        self.uploading = 0
+        self.registering = 0
+        self.documents = 0  # registered documents (a split file registers one per part)
+        self._samples: collections.deque = collections.deque()  # (time, bytes_sent) for the recent rate
+
+    def add_bytes(self, n: int) -> None:
+        """boto3 progress callback (called from transfer threads)."""
+        with self._lock:
+            self.bytes_sent += n
+
+    def change(self, **deltas) -> int:
+        """Adjust counters; returns files finished so far (done + failed)."""
+        with self._lock:
+            for name, delta in deltas.items():
+                setattr(self, name, getattr(self, name) + delta)
+            return self.done + self.failed
+
+    def line(self) -> str:
+        with self._lock:
+            elapsed = max(time.monotonic() - self.started, 1e-6)
+            finished = self.done + self.failed
+            mb_per_s = self.bytes_sent / MB / elapsed
+            files_per_min = finished / elapsed * 60
+            # ETA from the last ETA_WINDOW seconds: pacing and pauses make the all-time average stale
+            now = time.monotonic()
+            self._samples.append((now, self.bytes_sent))
+            while len(self._samples) > 2 and now - self._samples[1][0] >= ETA_WINDOW:
+                self._samples.popleft()
+            t0, sent0 = self._samples[0] if len(self._samples) > 1 else (self.started, 0)
+            recent_rate = (self.bytes_sent - sent0) / max(now - t0, 1e-6)
+            remaining = max(self.total_bytes - self.bytes_sent, 0)
+            eta = remaining / recent_rate if recent_rate > 0 else None
+            pct = finished / self.total_files * 100 if self.total_files else 100.0
+            eta_label = _duration(eta)
+            return (
+                f"  == {finished:,}/{self.total_files:,} files ({pct:.1f}%) | "
+                f"{self.bytes_sent / MB:,.0f}/{self.total_bytes / MB:,.0f} MB | "
+                f"{mb_per_s:.1f} MB/s | {files_per_min:.1f} files/min | "
+                f"uploading {self.uploading}, registering {self.registering} | "
+                f"failed {self.failed} | ETA {eta_label}"
+            )
+
+
+def build_match(f: dict) -> dict | None:
+    """Match dict for register_document from stored match data."""
+    if not f.get("match_type") or f["match_type"] == "none":
+        return None
+    return {
+        "matchType": f["match_type"],
+        "propertyId": f.get("match_property_id"),
+        "wellId": f.get("match_well_id"),
+        "wellApiNumber": f.get("match_well_api"),
+    }
+
+
+def build_source_meta(f: dict, part_idx: int, total_parts: int) -> dict:
+    """Source metadata for register_document from stored parse data."""
+    source_meta = {}
+    if f.get("county"):
+        source_meta["county"] = f["county"]
+    if f.get("section"):
+        source_meta["section"] = f["section"]
+    if f.get("township"):
+        source_meta["township"] = f["township"]
+    if f.get("range_val"):
+        source_meta["range"] = f["range_val"]
+    if f.get("api_number"):
+        source_meta["apiNumber"] = f["api_number"]
+    if f.get("well_name"):
+        source_meta["wellName"] = f["well_name"]
+    if total_parts > 1:
+        source_meta["partIndex"] = part_idx + 1
+        source_meta["totalParts"] = total_parts
+        source_meta["parentFilename"] = f["filename"]
+    return source_meta
+
+
+def describe_file(f: dict) -> str:
+    """'<county TRS> <match>' label for the per-file progress line."""
+    mt = f.get("match_type", "none")
+    mt_label = {
+        "api_exact": f"well {f.get('match_well_api', '?')} (api_exact)",
+        "name_trs": "well (name_trs)",
+        "name_only": "well (name_only)",
+        "trs": "property (trs)",
+        "none": "no pre-link",
+    }.get(mt, mt)
+
+    county_trs = ""
+    if f.get("county") and f.get("section"):
+        county_trs = f"{f['county']} {f['section']}-{f.get('township', '?')}-{f.get('range_val', '?')}"
+    elif f.get("county"):
+        county_trs = f["county"]
+    return f"{county_trs} {mt_label}"
+
+
+class UploadEngine:
+    """
+    Uploads and registers a session's pending files concurrently.
+
+    Stage 1 (upload pool): split if needed (parts are written one at a time
+    into a per-process temp workspace and deleted once uploaded), upload each
+    part to R2 with tuned multipart settings. Stage 2 (registration pool): each worker drains the
+    uploaded files into /register-external-batch calls of up to register_batch
+    parts, overlapping with later uploads, and reconciles the per-item results
+    file by file. Every state change goes through one StateWriter, so the
+    files table stays the resume point: files left 'uploading' are redone and
+    files left 'uploaded' are only registered.
+
+    register_batch=1, or a documents-worker without the batch route (404),
+    registers each part with its own /register-external call.
+    """
+
+    def __init__(
+        self,
+        r2,
+        writer: StateWriter,
+        stats: UploadStats,
+        user_id: str,
+        org_id: str | None,
+        split_threshold: int,
+        upload_workers: int,
+        register_workers: int,
+        transfer_config,
+        register_batch: int = REGISTER_BATCH,
+    ):
+        self.r2 = r2
+        self.writer = writer
+        self.stats = stats
+        self.user_id = user_id
+        self.org_id = org_id
+        self.split_threshold = split_threshold
+        self.split_workspace = split_workspace()
+        self.transfer_config = transfer_config
+        self.upload_pool = ThreadPoolExecutor(upload_workers, thread_name_prefix="ingest-upload")
+        self.register_pool = ThreadPoolExecutor(register_workers, thread_name_prefix="ingest-register")
+        self.register_batch = min(register_batch, REGISTER_BATCH_MAX)
+        self.batch_registration = self.register_batch > 1
+        # Set once; batch_registration can drop to False later (404 fallback)
+        # while the loops keep draining register_queue
+        self.register_loops = self.batch_registration
+        self.register_queue: queue.Queue = queue.Queue()
+        self.register_workers = register_workers
+        # Files admitted but not finished: bounds queued registrations
+        self.slots = threading.BoundedSemaphore(upload_workers * 2 + register_workers * self.register_batch)
+        self.success = 0
+        self.failed = 0
+        if self.register_loops:
+            for _ in range(register_workers):
+                self.register_pool.submit(self._register_loop)
+
+    def submit(self, f: dict) -> None:
+        """Queue one file; blocks while the pipeline is full."""
+        self.slots.acquire()
+        self.upload_pool.submit(self._upload, f)
+
+    def shutdown(self, cancel_pending: bool = False) -> None:
+        """Wait for in-flight files (dropping not-yet-started ones if cancel_pending)."""
+        self.upload_pool.shutdown(wait=True, cancel_futures=cancel_pending)
+        if self.register_loops:
+            for _ in range(self.register_workers):
+                self.register_queue.put(None)
+        self.register_pool.shutdown(wait=True)
+        shutil.rmtree(self.split_workspace, ignore_errors=True)
+
+    def _fail(self, f: dict, message: str) -> None:
+        self.writer.update(f["id"], "failed", error=message[:500])
+        n = self.stats.change(failed=1)
+        self.failed += 1
+        _emit(f"  [{n}/{self.stats.total_files}] {f['filename']} — FAILED: {message}")
+        self.slots.release()
+
+    def _upload(self, f: dict) -> None:
+        filepath = f["path"]
+
+        # Uploaded by an interrupted run, registration still outstanding
+        if f.get("status") == "uploaded" and f.get("r2_key"):
+            self.stats.change(registering=1)
+            self._queue_registration(f, [(f["r2_key"], f["filename"], f["file_size"])])
+            return
+
+        if not os.path.exists(filepath):
+            self._fail(f, "File not found")
+            return
+
+        split = check_and_split_pdf(filepath, self.split_threshold, self.split_workspace)
+        if split is None:
+            self._fail(f, "Split failed")
+            return
+
+        self.stats.change(uploading=1)
+        uploaded = []
+        try:
+            # Each split part is written just before its upload and deleted after it
+            for part_path in split:
+                r2_key = generate_r2_key(self.user_id, Path(part_path).name)
+                if len(split) == 1:
+                    self.writer.update(f["id"], "uploading", r2_key=r2_key)
+                upload_to_r2(self.r2, part_path, r2_key, self.transfer_config, self.stats.add_bytes)
+                uploaded.append((r2_key, Path(part_path).name, os.path.getsize(part_path)))
+        except Exception as e:
+            self.stats.change(uploading=-1)
+            self._fail(f, str(e))
+            return
+        finally:
+            split.cleanup()
+
+        # Only a single-part upload can be resumed from its r2_key alone
+        if len(split) == 1:
+            self.writer.update(f["id"], "uploaded")
+        self.stats.change(uploading=-1, registering=1)
+        self._queue_registration(f, uploaded)
+
+    def _queue_registration(self, f: dict, uploaded: list[tuple[str, str, int]]) -> None:
+        if self.register_loops:
+            self.register_queue.put((f, uploaded))
+        else:
+            self.register_pool.submit(self._register, f, uploaded)
+
+    def _registration_items(self, f: dict, uploaded: list[tuple[str, str, int]]) -> list[dict]:
+        return [
+            registration_item(
+                r2_key, part_filename, part_size,
+                build_match(f), build_source_meta(f, part_idx, len(uploaded)),
+                # The hash is of the whole file, so split parts don't carry it
+                sha256=f.get("sha256") if len(uploaded) == 1 else None,
+            )
+            for part_idx, (r2_key, part_filename, part_size) in enumerate(uploaded)
+        ]
+
+    def _register(self, f: dict, uploaded: list[tuple[str, str, int]]) -> None:
+        """Register each uploaded (r2_key, part_filename, part_size)."""
+        try:
+            doc_id = "?"
+            for item in self._registration_items(f, uploaded):
+                resp = register_document(item, self.user_id, self.org_id)
+                doc_id = resp.get("document", {}).get("id", "?")
+        except Exception as e:
+            self.stats.change(registering=-1)
+            self._fail(f, str(e))
+            return
+        self._registered(f, uploaded, doc_id)
+
+    def _register_loop(self) -> None:
+        """Registration worker: gather queued files into batches until a None sentinel."""
+        while True:
+            job = self.register_queue.get()
+            if job is None:
+                return
+            if not self.batch_registration:
+                # Batch route missing (404 fallback): one document per call
+                self._register(*job)
+                continue
+            jobs = [job]
+            n_parts = len(job[1])
+            stop = False
+            deadline = time.monotonic() + REGISTER_LINGER
+            while n_parts < self.register_batch:
+                try:
+                    job = self.register_queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if job is None:
+                    stop = True
+                    break
+                jobs.append(job)
+                n_parts += len(job[1])
+            try:
+                self._register_batch(jobs)
+            except Exception as e:
+                for f, _ in jobs:
+                    self.stats.change(registering=-1)
+                    self._fail(f, f"Registration error: {e}")
+            if stop:
+                return
+
+    def _register_batch(self, jobs: list[tuple[dict, list[tuple[str, str, int]]]]) -> None:
+        """Register several files' parts in batch calls and reconcile the results per file."""
+        if not self.batch_registration:
+            for job in jobs:
+                self._register(*job)
+            return
+
+        items, owners = [], []
+        for job_idx, (f, uploaded) in enumerate(jobs):
+            file_items = self._registration_items(f, uploaded)
+            items.extend(file_items)
+            owners.extend([job_idx] * len(file_items))
+
+        results = []
+        try:
+            for start in range(0, len(items), self.register_batch):
+                results.extend(self._post_batch(items[start : start + self.register_batch]))
+        except urllib.error.HTTPError as e:
+            # Older documents-worker without the batch route (nothing was registered)
+            if e.code != 404:
+                raise
+            if self.batch_registration:
+                self.batch_registration = False
+                _emit("  documents-worker has no /register-external-batch — registering one document per call")
+            for job in jobs:
+                self._register(*job)
+            return
+
+        per_file: list[list[dict]] = [[] for _ in jobs]
+        for owner, result in zip(owners, results):
+            per_file[owner].append(result)
+        for (f, uploaded), file_results in zip(jobs, per_file):
+            errors = [r.get("error") or "Registration failed" for r in file_results if not r.get("success")]
+            if errors:
+                self.stats.change(registering=-1)
+                self._fail(f, errors[0])
+                continue
+            self._registered(f, uploaded, file_results[-1].get("document", {}).get("id", "?"))
+
+    def _post_batch(self, items: list[dict]) -> list[dict]:
+        """register_documents() with one retry on connection errors and 5xx."""
+        try:
+            return register_documents(items, self.user_id, self.org_id)
+        except urllib.error.HTTPError as e:
+            if e.code < 500:
+                raise
+        except urllib.error.URLError:
+            pass
+        # Safe to retry: r2 keys registered by the failed attempt come back as existing documents
+        time.sleep(1)
+        return register_documents(items, self.user_id, self.org_id)
+
+    def _registered(self, f: dict, uploaded: list[tuple[str, str, int]], doc_id: str) -> None:
+        self.writer.update(f["id"], "registered", doc_id=doc_id)
+        n = self.stats.change(registering=-1, done=1, documents=len(uploaded))
+        self.success += 1
+        parts_label = f" ({len(uploaded)} parts)" if len(uploaded) > 1 else ""
+        _emit(f"  [{n}/{self.stats.total_files}] {f['filename']}{parts_label} -> {describe_file(f)}")
+        self.slots.release()
+
+
 # ---------------------------------------------------------------------------
 # Execute upload
 # ---------------------------------------------------------------------------
@@ -684,132 +1852,81 @@ def execute_upload(
     max_queue: int,
     split_threshold: int,
     verbose: bool,
+    upload_workers: int = UPLOAD_WORKERS,
+    register_workers: int = REGISTER_WORKERS,
+    register_batch: int = REGISTER_BATCH,
+    multipart_chunk_mb: int = MULTIPART_CHUNK_MB,
+    multipart_concurrency: int = MULTIPART_CONCURRENCY,
+    dashboard_interval: int = DASHBOARD_INTERVAL,
+    target_queue: int | None = None,
 ) -> None:
-    """Upload all pending files, register with documents-worker."""
-    r2 = get_r2_client()
+    """
+    Upload all pending files concurrently, register with documents-worker.
+    With max_queue > 0, a QueueController paces admission to keep the
+    processing queue near target_queue (default 75% of max_queue).
+    """
     pending = get_pending_files(conn, session_id)
 
     if not pending:
         print("No pending files to upload.")
         return
 
+    r2 = get_r2_client(max_connections=upload_workers * multipart_concurrency + register_workers)
     total = len(pending)
-    print(f"\nUploading {total} files...\n")
-
-    success = 0
-    failed = 0
-
-    for i, f in enumerate(pending, 1):
-        filepath = f["path"]
-        filename = f["filename"]
-
-        # Check file still exists
-        if not os.path.exists(filepath):
-            update_file_status(conn, f["id"], "failed", error="File not found")
-            print(f"  [{i}/{total}] {filename} — FILE NOT FOUND, skipping")
-            failed += 1
-            continue
+    total_bytes = sum(f["file_size"] for f in pending)
+    print(f"\nUploading {total} files ({total_bytes / MB:,.0f} MB) with {upload_workers} upload workers, "
+          f"{register_workers} registration workers (batches of {register_batch}), {multipart_chunk_mb}MB x {multipart_concurrency} multipart...\n")
+
+    writer = StateWriter()
+    stats = UploadStats(total, total_bytes)
+    engine = UploadEngine(
+        r2, writer, stats, user_id, org_id, split_threshold,
+        upload_workers, register_workers,
+        get_transfer_config(multipart_chunk_mb, multipart_concurrency),
+        register_batch,
+    )
 
-        # Queue monitoring
-        if max_queue > 0:
-            wait_for_queue_space(user_id, max_queue, verbose)
+    controller = None
+    if max_queue > 0:
+        target = min(target_queue or int(max_queue * 0.75), max_queue)
+        controller = QueueController(user_id, max(target, 1), max_queue, lambda: stats.documents,
+                                     lambda: stats.done + stats.failed, total, verbose)
+        controller.start()
 
-        # Split if needed
-        parts = check_and_split_pdf(filepath, split_threshold)
-        if not parts:
-            update_file_status(conn, f["id"], "failed", error="Split failed")
-            failed += 1
-            continue
+    stop_dashboard = threading.Event()
 
-        try:
-            for part_idx, part_path in enumerate(parts):
-                part_filename = Path(part_path).name
-                part_size = os.path.getsize(part_path)
-
-                # Upload to R2
-                r2_key = generate_r2_key(user_id, part_filename)
-                update_file_status(conn, f["id"], "uploading", r2_key=r2_key)
-                upload_to_r2(r2, part_path, r2_key)
-
-                # Build match dict from stored match data
-                match = None
-                if f.get("match_type") and f["match_type"] != "none":
-                    match = {
-                        "matchType": f["match_type"],
-                        "propertyId": f.get("match_property_id"),
-                        "wellId": f.get("match_well_id"),
-                        "wellApiNumber": f.get("match_well_api"),
-                    }
-
-                # Source metadata
-                source_meta = {}
-                if f.get("county"):
-                    source_meta["county"] = f["county"]
-                if f.get("section"):
-                    source_meta["section"] = f["section"]
-                if f.get("township"):
-                    source_meta["township"] = f["township"]
-                if f.get("range_val"):
-                    source_meta["range"] = f["range_val"]
-                if f.get("api_number"):
-                    source_meta["apiNumber"] = f["api_number"]
-                if f.get("well_name"):
-                    source_meta["wellName"] = f["well_name"]
-                if len(parts) > 1:
-                    source_meta["partIndex"] = part_idx + 1
-                    source_meta["totalParts"] = len(parts)
-                    source_meta["parentFilename"] = filename
-
-                # Register
-                resp = register_document(
-                    r2_key, user_id, org_id, part_filename, part_size,
-                    match, source_meta,
-                )
-                doc_id = resp.get("document", {}).get("id", "?")
-                update_file_status(conn, f["id"], "registered", doc_id=doc_id)
-
-            # Describe match type for output
-            mt = f.get("match_type", "none")
-            mt_label = {
-                "api_exact": f"well {f.get('match_well_api', '?')} (api_exact)",
-                "name_trs": "well (name_trs)",
-                "name_only": "well (name_only)",
-                "trs": "property (trs)",
-                "none": "no pre-link",
-            }.get(mt, mt)
-
-            county_trs = ""
-            if f.get("county") and f.get("section"):
-                county_trs = f"{f['county']} {f['section']}-{f.get('township', '?')}-{f.get('range_val', '?')}"
-            elif f.get("county"):
-                county_trs = f["county"]
-
-            parts_label = f" ({len(parts)} parts)" if len(parts) > 1 else ""
-            print(f"  [{i}/{total}] {filename}{parts_label} -> {county_trs} {mt_label}")
-
-            success += 1
-
-            # Clean up temp split files
-            if len(parts) > 1:
-                for p in parts:
-                    if p != filepath and os.path.exists(p):
-                        os.remove(p)
+    def dashboard():
+        while not stop_dashboard.wait(dashboard_interval):
+            _emit(stats.line())
+            if controller:
+                _emit(controller.line())
 
-        except Exception as e:
-            update_file_status(conn, f["id"], "failed", error=str(e)[:500])
-            print(f"  [{i}/{total}] {filename} — FAILED: {e}")
-            failed += 1
-
-            # Clean up temp split files on error too
-            if len(parts) > 1:
-                for p in parts:
-                    if p != filepath and os.path.exists(p):
-                        try:
-                            os.remove(p)
-                        except OSError:
-                            pass
+    dashboard_thread = threading.Thread(target=dashboard, name="ingest-dashboard", daemon=True)
+    dashboard_thread.start()
 
-    print(f"\nDone: {success} uploaded, {failed} failed, {total - success - failed} other")
+    interrupted = False
+    try:
+        for f in pending:
+            if controller:
+                controller.acquire()
+            engine.submit(f)
+        engine.shutdown()
+    except KeyboardInterrupt:
+        interrupted = True
+        _emit("\nInterrupted — finishing files already in flight (run with --resume to continue)...")
+        engine.shutdown(cancel_pending=True)
+    finally:
+        stop_dashboard.set()
+        dashboard_thread.join()
+        if controller:
+            controller.close()
+        writer.close()
+
+    print(stats.line())
+    print(f"\nDone: {engine.success} uploaded, {engine.failed} failed, "
+          f"{total - engine.success - engine.failed} other")
+    if interrupted:
+        return
 
     # Mark session complete if no pending remain
     remaining = get_pending_files(conn, session_id)
@@ -827,6 +1944,19 @@ def execute_upload(
 # ---------------------------------------------------------------------------
 
 
+def engine_options(args: argparse.Namespace) -> dict:
+    """Upload engine tuning from the command line."""
+    return {
+        "upload_workers": max(1, args.upload_workers),
+        "register_workers": max(1, args.register_workers),
+        "register_batch": min(max(1, args.register_batch), REGISTER_BATCH_MAX),
+        "multipart_chunk_mb": max(5, args.multipart_chunk_mb),  # S3 minimum part size
+        "multipart_concurrency": max(1, args.multipart_concurrency),
+        "dashboard_interval": max(1, args.dashboard_interval),
+        "target_queue": args.target_queue,
+    }
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Mineral Watch Bulk Document Ingestion",
@@ -853,9 +1983,29 @@ Examples:
     parser.add_argument("--resume", action="store_true", help="Resume interrupted upload")
     parser.add_argument("--status", action="store_true", help="Show session progress")
     parser.add_argument("--filter-county", help="Only process one county folder")
-    parser.add_argument("--max-queue", type=int, default=200, help="Pause if queue exceeds this depth")
+    parser.add_argument("--max-queue", type=int, default=200,
+                        help="Pause uploads while the processing queue is this deep (0 = no pacing)")
+    parser.add_argument("--target-queue", type=int,
+                        help="Queue depth uploads are paced to hold (default 75%% of --max-queue)")
     parser.add_argument("--split-threshold", type=int, default=100, help="PDF split threshold in MB")
     parser.add_argument("--verbose", action="store_true", help="Per-file detail output")
+    parser.add_argument("--scan-workers", type=int, default=SCAN_WORKERS, help="Folders listed concurrently")
+    parser.add_argument("--full-scan", action="store_true",
+                        help="List every folder instead of reusing unchanged ones from the last scan")
+    parser.add_argument("--refresh-cache", action="store_true",
+                        help="Re-request server parse/match results instead of using the local cache")
+    parser.add_argument("--hash-workers", type=int, default=HASH_WORKERS, help="Files hashed concurrently during scan")
+    parser.add_argument("--upload-workers", type=int, default=UPLOAD_WORKERS, help="Files uploading to R2 at once")
+    parser.add_argument("--register-workers", type=int, default=REGISTER_WORKERS,
+                        help="Concurrent registration calls")
+    parser.add_argument("--register-batch", type=int, default=REGISTER_BATCH,
+                        help=f"Documents per registration call (1 = one call each, max {REGISTER_BATCH_MAX})")
+    parser.add_argument("--multipart-chunk-mb", type=int, default=MULTIPART_CHUNK_MB,
+                        help="Multipart part size (and threshold) in MB")
+    parser.add_argument("--multipart-concurrency", type=int, default=MULTIPART_CONCURRENCY,
+                        help="Parts in flight per file")
+    parser.add_argument("--dashboard-interval", type=int, default=DASHBOARD_INTERVAL,
+                        help="Seconds between throughput lines")
 
     args = parser.parse_args()
 
@@ -876,6 +2026,7 @@ Examples:
         execute_upload(
             conn, session["id"], session["user_id"], session.get("org_id"),
             args.max_queue, args.split_threshold, args.verbose,
+            **engine_options(args),
         )
         conn.close()
         return
@@ -891,10 +2042,13 @@ Examples:
 
     # Phase 1: Scan folders (just collects paths + folder names)
     print(f"\nScanning {args.root_path}...")
-    files = scan_folder(args.root_path, args.filter_county)
+    files = scan_folder(
+        args.root_path, args.user_id, args.org_id, args.filter_county, max(1, args.hash_workers),
+        max(1, args.scan_workers), args.full_scan, not args.refresh_cache,
+    )
 
     if not files:
-        print("No PDF files found.")
+        print("No new or modified PDF files found.")
         return
 
     print(f"Found {len(files)} PDFs")
@@ -903,7 +2057,7 @@ Examples:
     if not any(f.get("county") for f in files):
         # Only parse if not already done (filter_county triggers early parse)
         print("Parsing filenames (server-side)...")
-        parsed = parse_filenames(files)
+        parsed = parse_filenames(files, not args.refresh_cache)
         apply_parsed(files, parsed)
 
     # Count files needing split
@@ -913,12 +2067,14 @@ Examples:
     print("Checking for duplicates...")
     dupes = check_duplicates(files, args.user_id, args.org_id)
     if dupes:
-        print(f"  {len(dupes)} duplicates found")
+        local_dupes = sum(1 for d in dupes.values() if d["matchType"] == "local")
+        print(f"  {len(dupes)} duplicates found ({local_dupes} copies within the tree, "
+              f"{len(dupes) - local_dupes} already uploaded)")
 
     # Phase 4: Match entities
-    non_dupe_files = [f for f in files if f["filename"] not in dupes]
+    non_dupe_files = [f for i, f in enumerate(files) if i not in dupes]
     print(f"Matching {len(non_dupe_files)} files to properties and wells...")
-    matches = match_entities(files, args.user_id, args.org_id)
+    matches = match_entities(files, args.user_id, args.org_id, not args.refresh_cache)
 
     if not args.execute:
         # Dry run — print report
@@ -936,6 +2092,7 @@ Examples:
     execute_upload(
         conn, session_id, args.user_id, args.org_id,
         args.max_queue, args.split_threshold, args.verbose,
+        **engine_options(args),
     )
     conn.close()
 
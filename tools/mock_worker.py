@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the documents-worker ingestion API.
+
+Implements the routes ingest.py calls (ingest-versions, ingest-parse,
+ingest-dedup, ingest-match, register-external, register-external-batch,
+queue-status) over an in-memory documents table, so registration batching,
+per-item failures, resume and the parse/match cache can be exercised without
+D1. It does not check R2: every r2Key is treated as uploaded unless
+--missing-rate rejects it.
+
+Usage:
+    python mock_worker.py --port 8788 [--latency-ms 80] [--fail-rate 0.05] [--no-batch] [--version 2]
+
+    # then, with upload_to_r2 pointed somewhere harmless
+    DOCUMENTS_WORKER_URL=http://localhost:8788 PROCESSING_API_KEY=dev python ingest.py ... --execute
+
+GET /stats reports calls per route, documents registered and any r2Key
+registered twice.
+"""
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+BATCH_MAX = 50  # same limit as the real route
+
+
+class MockDocuments:
+    """In-memory documents table with the ingestion routes' semantics."""
+
+    def __init__(self, latency: float = 0.0, fail_rate: float = 0.0, missing_rate: float = 0.0,
+                 batch_route: bool = True, version: str = "1"):
+        self.latency = latency
+        self.fail_rate = fail_rate
+        self.missing_rate = missing_rate
+        self.batch_route = batch_route
+        self.version = version
+        self.docs: dict[str, dict] = {}
+        self.by_r2_key: dict[str, str] = {}
+        self.calls = Counter()
+        self.double_registrations: list[str] = []
+        self.lock = threading.Lock()
+        self._seq = 0
+
+    def _insert(self, user_id: str, org_id: str | None, item: dict) -> dict:
+        """Register one item; returns a per-item result (caller holds the lock)."""
+        r2_key = item.get("r2Key")
+        if not r2_key or not item.get("filename"):
+            return {"success": False, "error": "r2Key and filename are required"}
+        if random.random() < self.missing_rate:
+            return {"success": False, "error": "File not found in R2 storage"}
+        if random.random() < self.fail_rate:
+            return {"success": False, "error": "Registration failed"}
+        self._seq += 1
+        doc = {
+            "id": f"doc_mock{self._seq:06d}",
+            "r2_key": r2_key,
+            "original_filename": item["filename"],
+            "file_size": item.get("fileSize") or 0,
+            "content_sha256": item.get("contentSha256"),
+            "user_id": user_id,
+            "organization_id": org_id,
+            "metadata": item.get("metadata") or {},
+            "status": "pending",
+        }
+        self.docs[doc["id"]] = doc
+        self.by_r2_key[r2_key] = doc["id"]
+        return {"success": True, "document": {"id": doc["id"], "r2Key": r2_key, "filename": item["filename"],
+                                              "size": doc["file_size"], "status": "pending"}}
+
+    def register(self, body: dict) -> tuple[int, dict]:
+        with self.lock:
+            if body.get("r2Key") in self.by_r2_key:
+                # The real single route has no idempotency check either
+                self.double_registrations.append(body["r2Key"])
+            result = self._insert(body.get("userId"), body.get("organizationId"), body)
+        if not result["success"]:
+            return (404 if "R2" in result["error"] else 500), {"error": result["error"]}
+        return 200, {"success": True, "document": result["document"]}
+
+    def register_batch(self, body: dict) -> tuple[int, dict]:
+        if not self.batch_route:
+            return 404, {"error": "Not found"}
+        items = body.get("items") or []
+        if not body.get("userId") or not items:
+            return 400, {"error": "userId and items[] required"}
+        if len(items) > BATCH_MAX:
+            return 400, {"error": f"At most {BATCH_MAX} items per batch"}
+        results = []
+        with self.lock:
+            for index, item in enumerate(items):
+                existing = self.by_r2_key.get(item.get("r2Key"))
+                if existing:
+                    doc = self.docs[existing]
+                    results.append({"index": index, "success": True, "existing": True,
+                                    "document": {"id": doc["id"], "r2Key": doc["r2_key"]}})
+                    continue
+                results.append({"index": index, **self._insert(body["userId"], body.get("organizationId"), item)})
+        return 200, {"success": True, "results": results}
+
+    def dedup(self, body: dict) -> tuple[int, dict]:
+        owners = {body.get("userId"), body.get("organizationId") or body.get("userId")}
+        with self.lock:
+            docs = [d for d in self.docs.values() if d["user_id"] in owners or d["organization_id"] in owners]
+        by_hash = {d["content_sha256"]: d for d in docs if d["content_sha256"]}
+        by_name = {(d["original_filename"], d["file_size"]): d for d in docs if not d["content_sha256"]}
+        duplicates = []
+        for f in body.get("files") or []:
+            if f.get("sha256") and f["sha256"] in by_hash:
+                duplicates.append({"sha256": f["sha256"], "matchType": "hash",
+                                   "existingDocId": by_hash[f["sha256"]]["id"]})
+            elif (f["filename"], f["fileSize"]) in by_name:
+                duplicates.append({"filename": f["filename"], "fileSize": f["fileSize"], "matchType": "name_size",
+                                   "existingDocId": by_name[(f["filename"], f["fileSize"])]["id"]})
+        return 200, {"duplicates": duplicates}
+
+    def stats(self) -> dict:
+        with self.lock:
+            return {
+                "calls": dict(self.calls),
+                "documents": len(self.docs),
+                "double_registrations": self.double_registrations,
+            }
+
+
+def make_handler(mock: MockDocuments):
+    class Handler(BaseHTTPRequestHandler):
+        def _reply(self, status: int, body: dict) -> None:
+            data = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self):
+            if self.path == "/stats":
+                return self._reply(200, mock.stats())
+            if self.path == "/api/documents/ingest-versions":
+                mock.calls["ingest-versions"] += 1
+                return self._reply(200, {"parser": mock.version, "matcher": mock.version})
+            if re.fullmatch(r"/api/processing/user/[^/]+/queue-status", self.path):
+                mock.calls["queue-status"] += 1
+                return self._reply(200, {"queued": 0, "processing": 0})
+            self._reply(404, {"error": "Not found"})
+
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers.get("Content-Length") or 0)) or b"{}")
+            route = self.path.rsplit("/", 1)[-1]
+            mock.calls[route] += 1
+            time.sleep(mock.latency)
+            if route == "ingest-parse":
+                # County = top-level folder name; no TRS/API/well parsing
+                parsed = [{"county": (item.get("folders") or [None])[-1]} for item in body.get("items") or []]
+                return self._reply(200, {"parsed": parsed, "version": mock.version})
+            if route == "ingest-dedup":
+                return self._reply(*mock.dedup(body))
+            if route == "ingest-match":
+                return self._reply(200, {"matches": [{"index": i, "matchType": "none"}
+                                                     for i in range(len(body.get("items") or []))],
+                                         "version": mock.version})
+            if route == "register-external":
+                return self._reply(*mock.register(body))
+            if route == "register-external-batch":
+                return self._reply(*mock.register_batch(body))
+            self._reply(404, {"error": "Not found"})
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for the documents-worker ingestion API")
+    parser.add_argument("--port", type=int, default=8788)
+    parser.add_argument("--latency-ms", type=float, default=0, help="Added to every POST")
+    parser.add_argument("--fail-rate", type=float, default=0, help="Fraction of registrations that fail")
+    parser.add_argument("--missing-rate", type=float, default=0, help="Fraction of r2Keys reported missing")
+    parser.add_argument("--no-batch", action="store_true", help="404 on register-external-batch (older worker)")
+    parser.add_argument("--version", default="1", help="Parser/matcher version reported to the CLI")
+    args = parser.parse_args()
+
+    mock = MockDocuments(args.latency_ms / 1000, args.fail_rate, args.missing_rate, not args.no_batch, args.version)
+    server = ThreadingHTTPServer(("127.0.0.1", args.port), make_handler(mock))
+    print(f"Mock documents-worker on http://127.0.0.1:{args.port} (GET /stats)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    print(json.dumps(mock.stats(), indent=2))
+
+
+if __name__ == "__main__":
+    main()